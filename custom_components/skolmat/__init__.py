@@ -3,76 +3,46 @@
 from __future__ import annotations
 
 import logging
-import importlib
-import sys
 from hashlib import sha1
 from typing import Any
-from pathlib import Path
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.const import Platform
-
-from .const import DOMAIN, CONF_URL, CONF_PROCESSOR_FILE, CONF_PROCESSOR_FN
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.event import async_track_time_change, async_track_time_interval
+
+from .const import (
+    DOMAIN,
+    CONF_URL,
+    CONF_PROCESSOR_FILE,
+    CONF_PROCESSOR_FN,
+    CONF_WEEKS,
+    DEFAULT_WEEKS,
+    MENU_REFRESH_INTERVAL,
+    SIGNAL_MENU_UPDATED,
+)
 from .menu import Menu
+from .processorloader import async_load_processor
+from . import services, websocket_api
 
 _LOGGER = logging.getLogger(__name__)
 
 PLATFORMS = [Platform.SENSOR, Platform.CALENDAR]
 
-async def _load_processor(
-    hass: HomeAssistant,
-    processor_file: str | None,
-    processor_fn: str | None,
-):
-    if not processor_file and not processor_fn:
-        return None
-    if not processor_file or not processor_fn:
-        _LOGGER.warning("Processor config incomplete; skipping processor load.")
-        return None
-
-    filename = processor_file.strip()
-    if not filename:
-        _LOGGER.warning("Processor file name empty; skipping processor load.")
-        return None
-    if not filename.endswith(".py"):
-        filename = f"{filename}.py"
-
-    processor_path = Path(__file__).resolve().parent / "processors" / filename
-    if not processor_path.exists():
-        _LOGGER.warning("Processor file not found: %s", processor_path)
-        return None
-
-    module_name = f"custom_components.skolmat.processors.{processor_path.stem}"
-
-    def _import_with_alias(name: str):
-        try:
-            menu_module = importlib.import_module("custom_components.skolmat.menu")
-            sys.modules.setdefault("menu", menu_module)
-        except Exception:
-            pass
-        return importlib.import_module(name)
-
-    try:
-        module = await hass.async_add_executor_job(_import_with_alias, module_name)
-    except Exception as exc:
-        _LOGGER.warning("Processor import failed: module=%s error=%s", module_name, exc)
-        return None
-
-    processor = getattr(module, processor_fn.strip(), None)
-    if not callable(processor):
-        _LOGGER.warning("Processor function missing/not callable: %s.%s", module_name, processor_fn)
-        return None
-
-    return processor
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
 
 
-async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
-    hass.data.setdefault(DOMAIN, {})
+async def async_setup(hass: HomeAssistant, config: dict) -> bool:
+    websocket_api.async_setup(hass)
+    services.async_setup(hass)
+    return True
 
-    url: str = entry.data[CONF_URL].rstrip(" /")
-    url_hash = sha1(url.encode("utf-8")).hexdigest()
 
+def entry_config(entry: ConfigEntry) -> dict[str, Any]:
+    """Entry data with non-empty options applied on top."""
     config = dict(entry.data)
     for key, value in entry.options.items():
         if value is None:
@@ -80,19 +50,37 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         if isinstance(value, str) and value == "":
             continue
         config[key] = value
-    processor_cb = await _load_processor(
+    return config
+
+
+async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+    hass.data.setdefault(DOMAIN, {})
+
+    url: str = entry.data[CONF_URL].rstrip(" /")
+    url_hash = sha1(url.encode("utf-8")).hexdigest()
+
+    config = entry_config(entry)
+    processor_cb, processor_error = await async_load_processor(
         hass,
         config.get(CONF_PROCESSOR_FILE),
         config.get(CONF_PROCESSOR_FN),
     )
+    if processor_error:
+        _LOGGER.warning(
+            "Processor not loaded (%s): %s.%s",
+            processor_error,
+            config.get(CONF_PROCESSOR_FILE),
+            config.get(CONF_PROCESSOR_FN),
+        )
     if processor_cb:
         _LOGGER.info(
             "Processor active: %s.%s",
             config.get(CONF_PROCESSOR_FILE),
             config.get(CONF_PROCESSOR_FN),
         )
-    menu = Menu.createMenu(hass.async_add_executor_job, url, customMenuEntryProcessorCB=processor_cb)
+    menu = await Menu.asyncCreateMenu(hass.async_add_executor_job, url, customMenuEntryProcessorCB=processor_cb)
     menu.setSummaryFilters(config)
+    menu.setWeeks(config.get(CONF_WEEKS, DEFAULT_WEEKS))
 
     hass.data[DOMAIN][entry.entry_id] = {
         "menu": menu,
@@ -100,9 +88,31 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     }
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    _async_setup_refresh(hass, entry, menu)
     return True
 
 
+def _async_setup_refresh(hass: HomeAssistant, entry: ConfigEntry, menu: Menu) -> None:
+    """Refresh the menu on an interval and signal the entities only when something changed."""
+    signal = SIGNAL_MENU_UPDATED.format(entry.entry_id)
+    last = {"version": menu.version, "available": True}
+
+    async def _async_refresh(now=None) -> None:
+        menu_data = await menu.getMenu(async_get_clientsession(hass))
+        state = {"version": menu.version, "available": menu_data is not None}
+        if state != last:
+            last.update(state)
+            async_dispatcher_send(hass, signal)
+
+    @callback
+    def _async_midnight(now) -> None:
+        # "today" changed, entities recompute their state and events
+        async_dispatcher_send(hass, signal)
+
+    entry.async_on_unload(async_track_time_interval(hass, _async_refresh, MENU_REFRESH_INTERVAL))
+    entry.async_on_unload(async_track_time_change(hass, _async_midnight, hour=0, minute=0, second=0))
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
 
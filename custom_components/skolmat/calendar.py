@@ -2,15 +2,18 @@
 
 from __future__ import annotations
 
+from bisect import bisect_left, bisect_right
 from datetime import datetime, timedelta, date
 import logging
-from typing import Any
+from typing import NamedTuple
 
 from homeassistant.components.calendar import CalendarEntity, CalendarEvent
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.helpers.event import async_track_point_in_time
 from homeassistant.helpers.storage import Store
 from homeassistant.util import dt as dt_util
 from homeassistant.util import slugify
@@ -22,8 +25,14 @@ from .const import (
     CONF_PROVIDER,
     CONF_LUNCH_BEGIN,
     CONF_LUNCH_END,
+    CONF_PROCESSOR_FILE,
+    CONF_PROCESSOR_FN,
+    CONF_ARCHIVE_YEARS,
     CALENDAR_HISTORY_DAYS,
+    ARCHIVE_CACHE_MONTHS,
+    SIGNAL_MENU_UPDATED,
 )
+from .history import DayTexts, MenuArchive, SourceHistory, load_entry_history, source_key
 from .menu import Menu
 
 _LOGGER = logging.getLogger(__name__)
@@ -47,9 +56,17 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, add_entitie
     )
 
 
+class _DayEvent(NamedTuple):
+    key: tuple
+    event: CalendarEvent
+    start: datetime  # normalized local start/end
+    end: datetime
+
+
 class SkolmatCalendarEntity(CalendarEntity):
 
     _attr_icon = "mdi:calendar"
+    _attr_should_poll = False
 
     def __init__(self, hass, entry, menu:Menu, url_hash):
         self.hass = hass
@@ -66,12 +83,32 @@ class SkolmatCalendarEntity(CalendarEntity):
         self._lunch_begin = self._parse_time(entry.data.get(CONF_LUNCH_BEGIN))
         self._lunch_end = self._parse_time(entry.data.get(CONF_LUNCH_END))
 
-        self._events = []
+        self._events: list[_DayEvent] = []
         self._current_or_next = None
-
+        self._menu_events: dict[str, _DayEvent] = {}
+        self._history_events: list[_DayEvent] = []
+        # (date, summary, description, lunch window) -> event, reused while the day's content is unchanged
+        self._event_cache: dict[tuple, _DayEvent] = {}
+        # sorted local bounds of self._events, events never overlap so both lists are ordered
+        self._starts: list[datetime] = []
+        self._ends: list[datetime] = []
+        self._unsub_boundary = None
+        self._track_boundaries = False
+        self._menu_version: int | None = None
+        self._filter_version: int | None = None
+        self._events_date: date | None = None
+
+        # per entry: filtered summaries; full menus are kept once per source, shared with
+        # other entries on the same url (and processor)
         self._store = Store(hass, 1, f"{DOMAIN}_{entry.entry_id}_calendar")
-        self._history: dict[str, dict[str, str]] = {}
+        self._history = DayTexts()
         self._history_dirty = False
+        # acquired with the history load once added to hass, updates before that leave history alone
+        self._source: SourceHistory | None = None
+        self._source_key = source_key(url_hash, entry.data.get(CONF_PROCESSOR_FILE), entry.data.get(CONF_PROCESSOR_FN))
+        # days leaving the history move to the archive, if enabled
+        self._archive_years = entry.data.get(CONF_ARCHIVE_YEARS) or 0
+        self._archive = MenuArchive(hass, entry.entry_id, ARCHIVE_CACHE_MONTHS) if self._archive_years else None
 
     @staticmethod
     def _parse_time(v):
@@ -100,38 +137,74 @@ class SkolmatCalendarEntity(CalendarEntity):
     async def async_added_to_hass(self):
         await super().async_added_to_hass()
         await self._async_load_history()
-
-    async def _async_load_history(self):
-        data = await self._store.async_load()
-        if not data:
-            self._history = {}
+        # the update before add built the events without history, rebuild them all
+        self._events_date = None
+        self.async_schedule_update_ha_state(True)
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass, SIGNAL_MENU_UPDATED.format(self._entry.entry_id), self._async_menu_updated
+            )
+        )
+        self._track_boundaries = True
+        self._schedule_next_boundary()
+
+    @callback
+    def _async_menu_updated(self) -> None:
+        self.async_schedule_update_ha_state(True)
+
+    async def async_will_remove_from_hass(self):
+        self._track_boundaries = False
+        if self._unsub_boundary:
+            self._unsub_boundary()
+            self._unsub_boundary = None
+        if self._source is not None:
+            self._source.release(self.hass)
+            self._source = None
+        await super().async_will_remove_from_hass()
+
+    def _schedule_next_boundary(self):
+        """Wake up at the next event start/end or local midnight, whichever comes first."""
+        if self._unsub_boundary:
+            self._unsub_boundary()
+            self._unsub_boundary = None
+        if not self._track_boundaries:
             return
 
-        hist: dict[str, dict[str, str]] = {}
-        for item in data.get("events", []):
-            date_str = item.get("date")
-            if not date_str:
-                continue
-            hist[date_str] = {
-                "summary": item.get("summary") or item.get("course") or "",
-                "menu": item.get("menu") or item.get("description") or "",
-            }
+        now = dt_util.now()
+        boundary = dt_util.start_of_local_day((now + timedelta(days=1)).date())
+        i = bisect_right(self._ends, now)
+        if i < len(self._events):
+            upcoming = self._starts[i] if self._starts[i] > now else self._ends[i]
+            boundary = min(boundary, upcoming)
+
+        self._unsub_boundary = async_track_point_in_time(self.hass, self._async_boundary_reached, boundary)
+
+    @callback
+    def _async_boundary_reached(self, now: datetime) -> None:
+        self._unsub_boundary = None
+        self._current_or_next = self._find_current_or_next()
+        self.async_write_ha_state()
+        self._schedule_next_boundary()
 
-        self._history = hist
+    async def _async_load_history(self):
+        # older formats also held full menus, those move to the source history on the next save
+        self._history, menus, legacy = load_entry_history(await self._store.async_load())
+        source = SourceHistory.acquire(self.hass, self._source_key)
+        try:
+            await source.async_load()
+        except BaseException:
+            source.release(self.hass)
+            raise
+        source.adopt(menus)
+        self._source = source
+        self._history_dirty = legacy
 
     async def _async_save_history(self):
+        await self._source.async_save()
         if not self._history_dirty:
             return
 
-        events = [
-            {
-                "date": d,
-                "course": info.get("summary", ""),
-                "menu": info.get("menu", ""),
-            }
-            for d, info in sorted(self._history.items())
-        ]
-        await self._store.async_save({"events": events})
+        await self._store.async_save(self._history.as_store())
         self._history_dirty = False
 
     async def async_update(self):
@@ -140,135 +213,175 @@ class SkolmatCalendarEntity(CalendarEntity):
         if menu_data is None:
             self._attr_available = False
             self._events = []
+            self._starts = []
+            self._ends = []
             self._current_or_next = None
+            self._menu_version = None
+            self._schedule_next_boundary()
             return
         self._attr_available = True
 
         today = dt_util.now().date()
         today_str = today.isoformat()
 
-        # Add today's menu to history if needed
-        summary = self._menu.getReadableDaySummary(today)
-        menu_text = self._menu.getReadableDayMenu(today)
-        if self._history.get(today_str) != {"summary": summary, "menu": menu_text}:
-            self._history[today_str] = {"summary": summary, "menu": menu_text}
-            self._history_dirty = True
-
-        # Prune history older than N days
-        cutoff = today - timedelta(days=CALENDAR_HISTORY_DAYS)
-        to_remove = [d for d in self._history if date.fromisoformat(d) < cutoff]
-        for d in to_remove:
-            self._history.pop(d, None)
-            self._history_dirty = True
-
-        await self._async_save_history()
-
-        # Build event list
-        events = []
-
-        # Past events come from history to avoid rewriting summaries.
-        # Today's event is built from menu data below unless missing.
-        menu_dates: set[date] = set()
-        for d, info in self._history.items():
-            day_date = date.fromisoformat(d)
-            if day_date < today:
-                description = info.get("menu") or self._menu.getReadableDayMenu(day_date)
-                events.append(
-                    self._build_event(
-                        day=day_date,
-                        summary=info.get("summary", ""),
-                        description=description,
+        # Reprocess only dates changed since the last update, everything on a new day or new filters.
+        changes = self._menu.getChangesSince(self._menu_version)
+        full_rebuild = (
+            changes is None
+            or self._events_date != today
+            or self._filter_version != self._menu.filterVersion
+        )
+        if full_rebuild:
+            touched = set(menu_data)
+        else:
+            touched = changes["added"] | changes["changed"] | changes["removed"]
+
+        if not full_rebuild and not touched:
+            self._current_or_next = self._find_current_or_next()
+            return
+
+        menu_text = ""
+        # history is loaded once added to hass, the update before add builds menu events only
+        history_loaded = self._source is not None
+        if history_loaded and (full_rebuild or today_str in touched):
+            # Add today's menu to history if needed
+            summary = self._menu.getReadableDaySummary(today)
+            menu_text = self._menu.getReadableDayMenu(today)
+            if self._history.set(today_str, summary):
+                self._history_dirty = True
+            self._source.set(today_str, menu_text)
+
+        if history_loaded and self._events_date != today:
+            # Prune history older than N days
+            cutoff = (today - timedelta(days=CALENDAR_HISTORY_DAYS)).isoformat()
+            if self._archive:
+                leaving = [(d, summary, self._source.menus.get(d) or "") for d, summary in self._history.items() if d < cutoff]
+                if leaving:
+                    await self._archive.async_add(leaving)
+                await self._archive.async_prune((today - timedelta(days=365 * self._archive_years)).isoformat())
+            if self._history.prune(cutoff):
+                self._history_dirty = True
+            # kept a week longer, other entries on the source may still archive their leaving days
+            self._source.prune((today - timedelta(days=CALENDAR_HISTORY_DAYS + 7)).isoformat())
+
+        if history_loaded:
+            await self._async_save_history()
+
+        if full_rebuild:
+            # Past events come from history to avoid rewriting summaries.
+            # Today's event is built from menu data below unless missing.
+            self._history_events = []
+            for d, summary in self._history.items():
+                day_date = date.fromisoformat(d)
+                if day_date < today:
+                    description = self._source.menus.get(d) or self._menu.getReadableDayMenu(day_date)
+                    self._history_events.append(
+                        self._build_event(
+                            day=day_date,
+                            summary=summary,
+                            description=description,
+                        )
                     )
-                )
+            self._menu_events = {}
 
-        # Present + future events (today included)
-        for iso in menu_data:
+        # Present + future events (today included), summarized in one filter pass
+        for iso in touched:
+            self._menu_events.pop(iso, None)
+        summaries = self._menu.getReadableDaySummaries(
+            [date.fromisoformat(iso) for iso in touched if iso in menu_data and iso >= today_str]
+        )
+        for iso, summary in summaries.items():
             day_date = date.fromisoformat(iso)
-            menu_dates.add(day_date)
-            if day_date < today:
-                continue
-            events.append(
-                self._build_event(
-                    day=day_date,
-                    summary=self._menu.getReadableDaySummary(day_date),
-                    description=self._menu.getReadableDayMenu(day_date),
-                )
+            self._menu_events[iso] = self._build_event(
+                day=day_date,
+                summary=summary,
+                description=self._menu.getReadableDayMenu(day_date),
             )
 
-        if today not in menu_dates and today_str in self._history:
-            info = self._history[today_str]
-            description = info.get("menu") or menu_text
+        events = [*self._history_events, *self._menu_events.values()]
+
+        if today_str not in menu_data and today_str in self._history:
             events.append(
                 self._build_event(
                     day=today,
-                    summary=info.get("summary", ""),
-                    description=description,
+                    summary=self._history.get(today_str),
+                    description=self._source.menus.get(today_str) or menu_text,
                 )
             )
 
-        events.sort(key=lambda e: self._normalize(e.start))
+        events.sort(key=lambda e: e.start)
 
         self._events = events
-        self._current_or_next = self._find_current_or_next(events)
-
-    def _build_event(self, day: date, summary: str, description: str) -> CalendarEvent:
-
+        self._starts = [e.start for e in events]
+        self._ends = [e.end for e in events]
+        self._event_cache = {e.key: e for e in events}
+        self._menu_version = self._menu.version
+        self._filter_version = self._menu.filterVersion
+        self._events_date = today
+        self._current_or_next = self._find_current_or_next()
+        self._schedule_next_boundary()
+
+    def _build_event(self, day: date, summary: str, description: str) -> _DayEvent:
+
+        summary = summary or ""
+        description = description or ""
+        key = (day, summary, description, self._lunch_begin, self._lunch_end)
+        if cached := self._event_cache.get(key):
+            return cached
+
+        day_start = dt_util.start_of_local_day(day)
         if not (self._lunch_begin and self._lunch_end):
             # ALL-DAY event → use date objects
             start = day
             end = day + timedelta(days=1)
+            local_start = day_start
+            local_end = dt_util.start_of_local_day(end)
         else:
             # TIMED event → use datetime objects
-            start = dt_util.start_of_local_day(day).replace(
+            start = local_start = day_start.replace(
                 hour=self._lunch_begin.hour,
                 minute=self._lunch_begin.minute,
             )
-            end = dt_util.start_of_local_day(day).replace(
+            end = local_end = day_start.replace(
                 hour=self._lunch_end.hour,
                 minute=self._lunch_end.minute,
             )
 
-        return CalendarEvent(
-            summary=summary or "",
-            description=description or "",
+        event = CalendarEvent(
+            summary=summary,
+            description=description,
             start=start,
             end=end,
         )
+        return _DayEvent(key, event, local_start, local_end)
 
-    @staticmethod
-    def _normalize(value: Any) -> datetime:
-        if isinstance(value, datetime):
-            return dt_util.as_local(value)
-        if isinstance(value, date):
-            return dt_util.start_of_local_day(value)
-        return dt_util.now()
-
-    def _find_current_or_next(self, events):
-        now = dt_util.now()
-        for e in events:
-            start = self._normalize(e.start)
-            end = self._normalize(e.end)
-            if start <= now < end:
-                return e
-            if start > now:
-                return e
-        return None
+    def _find_current_or_next(self) -> CalendarEvent | None:
+        # first event that has not ended yet, either ongoing or the next one
+        i = bisect_right(self._ends, dt_util.now())
+        return self._events[i].event if i < len(self._events) else None
 
     async def async_get_events(self, hass, start_date, end_date):
-        await self.async_update()
+        # events are kept current by menu update signals, no refresh here
         if not self.available:
             return []
-        result = []
-
-        for e in self._events:
-            s = self._normalize(e.start)
-            t = self._normalize(e.end)
-
-            if t <= start_date:
-                continue
-            if s >= end_date:
-                continue
-
-            result.append(e)
-
-        return result
+        # events ending after start_date and starting before end_date
+        first = bisect_right(self._ends, start_date)
+        last = bisect_left(self._starts, end_date)
+        events = [e.event for e in self._events[first:last]]
+
+        cutoff = dt_util.now().date() - timedelta(days=CALENDAR_HISTORY_DAYS)
+        if self._archive and start_date.date() < cutoff:
+            # only ranges reaching past the history load archive months
+            archived = await self._archive.async_get_range(
+                (start_date.date() - timedelta(days=1)).isoformat(),
+                min(end_date.date() + timedelta(days=1), cutoff).isoformat(),
+            )
+            older = []
+            for d, summary, menu in archived:
+                if d in self._history:
+                    continue
+                day_event = self._build_event(date.fromisoformat(d), summary, menu)
+                if day_event.end > start_date and day_event.start < end_date:
+                    older.append(day_event.event)
+            events = older + events
+        return events
@@ -3,11 +3,9 @@
 from __future__ import annotations
 
 from datetime import date, datetime
+import json
 import logging
-import importlib
 import re
-import sys
-from pathlib import Path
 from typing import Any
 
 import voluptuous as vol
@@ -16,6 +14,7 @@ from homeassistant import config_entries
 from homeassistant.core import callback
 from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.helpers.selector import (
     SelectSelector,
     SelectSelectorConfig,
@@ -38,8 +37,20 @@ from .const import (
     CONF_MAX_ENTRIES,
     CONF_PROCESSOR_FILE,
     CONF_PROCESSOR_FN,
+    CONF_WEEKS,
+    DEFAULT_WEEKS,
+    MAX_WEEKS,
+    CONF_ARCHIVE_YEARS,
+    DEFAULT_ARCHIVE_YEARS,
+    MAX_ARCHIVE_YEARS,
+    REGEX_TIME_BUDGET,
+    REGEX_PROBE_TIMEOUT,
+    SIGNAL_MENU_UPDATED,
 )
+from .dayfilter import DayFilter, async_benchmark_pattern, compile_pattern, has_nested_quantifier
 from .menu import Menu, MenuEntry
+from .processorloader import async_load_processor
+from . import entry_config
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -47,6 +58,10 @@ _SELECTED_DATE = "selected_date"
 _DONE_CONFIGURING = "done_configuring"
 _DISPLAY_INPUT = "display_input"
 _DISPLAY_SUMMARY = "display_summary"
+_DISPLAY_PREVIEW = "display_preview"
+
+# options that only change summaries; they are applied to the running entry without a reload
+_FILTER_KEYS = (CONF_MEALS_SELECTED, CONF_EXCLUDE_REGEX, CONF_PREFER_REGEX, CONF_MAX_ENTRIES)
 _RELOAD_PROCESSOR = "reload_processor"
 _EXCLUDE_LABEL = "exclude_label"
 _PREFER_LABEL = "prefer_label"
@@ -81,10 +96,18 @@ class _SkolmatFlowMixin:
         self._input_data = ""
         self._summary = ""
         self._summary_count = ""
+        self._preview_table = ""
         self._warning = ""
+        # compiled DayFilters keyed by filter configuration, reused across steps and dates
+        self._filter_cache: dict[str, DayFilter] = {}
         self._exclude_keywords = self._format_regex_defaults(self._data.get(CONF_EXCLUDE_REGEX, []))
         self._prefer_keywords = self._format_regex_defaults(self._data.get(CONF_PREFER_REGEX, []))
         self._processor_error: str | None = None
+        # pattern -> error key or None if accepted, kept for the flow so each pattern is probed once.
+        # The entry's saved patterns were accepted when they were saved.
+        self._pattern_verdicts: dict[str, str | None] = dict.fromkeys(
+            [*self._data.get(CONF_EXCLUDE_REGEX, []), *self._data.get(CONF_PREFER_REGEX, [])]
+        )
 
     def _parse_regex_list(self, value: Any) -> list[str]:
         if value is None:
@@ -133,19 +156,62 @@ class _SkolmatFlowMixin:
             return None
         return None if parsed <= 0 else parsed
 
-    async def _run_discovery(self) -> bool:
-        url = self._data[CONF_URL]
-        processor_cb, self._processor_error = await self._load_processor(
-            self._data.get(CONF_PROCESSOR_FILE),
-            self._data.get(CONF_PROCESSOR_FN),
-            force_reload=True,
-        )
+    async def _validate_patterns(self) -> str | None:
+        # reject patterns that are invalid, structurally prone to backtracking or too slow on this menu
+        patterns = [*self._data.get(CONF_EXCLUDE_REGEX, []), *self._data.get(CONF_PREFER_REGEX, [])]
+        entries = [e for day in self._menu._menu.values() for e in day] if self._menu else []
+        for pattern in patterns:
+            if pattern in self._pattern_verdicts:
+                verdict = self._pattern_verdicts[pattern]
+            else:
+                verdict = await self._check_pattern(pattern, entries)
+                # a pass without menu entries was never timed
+                if verdict or entries:
+                    self._pattern_verdicts[pattern] = verdict
+            if verdict:
+                return verdict
+        return None
 
-        self._menu = Menu.createMenu(
-            self.hass.async_add_executor_job,
-            url,
-            customMenuEntryProcessorCB=processor_cb,
-        )
+    async def _check_pattern(self, pattern: str, entries: list[MenuEntry]) -> str | None:
+        try:
+            compile_pattern(pattern)
+        except re.error as err:
+            _LOGGER.warning("Filter regex %r is invalid: %s", pattern, err)
+            return "invalid_regex"
+        if has_nested_quantifier(pattern):
+            _LOGGER.warning("Filter regex %r has nested repeats and may backtrack catastrophically", pattern)
+            return "unsafe_regex"
+        if not entries:
+            return None
+        # timed in a subprocess that is killed at the timeout, a runaway match cannot hold up the flow
+        elapsed = await async_benchmark_pattern(pattern, entries, REGEX_PROBE_TIMEOUT)
+        if elapsed is None or elapsed > REGEX_TIME_BUDGET:
+            _LOGGER.warning("Filter regex %r exceeds the %ss budget over %d menu entries", pattern, REGEX_TIME_BUDGET, len(entries))
+            return "slow_regex"
+        if elapsed > REGEX_TIME_BUDGET / 2:
+            _LOGGER.warning("Filter regex %r took %.3fs over %d menu entries, close to the %ss budget", pattern, elapsed, len(entries), REGEX_TIME_BUDGET)
+        return None
+
+    async def _run_discovery(self, live_menu: Menu | None = None) -> bool:
+        if live_menu is not None:
+            # Reuse the running entry's menu; getMenu only refetches if its cache is stale.
+            self._processor_error = None
+            self._menu = live_menu
+        else:
+            url = self._data[CONF_URL]
+            # Cached per file mtime; the module is only re-imported if the file changed.
+            processor_cb, self._processor_error = await async_load_processor(
+                self.hass,
+                self._data.get(CONF_PROCESSOR_FILE),
+                self._data.get(CONF_PROCESSOR_FN),
+            )
+
+            self._menu = await Menu.asyncCreateMenu(
+                self.hass.async_add_executor_job,
+                url,
+                customMenuEntryProcessorCB=processor_cb,
+            )
+            self._menu.setWeeks(self._data.get(CONF_WEEKS, DEFAULT_WEEKS))
         self._data[CONF_PROVIDER] = self._menu.provider
 
         session = async_get_clientsession(self.hass)
@@ -210,57 +276,6 @@ class _SkolmatFlowMixin:
         current = self._available_dates[self._date_index]
         return self._menu._menu.get(current.isoformat(), [])
 
-    async def _load_processor(
-        self,
-        processor_file: str | None,
-        processor_fn: str | None,
-        *,
-        force_reload: bool,
-    ) -> tuple[Any, str | None]:
-        if not processor_file and not processor_fn:
-            return None, None
-        if not processor_file or not processor_fn:
-            return None, "processor_missing_fields"
-
-        filename = processor_file.strip()
-        if not filename:
-            return None, "processor_missing_fields"
-        if not filename.endswith(".py"):
-            filename = f"{filename}.py"
-
-        processor_path = Path(__file__).resolve().parent / "processors" / filename
-        if not processor_path.exists():
-            return None, "processor_file_missing"
-
-        module_name = f"custom_components.skolmat.processors.{processor_path.stem}"
-        if force_reload and module_name in sys.modules:
-            sys.modules.pop(module_name, None)
-
-        def _import_with_alias(name: str):
-            try:
-                menu_module = importlib.import_module("custom_components.skolmat.menu")
-                sys.modules.setdefault("menu", menu_module)
-            except Exception:
-                pass
-            return importlib.import_module(name)
-
-        try:
-            module = await self.hass.async_add_executor_job(_import_with_alias, module_name)
-        except Exception as exc:
-            _LOGGER.info("Processor import failed: module=%s error=%s", module_name, exc)
-            return None, "processor_import_failed"
-
-        processor = getattr(module, processor_fn.strip(), None)
-        if not callable(processor):
-            _LOGGER.info(
-                "Processor function missing/not callable: module=%s fn=%s",
-                module_name,
-                processor_fn,
-            )
-            return None, "processor_fn_missing"
-
-        return processor, None
-
     def _all_meals_from_entries(self, entries: list[MenuEntry]) -> list[str]:
         seen = set()
         meals: list[str] = []
@@ -298,22 +313,47 @@ class _SkolmatFlowMixin:
 
         return "\n".join(lines).rstrip()
 
+    def _day_filter(self, entries: list[MenuEntry], selected: list[str]) -> DayFilter:
+        filters = self._current_filters()
+        filters[CONF_MEALS_SELECTED] = selected or self._all_meals_from_entries(entries)
+        key = json.dumps(filters, sort_keys=True, default=str)
+        day_filter = self._filter_cache.get(key)
+        if day_filter is None:
+            # Filter locally; the menu may be shared with the running entry's entities.
+            day_filter = self._filter_cache[key] = DayFilter(filters)
+        return day_filter
+
+    def _build_preview_table(self, selected: list[str]) -> str:
+        # one line per available date, so filters can be checked across the whole horizon
+        # dates sharing a compiled filter are filtered in one batch
+        batches: dict[int, tuple[DayFilter, dict[str, list[MenuEntry]]]] = {}
+        for d in self._available_dates:
+            entries = self._menu._menu.get(d.isoformat(), [])
+            day_filter = self._day_filter(entries, selected)
+            batches.setdefault(id(day_filter), (day_filter, {}))[1][d.isoformat()] = entries
+
+        filtered: dict[str, list[MenuEntry]] = {}
+        for day_filter, days in batches.values():
+            filtered.update(day_filter.filter_many(days)["days"])
+
+        lines: list[str] = []
+        for d in self._available_dates:
+            summary = self._menu._defaultReadableDaySummary(filtered[d.isoformat()]) or "(no summary)"
+            lines.append(f"{d.isoformat()} {d.strftime('%a')}: {summary}")
+        return "\n".join(lines)
+
     def _build_preview(self) -> None:
         entries = self._entries_for_current_date()
         self._input_data = self._format_input_data(entries)
+        selected = list(self._data.get(CONF_MEALS_SELECTED, []))
+        self._preview_table = self._build_preview_table(selected) if self._menu else ""
 
         if not entries or not self._menu:
             self._summary = ""
             self._summary_count = ""
             return
 
-        selected = list(self._data.get(CONF_MEALS_SELECTED, []))
-        preview_selected = selected or self._all_meals_from_entries(entries)
-
-        filters = self._current_filters()
-        filters[CONF_MEALS_SELECTED] = preview_selected
-        self._menu.setSummaryFilters(filters)
-        filtered = self._menu._dayFilter.filter(entries)
+        filtered = self._day_filter(entries, selected).filter(entries)
         self._summary = self._menu._defaultReadableDaySummary(filtered) or ""
 
         labels = {e.get("label") for e in filtered if e.get("label")}
@@ -386,6 +426,10 @@ class _SkolmatFlowMixin:
             _DISPLAY_SUMMARY,
             default=self._summary or "",
         )] = TextSelector(TextSelectorConfig(multiline=True))
+        fields[vol.Optional(
+            _DISPLAY_PREVIEW,
+            default=self._preview_table or "",
+        )] = TextSelector(TextSelectorConfig(multiline=True))
 
         fields[vol.Optional(
             CONF_MEALS_SELECTED,
@@ -431,11 +475,16 @@ class _SkolmatFlowMixin:
             CONF_PROCESSOR_FN,
             description={"suggested_value": self._data.get(CONF_PROCESSOR_FN) or ""},
         )] = str
+        fields.update(self._schema_entry_settings())
         fields[vol.Optional(_RELOAD_PROCESSOR, default=False)] = bool
         fields[vol.Optional(_DONE_CONFIGURING, default=False)] = bool
 
         return vol.Schema(fields)
 
+    def _schema_entry_settings(self) -> dict[Any, Any]:
+        # settings of the entry itself, asked in the user step when adding one
+        return {}
+
 
 class SkolmatConfigFlow(_SkolmatFlowMixin, config_entries.ConfigFlow, domain=DOMAIN):
     """Config flow for Skolmat."""
@@ -464,6 +513,8 @@ class SkolmatConfigFlow(_SkolmatFlowMixin, config_entries.ConfigFlow, domain=DOM
                             CONF_URL: url,
                             CONF_LUNCH_BEGIN: begin.strftime("%H:%M") if begin else None,
                             CONF_LUNCH_END: end.strftime("%H:%M") if end else None,
+                            CONF_WEEKS: user_input.get(CONF_WEEKS, DEFAULT_WEEKS),
+                            CONF_ARCHIVE_YEARS: user_input.get(CONF_ARCHIVE_YEARS, DEFAULT_ARCHIVE_YEARS),
                         }
                     )
                     ok = await self._run_discovery()
@@ -479,6 +530,8 @@ class SkolmatConfigFlow(_SkolmatFlowMixin, config_entries.ConfigFlow, domain=DOM
                 CONF_URL: user_input.get(CONF_URL, ""),
                 CONF_LUNCH_BEGIN: user_input.get(CONF_LUNCH_BEGIN, ""),
                 CONF_LUNCH_END: user_input.get(CONF_LUNCH_END, ""),
+                CONF_WEEKS: user_input.get(CONF_WEEKS, DEFAULT_WEEKS),
+                CONF_ARCHIVE_YEARS: user_input.get(CONF_ARCHIVE_YEARS, DEFAULT_ARCHIVE_YEARS),
             }
 
         schema = vol.Schema(
@@ -487,6 +540,12 @@ class SkolmatConfigFlow(_SkolmatFlowMixin, config_entries.ConfigFlow, domain=DOM
                 vol.Required(CONF_URL, default=defaults.get(CONF_URL, "")): str,
                 vol.Optional(CONF_LUNCH_BEGIN, default=defaults.get(CONF_LUNCH_BEGIN, "")): str,
                 vol.Optional(CONF_LUNCH_END, default=defaults.get(CONF_LUNCH_END, "")): str,
+                vol.Optional(CONF_WEEKS, default=defaults.get(CONF_WEEKS, DEFAULT_WEEKS)): vol.All(
+                    vol.Coerce(int), vol.Range(min=1, max=MAX_WEEKS)
+                ),
+                vol.Optional(
+                    CONF_ARCHIVE_YEARS, default=defaults.get(CONF_ARCHIVE_YEARS, DEFAULT_ARCHIVE_YEARS)
+                ): vol.All(vol.Coerce(int), vol.Range(min=0, max=MAX_ARCHIVE_YEARS)),
             }
         )
 
@@ -509,12 +568,17 @@ class SkolmatConfigFlow(_SkolmatFlowMixin, config_entries.ConfigFlow, domain=DOM
                     pass
 
             self._data[CONF_MEALS_SELECTED] = list(user_input.get(CONF_MEALS_SELECTED, []))
+            accepted_patterns = (self._data.get(CONF_EXCLUDE_REGEX, []), self._data.get(CONF_PREFER_REGEX, []))
             self._exclude_keywords, self._data[CONF_EXCLUDE_REGEX] = self._parse_keyword_values(
                 user_input.get(CONF_EXCLUDE_REGEX)
             )
             self._prefer_keywords, self._data[CONF_PREFER_REGEX] = self._parse_keyword_values(
                 user_input.get(CONF_PREFER_REGEX)
             )
+            if pattern_error := await self._validate_patterns():
+                # keep the entered keywords for editing, preview with the last accepted patterns
+                errors["base"] = pattern_error
+                self._data[CONF_EXCLUDE_REGEX], self._data[CONF_PREFER_REGEX] = accepted_patterns
             self._data[CONF_MAX_ENTRIES] = self._parse_int(user_input.get(CONF_MAX_ENTRIES))
             user_input.pop(_EXCLUDE_LABEL, None)
             user_input.pop(_PREFER_LABEL, None)
@@ -569,10 +633,32 @@ class SkolmatOptionsFlowHandler(_SkolmatFlowMixin, config_entries.OptionsFlow):
     def __init__(self, entry):
         self.entry = entry
         self._init_flow_state(dict(entry.data))
+        self._reload_entry = False
+
+    def _filters_only_changed(self, previous: dict[str, Any]) -> bool:
+        keys = (set(previous) | set(self._data)) - set(_FILTER_KEYS)
+        return all(previous.get(key) == self._data.get(key) for key in keys)
+
+    def _schema_entry_settings(self) -> dict[Any, Any]:
+        # applied by reloading the entry, see _filters_only_changed
+        return {
+            vol.Optional(CONF_WEEKS, default=self._data.get(CONF_WEEKS, DEFAULT_WEEKS)): vol.All(
+                vol.Coerce(int), vol.Range(min=1, max=MAX_WEEKS)
+            ),
+            vol.Optional(
+                CONF_ARCHIVE_YEARS, default=self._data.get(CONF_ARCHIVE_YEARS, DEFAULT_ARCHIVE_YEARS)
+            ): vol.All(vol.Coerce(int), vol.Range(min=0, max=MAX_ARCHIVE_YEARS)),
+        }
+
+    def _live_menu(self) -> Menu | None:
+        entry_data = self.hass.data.get(DOMAIN, {}).get(self.entry.entry_id)
+        if not entry_data:
+            return None
+        return entry_data.get("menu")
 
     async def async_step_init(self, user_input=None):
         if user_input is None:
-            await self._run_discovery()
+            await self._run_discovery(self._live_menu())
             return await self.async_step_configure()
 
         return await self.async_step_configure(user_input)
@@ -590,18 +676,27 @@ class SkolmatOptionsFlowHandler(_SkolmatFlowMixin, config_entries.OptionsFlow):
                     pass
 
             self._data[CONF_MEALS_SELECTED] = list(user_input.get(CONF_MEALS_SELECTED, []))
+            accepted_patterns = (self._data.get(CONF_EXCLUDE_REGEX, []), self._data.get(CONF_PREFER_REGEX, []))
             self._exclude_keywords, self._data[CONF_EXCLUDE_REGEX] = self._parse_keyword_values(
                 user_input.get(CONF_EXCLUDE_REGEX)
             )
             self._prefer_keywords, self._data[CONF_PREFER_REGEX] = self._parse_keyword_values(
                 user_input.get(CONF_PREFER_REGEX)
             )
+            if pattern_error := await self._validate_patterns():
+                # keep the entered keywords for editing, preview with the last accepted patterns
+                errors["base"] = pattern_error
+                self._data[CONF_EXCLUDE_REGEX], self._data[CONF_PREFER_REGEX] = accepted_patterns
             self._data[CONF_MAX_ENTRIES] = self._parse_int(user_input.get(CONF_MAX_ENTRIES))
             user_input.pop(_EXCLUDE_LABEL, None)
             user_input.pop(_PREFER_LABEL, None)
             user_input.pop(_PROCESSOR_LABEL, None)
             self._data[CONF_PROCESSOR_FILE] = (user_input.get(CONF_PROCESSOR_FILE) or "").strip() or None
             self._data[CONF_PROCESSOR_FN] = (user_input.get(CONF_PROCESSOR_FN) or "").strip() or None
+            for key, default in ((CONF_WEEKS, DEFAULT_WEEKS), (CONF_ARCHIVE_YEARS, DEFAULT_ARCHIVE_YEARS)):
+                # entries from before a setting existed run on its default, keep it unset until changed
+                if user_input.get(key, self._data.get(key, default)) != self._data.get(key, default):
+                    self._data[key] = user_input[key]
             processor_changed = (
                 self._data.get(CONF_PROCESSOR_FILE) != self._original_processor_file
                 or self._data.get(CONF_PROCESSOR_FN) != self._original_processor_fn
@@ -616,6 +711,8 @@ class SkolmatOptionsFlowHandler(_SkolmatFlowMixin, config_entries.OptionsFlow):
                 else:
                     self._original_processor_file = self._data.get(CONF_PROCESSOR_FILE)
                     self._original_processor_fn = self._data.get(CONF_PROCESSOR_FN)
+                # the running entry still holds the old processor
+                self._reload_entry = True
             else:
                 self._processor_error = None
             self._build_preview()
@@ -629,8 +726,15 @@ class SkolmatOptionsFlowHandler(_SkolmatFlowMixin, config_entries.OptionsFlow):
                 )
 
             if user_input.get(_DONE_CONFIGURING):
+                previous = dict(self.entry.data)
                 self.hass.config_entries.async_update_entry(self.entry, data=self._data)
-                await self.hass.config_entries.async_reload(self.entry.entry_id)
+                live_menu = self._live_menu()
+                if self._reload_entry or live_menu is None or not self._filters_only_changed(previous):
+                    await self.hass.config_entries.async_reload(self.entry.entry_id)
+                else:
+                    # filter-only change: re-render summaries in place, keep menu, processor and entities
+                    live_menu.setSummaryFilters(entry_config(self.entry))
+                    async_dispatcher_send(self.hass, SIGNAL_MENU_UPDATED.format(self.entry.entry_id))
                 return self.async_create_entry(title="", data={})
 
         self._build_preview()
@@ -1,3 +1,5 @@
+from datetime import timedelta
+
 DOMAIN = "skolmat"
 
 CONF_NAME = "name"
@@ -14,5 +16,28 @@ CONF_MAX_ENTRIES = "max_entries"
 CONF_PROCESSOR_FILE = "processor_file"
 CONF_PROCESSOR_FN = "processor_fn"
 CONF_REFRESH_DISCOVERY = "refresh_discovery"
+CONF_WEEKS = "weeks"
+CONF_ARCHIVE_YEARS = "archive_years"
+
+DEFAULT_WEEKS = 2
+MAX_WEEKS = 6
+DEFAULT_ARCHIVE_YEARS = 0
 
 CALENDAR_HISTORY_DAYS = 90
+
+# optional long-term archive of days leaving the calendar history, one Store per month;
+# loaded months are kept in an LRU of this size
+MAX_ARCHIVE_YEARS = 10
+ARCHIVE_CACHE_MONTHS = 6
+
+# seconds a user filter regex may take over all entries of the fetched menu in the
+# config flow; slower patterns are rejected, above half of it a warning is logged
+REGEX_TIME_BUDGET = 0.05
+# wall time the config flow waits for a pattern probe, interpreter start included; the probe
+# runs in a subprocess and is killed past this, a pattern that needs longer is rejected
+REGEX_PROBE_TIMEOUT = 2.0
+
+# entities are push driven: the entry refreshes its menu on this interval and at
+# local midnight, and signals its entities (format with the entry id)
+MENU_REFRESH_INTERVAL = timedelta(minutes=15)
+SIGNAL_MENU_UPDATED = f"{DOMAIN}_menu_updated_{{}}"
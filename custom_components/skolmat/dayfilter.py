@@ -1,14 +1,77 @@
 
 from __future__ import annotations
-from typing import (TypedDict, Any, TYPE_CHECKING)
+from typing import (TypedDict, NamedTuple, Any, TYPE_CHECKING)
+from collections.abc import Iterable
+from functools import lru_cache
+import asyncio
+import json
 import re
+import sys
 
 if TYPE_CHECKING:
-    from .menu import MenuEntry
+    from .menu import MenuData, MenuEntry
 
 from logging import getLogger
 log = getLogger(__name__)
 
+# a repeated group with a repeat inside it, (a+)+ / (\w+\s?)* / (x{2,})+
+_NESTED_QUANTIFIER = re.compile(r"\((?:[^()\\]|\\.)*?(?:[*+]|\{\d*,\d*\})(?:[^()\\]|\\.)*\)(?:[*+]|\{\d*,\d*\})")
+
+
+@lru_cache(maxsize=256)
+def compile_pattern(pattern: str) -> re.Pattern:
+    # shared by every DayFilter and the config flow, raises re.error for invalid patterns
+    return re.compile(pattern, re.IGNORECASE)
+
+
+def has_nested_quantifier(pattern: str) -> bool:
+    # heuristic for catastrophic backtracking, such patterns cannot be bounded by timing a few entries
+    return _NESTED_QUANTIFIER.search(pattern) is not None
+
+
+# times pattern.search over the texts on stdin, in an interpreter of its own so it can be killed
+_PROBE_SCRIPT = """
+import json, re, sys, time
+data = json.load(sys.stdin)
+rx = re.compile(data["pattern"], data["flags"])
+started = time.perf_counter()
+for text in data["texts"]:
+    rx.search(text)
+print(time.perf_counter() - started)
+"""
+
+
+async def async_benchmark_pattern(pattern: str, entries: Iterable[MenuEntry], timeout: float) -> float | None:
+    """
+    Seconds spent searching pattern over entries the way DayFilter does, None if it did not
+    finish within timeout (interpreter start included). re holds the GIL while matching, so a
+    runaway match in a thread would stall the event loop; a subprocess is killed instead.
+    """
+    rx = compile_pattern(pattern)
+    texts = []
+    for entry in entries:
+        label = entry.get("label") or ""
+        dish = entry.get("dish") or ""
+        texts.append(f"{label} {dish}")
+        texts.append(f"{label.lower()} {dish.lower()}")
+    data = json.dumps({"pattern": rx.pattern, "flags": rx.flags, "texts": texts}).encode("utf-8")
+
+    proc = await asyncio.create_subprocess_exec(
+        sys.executable, "-I", "-S", "-c", _PROBE_SCRIPT,
+        stdin=asyncio.subprocess.PIPE, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.DEVNULL,
+    )
+    try:
+        stdout, _ = await asyncio.wait_for(proc.communicate(data), timeout)
+    except asyncio.TimeoutError:
+        proc.kill()
+        await proc.wait()
+        return None
+    try:
+        return float(stdout)
+    except ValueError:
+        return None
+
+
 class DayFilterConfig(TypedDict, total=False):
     # Phase A – meal focus
     meal_focus: list[str] | None
@@ -23,10 +86,21 @@ class DayFilterConfig(TypedDict, total=False):
     max_items: int | None
 
 
+class DayFilterBatch(TypedDict):
+    days: dict[str, list[MenuEntry]]    # iso date -> filtered entries
+    fallbacks: dict[str, list[str]]     # iso date -> guards that kept entries, only days that fell back
+
+
+class _EntryMatch(NamedTuple):
+    excluded: tuple[bool, ...]  # per exclude regex, in config order
+    preferred: int              # number of prefer regex hits
+
+
 class DayFilter():
 
     def __init__(self, config_raw:dict):
         self._config:DayFilterConfig = self._processConfig(config_raw)
+        self._meal_focus_set = frozenset(self._config["meal_focus"] or ())
     
     
     def _processConfig(self, config_raw:dict):
@@ -62,7 +136,7 @@ class DayFilter():
                     if not isinstance(pattern, str) or not pattern.strip():
                         continue
                     try:
-                        regex.append(re.compile(pattern, re.IGNORECASE))
+                        regex.append(compile_pattern(pattern))
                     except re.error as e:
                         log.error("Skolmat DayFilter: invalid regex '%s' ignored (%s)", pattern, e)
 
@@ -88,12 +162,12 @@ class DayFilter():
         # Merge label selections into regex for backward compatibility.
         if exclude["labels"]:
             exclude["regex"].extend(
-                re.compile(re.escape(label), re.IGNORECASE) for label in exclude["labels"]
+                compile_pattern(re.escape(label)) for label in exclude["labels"]
             )
             exclude["labels"] = []
         if prefer["labels"]:
             prefer["regex"].extend(
-                re.compile(re.escape(label), re.IGNORECASE) for label in prefer["labels"]
+                compile_pattern(re.escape(label)) for label in prefer["labels"]
             )
             prefer["labels"] = []
 
@@ -116,15 +190,63 @@ class DayFilter():
         if not entries:
             return []
 
-        focused = self._phase_a_focus(entries)
-        ranked = self._phase_b_filter_and_rank(focused)
+        notes: list[str] = []
+        result = self._filter_day(entries, {}, notes)
+        for note in notes:
+            log.info("DayFilter: %s", note)
+        return result
+
+    def filter_many(self, menu: MenuData) -> DayFilterBatch:
+        """
+        Filter every day of menu in one pass, same result per day as filter().
+        Match data is computed once per distinct (label, dish) and shared across days,
+        fallbacks are returned per iso date and logged once for the whole batch.
+        """
+        matches: dict[tuple[str, str], _EntryMatch] = {}
+        days: dict[str, list[MenuEntry]] = {}
+        fallbacks: dict[str, list[str]] = {}
+
+        for isodate, entries in menu.items():
+            if not entries:
+                days[isodate] = []
+                continue
+            notes: list[str] = []
+            days[isodate] = self._filter_day(entries, matches, notes)
+            if notes:
+                fallbacks[isodate] = notes
+
+        if fallbacks:
+            log.info("DayFilter: fell back on %d of %d days %s", len(fallbacks), len(days), fallbacks)
+
+        return {"days": days, "fallbacks": fallbacks}
+
+
+    def _filter_day(self, entries: list[MenuEntry],
+                    matches: dict[tuple[str, str], _EntryMatch], notes: list[str]) -> list[MenuEntry]:
+        focused = self._phase_a_focus(entries, notes)
+        ranked = self._phase_b_filter_and_rank(focused, matches, notes)
         capped = self._phase_c_cap(ranked)
 
         # Final safety net
         return capped or focused
 
 
-    def _phase_a_focus(self, entries: list[MenuEntry]) -> list[MenuEntry]:
+    def _match(self, entry: MenuEntry, matches: dict[tuple[str, str], _EntryMatch]) -> _EntryMatch:
+        # regex outcome only depends on label and dish, menus repeat those across days
+        label = entry.get("label") or ""
+        dish = entry.get("dish") or ""
+        match = matches.get((label, dish))
+        if match is None:
+            text = f"{label} {dish}"
+            lowered = f"{label.lower()} {dish.lower()}"
+            match = matches[(label, dish)] = _EntryMatch(
+                excluded=tuple(rx.search(text) is not None for rx in self._config["exclude"]["regex"]),
+                preferred=sum(1 for rx in self._config["prefer"]["regex"] if rx.search(lowered) is not None),
+            )
+        return match
+
+
+    def _phase_a_focus(self, entries: list[MenuEntry], notes: list[str]) -> list[MenuEntry]:
         """
         Phase A - meal focus
         """
@@ -135,11 +257,11 @@ class DayFilter():
 
         # ---- meal focus: hard boundary -----------------------------
         if meal_focus:
-            focused = [e for e in entries if e.get("meal") in meal_focus]
+            focused = [e for e in entries if e.get("meal") in self._meal_focus_set]
             if focused:
                 return focused
 
-            log.info("DayFilter: meal_focus %r matched nothing — falling back to all entries", meal_focus)
+            notes.append(f"meal_focus {meal_focus!r} matched nothing — falling back to all entries")
             return entries
 
         # fallback: keep all (empty meal_focus means all meals)
@@ -147,51 +269,35 @@ class DayFilter():
 
 
 
-    def _phase_b_filter_and_rank(self, entries: list[MenuEntry]) -> list[MenuEntry]:
+    def _phase_b_filter_and_rank(self, entries: list[MenuEntry],
+                                 matches: dict[tuple[str, str], _EntryMatch], notes: list[str]) -> list[MenuEntry]:
         if not entries:
             return entries
 
-        filtered = self._apply_exclusions(entries)
+        entry_matches = [self._match(e, matches) for e in entries]
+        filtered = self._apply_exclusions(entries, entry_matches, notes)
         ranked = self._apply_preferences(filtered)
         return ranked
 
-    def _apply_exclusions(self, entries: list[MenuEntry]) -> list[MenuEntry]:
-        cfg = self._config["exclude"]
-        result = entries
-
-        def matches_regex(entry: MenuEntry, rx: re.Pattern) -> bool:
-            entry_label = entry.get("label") or ""
-            entry_dish = entry.get("dish") or ""
-            text = f"{entry_label} {entry_dish}"
-            return rx.search(text) is not None
+    def _apply_exclusions(self, entries: list[MenuEntry],
+                          entry_matches: list[_EntryMatch], notes: list[str]) -> list[tuple[MenuEntry, _EntryMatch]]:
+        result = list(zip(entries, entry_matches))
 
         # regex exclusions
-        for rx in cfg["regex"]:
-            tmp = [e for e in result if not matches_regex(e, rx)]
+        for i, rx in enumerate(self._config["exclude"]["regex"]):
+            tmp = [pair for pair in result if not pair[1].excluded[i]]
             if tmp:
                 result = tmp
             else:
-                log.info("DayFilter: exclusion skipped (regex=%r) — would remove all entries (%d)", rx.pattern, len(result))
+                notes.append(f"exclusion skipped (regex={rx.pattern!r}) — would remove all entries ({len(result)})")
 
         return result
 
 
-    def _apply_preferences(self, entries: list[MenuEntry]) -> list[MenuEntry]:
-        cfg = self._config["prefer"]
-
-        def score(entry: MenuEntry) -> tuple:
-            label = (entry.get("label") or "").lower()
-            dish = (entry.get("dish") or "").lower()
-
-            def regex_hit(rx: re.Pattern) -> bool:
-                text = f"{label} {dish}"
-                return rx.search(text) is not None
-
-            # Stack preferences across keywords; tie-breaker is original order.
-            regex_hits = sum(1 for rx in cfg["regex"] if regex_hit(rx))
-            return (-regex_hits, entry.get("order", 0))
-
-        return sorted(entries, key=score)
+    def _apply_preferences(self, pairs: list[tuple[MenuEntry, _EntryMatch]]) -> list[MenuEntry]:
+        # Stack preferences across keywords; tie-breaker is original order.
+        ranked = sorted(pairs, key=lambda pair: (-pair[1].preferred, pair[0].get("order", 0)))
+        return [entry for entry, _ in ranked]
 
     
     def _phase_c_cap(self, entries: list[MenuEntry]) -> list[MenuEntry]:
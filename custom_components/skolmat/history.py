@@ -0,0 +1,322 @@
+from __future__ import annotations
+
+import asyncio
+from collections import OrderedDict
+from collections.abc import Iterator
+from hashlib import sha1
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN
+from .searchindex import SearchIndex, textMatches, tokenize
+
+# hass.data key of the SourceHistory registry, by source key
+DATA_SOURCE_HISTORY = f"{DOMAIN}_source_history"
+
+
+class DayTexts:
+
+    """
+    One text per day, dictionary encoded.
+    Menus repeat on rotation, so every distinct text is held once in a string table and
+    days refer to it by id, both in memory and in the stored form:
+
+        {"strings": [text, ...], "days": [[iso date, text id], ...]}
+
+    The string table is compacted on prune, so it does not outgrow the kept days.
+    """
+
+    def __init__(self):
+        self._strings: list[str] = []
+        self._ids: dict[str, int] = {}
+        self._days: dict[str, int] = {}  # iso date -> text id
+
+    def __len__(self) -> int:
+        return len(self._days)
+
+    def __contains__(self, isodate: str) -> bool:
+        return isodate in self._days
+
+    def _intern(self, text: str) -> int:
+        string_id = self._ids.get(text)
+        if string_id is None:
+            string_id = self._ids[text] = len(self._strings)
+            self._strings.append(text)
+        return string_id
+
+    def get(self, isodate: str) -> str | None:
+        string_id = self._days.get(isodate)
+        return None if string_id is None else self._strings[string_id]
+
+    def set(self, isodate: str, text: str) -> bool:
+        # True if the day was added or changed
+        string_id = self._intern(text or "")
+        if self._days.get(isodate) == string_id:
+            return False
+        self._days[isodate] = string_id
+        return True
+
+    def items(self) -> Iterator[tuple[str, str]]:
+        # (iso date, text) in date order
+        for isodate in sorted(self._days):
+            yield isodate, self._strings[self._days[isodate]]
+
+    def prune(self, cutoff: str) -> bool:
+        # drop days before the cutoff iso date, True if any was dropped
+        removed = [d for d in self._days if d < cutoff]
+        for d in removed:
+            del self._days[d]
+
+        # rebuild the string table once it holds texts no kept day refers to (dropped or replaced days)
+        if len(set(self._days.values())) < len(self._strings):
+            strings, days = self._strings, self._days
+            self._strings, self._ids, self._days = [], {}, {}
+            for isodate, string_id in days.items():
+                self._days[isodate] = self._intern(strings[string_id])
+        return bool(removed)
+
+    def as_store(self) -> dict[str, Any]:
+        return {
+            "strings": list(self._strings),
+            "days": [[isodate, self._days[isodate]] for isodate in sorted(self._days)],
+        }
+
+    @classmethod
+    def from_store(cls, data: dict[str, Any] | None) -> DayTexts:
+        texts = cls()
+        strings = (data or {}).get("strings") or []
+        for row in (data or {}).get("days") or []:
+            try:
+                texts.set(row[0], strings[row[1]])
+            except (TypeError, IndexError):
+                continue
+        return texts
+
+
+def load_entry_history(data: dict[str, Any] | None) -> tuple[DayTexts, DayTexts, bool]:
+    """
+    (summaries, menus, legacy) from a calendar's Store. Only summaries are stored per entry now;
+    menus are returned from the older per-event format, which held both, so they can move to
+    the source history.
+    """
+    if not data:
+        return DayTexts(), DayTexts(), False
+
+    if "strings" in data:
+        return DayTexts.from_store(data), DayTexts(), False
+
+    # per-event format: {"events": [{"date", "course", "menu"}, ...]}
+    summaries, menus = DayTexts(), DayTexts()
+    for item in data.get("events", []):
+        date_str = item.get("date")
+        if not date_str:
+            continue
+        summaries.set(date_str, item.get("summary") or item.get("course") or "")
+        menus.set(date_str, item.get("menu") or item.get("description") or "")
+    return summaries, menus, True
+
+
+def menu_texts(menu: str) -> list[str]:
+    # entry lines of a readable day menu ("• label: dish"), without the meal headers
+    return [line[2:] for line in menu.splitlines() if line.startswith("• ")]
+
+
+def source_key(url_hash: str, processor_file: str | None = None, processor_fn: str | None = None) -> str:
+    # a processor rewrites the menu, entries on the same url only share it with the same processor
+    if not (processor_file or processor_fn):
+        return url_hash
+    return sha1(f"{url_hash}:{processor_file}:{processor_fn}".encode("utf-8")).hexdigest()
+
+
+class SourceHistory:
+
+    """
+    Full day menus of one source, persisted once and shared by every calendar on it.
+    Calendars acquire it from the registry in hass.data and release it on removal.
+    The day menus are also kept in a SearchIndex, updated as days are set and pruned. It holds
+    each day's menu text as one, shared with menus, and search() picks out the matching lines.
+    """
+
+    def __init__(self, hass: HomeAssistant, key: str):
+        self.key = key
+        self.menus = DayTexts()
+        self.index = SearchIndex()
+        self._store = Store(hass, 1, f"{DOMAIN}_{key}_history")
+        self._users = 0
+        self._loading: asyncio.Future | None = None
+        self._dirty = False
+
+    @classmethod
+    def acquire(cls, hass: HomeAssistant, key: str) -> SourceHistory:
+        registry: dict[str, SourceHistory] = hass.data.setdefault(DATA_SOURCE_HISTORY, {})
+        source = registry.get(key)
+        if source is None:
+            source = registry[key] = cls(hass, key)
+        source._users += 1
+        return source
+
+    def release(self, hass: HomeAssistant):
+        self._users -= 1
+        registry: dict[str, SourceHistory] = hass.data.get(DATA_SOURCE_HISTORY, {})
+        if self._users <= 0 and registry.get(self.key) is self:
+            del registry[self.key]
+
+    async def async_load(self):
+        # first calendar on the source starts the load, the others wait for the same one.
+        # Calendars set and save days only after this returned, never on a history still empty
+        if self._loading is None:
+            self._loading = asyncio.ensure_future(self._async_load())
+        await self._loading
+
+    async def _async_load(self):
+        stored = DayTexts.from_store(await self._store.async_load())
+        # days set before the load completed are newer
+        for isodate, text in stored.items():
+            if isodate not in self.menus:
+                self._set(isodate, text)
+
+    def adopt(self, menus: DayTexts):
+        # menus from an entry's older history, days the source already has win
+        for isodate, text in menus.items():
+            if isodate not in self.menus:
+                self._set(isodate, text)
+                self._dirty = True
+
+    def _set(self, isodate: str, text: str) -> bool:
+        if not self.menus.set(isodate, text):
+            return False
+        self.index.setDay(isodate, (text,) if text else ())
+        return True
+
+    def set(self, isodate: str, text: str):
+        if self._set(isodate, text):
+            self._dirty = True
+
+    def prune(self, cutoff: str):
+        self.index.prune(cutoff)
+        if self.menus.prune(cutoff):
+            self._dirty = True
+
+    def search(self, query: str, start: str | None = None, end: str | None = None) -> dict[str, list[str]]:
+        # matching entry lines of the day menus by iso date, within start..end (inclusive)
+        words = tokenize(query)
+        found: dict[str, list[str]] = {}
+        for isodate, texts in self.index.search(query, start, end).items():
+            lines = [line for text in texts for line in menu_texts(text) if textMatches(line, words)]
+            if lines:
+                found[isodate] = lines
+        return found
+
+    async def async_save(self):
+        # entries on the source set the same texts, so only the first one after a change writes
+        if not self._dirty:
+            return
+        self._dirty = False
+        await self._store.async_save(self.menus.as_store())
+
+
+class _ArchiveMonth:
+
+    """One month of archived days, summaries and menus each dictionary encoded."""
+
+    def __init__(self, summaries: DayTexts | None = None, menus: DayTexts | None = None):
+        self.summaries = DayTexts() if summaries is None else summaries
+        self.menus = DayTexts() if menus is None else menus
+
+    def as_store(self) -> dict[str, Any]:
+        return {"summaries": self.summaries.as_store(), "menus": self.menus.as_store()}
+
+    @classmethod
+    def from_store(cls, data: dict[str, Any] | None) -> _ArchiveMonth:
+        data = data or {}
+        return cls(DayTexts.from_store(data.get("summaries")), DayTexts.from_store(data.get("menus")))
+
+
+class MenuArchive:
+
+    """
+    Long-term calendar archive of one entry, for days older than the calendar history.
+    Each month is a Store of its own ("YYYY-MM"), listed in an index Store, and months are
+    only loaded when a requested range covers them. Up to cache_size loaded months are
+    kept, least recently used first out.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str, cache_size: int):
+        self._hass = hass
+        self._key = f"{DOMAIN}_{entry_id}_archive"
+        self._index = Store(hass, 1, self._key)
+        self._months: set[str] | None = None  # months with a segment, None until the index is loaded
+        self._cache: OrderedDict[str, _ArchiveMonth] = OrderedDict()
+        self._cache_size = max(1, cache_size)
+        self._lock = asyncio.Lock()
+
+    def _segment(self, month: str) -> Store:
+        return Store(self._hass, 1, f"{self._key}_{month}")
+
+    async def _async_months(self) -> set[str]:
+        if self._months is None:
+            data = await self._index.async_load() or {}
+            self._months = set(data.get("months") or [])
+        return self._months
+
+    async def _async_month(self, month: str) -> _ArchiveMonth:
+        segment = self._cache.get(month)
+        if segment is not None:
+            self._cache.move_to_end(month)
+            return segment
+
+        if month in await self._async_months():
+            segment = _ArchiveMonth.from_store(await self._segment(month).async_load())
+        else:
+            segment = _ArchiveMonth()
+        self._cache[month] = segment
+        while len(self._cache) > self._cache_size:
+            self._cache.popitem(last=False)
+        return segment
+
+    async def async_add(self, days: list[tuple[str, str, str]]):
+        # (iso date, summary, menu) of days leaving the calendar history
+        async with self._lock:
+            by_month: dict[str, list[tuple[str, str, str]]] = {}
+            for day in days:
+                by_month.setdefault(day[0][:7], []).append(day)
+
+            months = await self._async_months()
+            for month, month_days in by_month.items():
+                segment = await self._async_month(month)
+                changed = False
+                for isodate, summary, menu in month_days:
+                    changed |= segment.summaries.set(isodate, summary)
+                    changed |= segment.menus.set(isodate, menu)
+                if changed:
+                    await self._segment(month).async_save(segment.as_store())
+            if not by_month.keys() <= months:
+                months.update(by_month)
+                await self._index.async_save({"months": sorted(months)})
+
+    async def async_get_range(self, start: str, end: str) -> list[tuple[str, str, str]]:
+        # archived (iso date, summary, menu) with start <= date < end, loading only the months covering it
+        async with self._lock:
+            days: list[tuple[str, str, str]] = []
+            for month in sorted(await self._async_months()):
+                if not start[:7] <= month <= end[:7]:
+                    continue
+                segment = await self._async_month(month)
+                for isodate, summary in segment.summaries.items():
+                    if start <= isodate < end:
+                        days.append((isodate, summary, segment.menus.get(isodate) or ""))
+            return days
+
+    async def async_prune(self, cutoff: str):
+        # remove months entirely before the cutoff iso date
+        async with self._lock:
+            months = await self._async_months()
+            expired = sorted(m for m in months if m < cutoff[:7])
+            for month in expired:
+                await self._segment(month).async_remove()
+                months.discard(month)
+                self._cache.pop(month, None)
+            if expired:
+                await self._index.async_save({"months": sorted(months)})
@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+
+class KeywordIndex():
+
+    """
+    Meal and label keywords of each menu day, kept in step with Menu's merged MenuData.
+    Keywords are stored normalized and in first-seen order per day, next to the set of
+    days each keyword occurs on, so discovery never has to walk or re-normalize the menu.
+    """
+
+    def __init__(self):
+        self._days:dict[str, tuple[list[str], list[str]]] = {}  # iso date -> (meals, labels)
+        self._mealDays:dict[str, set[str]] = {}  # meal -> iso dates it occurs on
+        self._labelDays:dict[str, set[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._days)
+
+    def setDay(self, isodate:str, meals:list[str], labels:list[str]):
+        self.removeDay(isodate)
+        self._days[isodate] = (meals, labels)
+        for meal in meals:
+            self._mealDays.setdefault(meal, set()).add(isodate)
+        for label in labels:
+            self._labelDays.setdefault(label, set()).add(isodate)
+
+    def removeDay(self, isodate:str):
+        previous = self._days.pop(isodate, None)
+        if previous is None:
+            return
+        for keywords, presence in ((previous[0], self._mealDays), (previous[1], self._labelDays)):
+            for keyword in keywords:
+                days = presence.get(keyword)
+                if days is not None:
+                    days.discard(isodate)
+                    if not days:
+                        del presence[keyword]
+
+    def clear(self):
+        self._days.clear()
+        self._mealDays.clear()
+        self._labelDays.clear()
+
+    def dates(self) -> list[str]:
+        return sorted(self._days)
+
+    def dayKeywords(self, isodate:str) -> tuple[list[str], list[str]]:
+        return self._days.get(isodate, ([], []))
+
+    def meals(self) -> set[str]:
+        return set(self._mealDays)
+
+    def labels(self) -> set[str]:
+        return set(self._labelDays)
+
+    def mealDays(self, meal:str) -> set[str]:
+        return set(self._mealDays.get(meal, ()))
+
+    def labelDays(self, label:str) -> set[str]:
+        return set(self._labelDays.get(label, ()))
+
+    def firstSeen(self, keyword:str) -> str | None:
+        # earliest iso date a meal or label occurs on
+        days = self._mealDays.get(keyword, set()) | self._labelDays.get(keyword, set())
+        return min(days) if days else None
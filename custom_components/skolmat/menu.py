@@ -1,14 +1,20 @@
-import feedparser, re, asyncio, traceback, json, html  # noqa: E401
+import re, asyncio, traceback, json, html  # noqa: E401
+from bisect import bisect_left
 from abc import ABC, abstractmethod
-from datetime import datetime, date, timezone, timedelta
-from dateutil import tz, parser
+from datetime import datetime, date, timedelta
 from logging import getLogger
-from bs4 import BeautifulSoup
-from urllib.parse import urlparse, quote
 from collections.abc import Callable
-from typing import TypedDict, TypeAlias, Any
+from typing import TypedDict, TypeAlias, NamedTuple, Any
 from pathlib import Path
+from hashlib import sha1
 from .dayfilter import DayFilter
+from .keywordindex import KeywordIndex
+from .searchindex import SearchIndex
+
+try:
+    import orjson
+except ImportError:  # optional, stdlib json is the fallback
+    orjson = None
 
 # Precompiled regexes (clarity + speed)
 RE_PAREN_MARK = re.compile(r"\(([A-Za-z0-9])\)")
@@ -44,6 +50,18 @@ def normalizeString(s: str) -> str:
 
     return s[0].upper() + s[1:]
 
+def decodeJson(data: bytes | str) -> Any:
+    # decode straight from the raw body bytes, with orjson when available
+    if orjson is not None:
+        if isinstance(data, str) and type(data) is not str:
+            data = str(data)  # orjson rejects str subclasses like bs4's NavigableString
+        return orjson.loads(data)
+    return json.loads(data)
+
+def isoDate(value: str) -> date:
+    # provider dates are ISO strings, possibly with a time part ("2026-01-05T00:00:00.000Z")
+    return date.fromisoformat(value[:10])
+
 
 class MenuEntry(TypedDict):
     meal_raw: str | None
@@ -55,9 +73,46 @@ class MenuEntry(TypedDict):
 
 MenuData: TypeAlias = dict[str, list[MenuEntry]]
 
+def batchProcessor(fn:Callable) -> Callable:
+    """
+    Marks a custom processor as day batch processor:
+        fn(entryDate:date, raw_entries:list[Any]) -> list[MenuEntry | None]
+    It receives all raw entries of a day in one call and returns one result per raw entry, in order.
+    None results default to standard processing, set dish to None to discard an entry.
+    """
+    fn.skolmatBatch = True
+    return fn
+
+class MenuChanges(TypedDict):
+    version: int
+    added: set[str]
+    changed: set[str]
+    removed: set[str]
+
+class MenuHorizon(NamedTuple):
+    """
+    The displayed date window, both ends inclusive.
+    Starts on Monday this week (next week on weekends) and spans whole ISO weeks.
+    """
+    start: date
+    end: date
+
+    def covers(self, d:date) -> bool:
+        return self.start <= d <= self.end
+
+    def isoWeeks(self) -> list[tuple[int, int]]:
+        # (year, week) for each week in the window
+        weeks = ((self.end - self.start).days + 1) // 7
+        return [tuple((self.start + timedelta(weeks=w)).isocalendar()[:2]) for w in range(weeks)]
+
 class Menu(ABC):
 
     _NO_MENU_MESSAGE = ""
+    _CHANGE_LOG_SIZE = 16
+    MAX_BODY_BYTES = 2 * 1024 * 1024 # per response, larger bodies are aborted while streaming
+    _READ_CHUNK_BYTES = 64 * 1024
+    JSON_CONTENT_TYPES = ("json", "text/plain")
+    HTML_CONTENT_TYPES = ("html",)
     DEBUG = False
     DUMP_TO_FILE = False
 
@@ -69,25 +124,27 @@ class Menu(ABC):
                 ):
         url = url.rstrip(" /")
 
-        if SkolmatenMenu.provider in url:
-            return SkolmatenMenu(asyncExecutor, url, customMenuEntryProcessorCB, readableDaySummaryCB)
-        elif FoodItMenu.provider in url:
-            return FoodItMenu(asyncExecutor, url, customMenuEntryProcessorCB, readableDaySummaryCB)
-        elif MatildaMenu.provider in url:
-            return MatildaMenu(asyncExecutor, url, customMenuEntryProcessorCB, readableDaySummaryCB)
-        elif MashieMenu.provider in url:
-            return MashieMenu(asyncExecutor, url, customMenuEntryProcessorCB, readableDaySummaryCB)
-        elif MateoMenu.provider in url:
-            return MateoMenu(asyncExecutor, url, customMenuEntryProcessorCB, readableDaySummaryCB)
-        elif SkolmatInfoMenu.provider in url:
-            return SkolmatInfoMenu(asyncExecutor, url, customMenuEntryProcessorCB, readableDaySummaryCB)
-        elif MenuGoMenu.provider in url:
-            return MenuGoMenu(asyncExecutor, url, customMenuEntryProcessorCB, readableDaySummaryCB)
-        else:
+        # provider modules (and their parser libraries) are only imported once a matching url is used
+        from .providers import getProviderClass, PROVIDERS
+
+        menuClass = getProviderClass(url)
+        if menuClass is None:
             raise Exception(
-                f"URL not recognized as {SkolmatenMenu.provider}, {FoodItMenu.provider}, "
-                f"{MatildaMenu.provider}, {MashieMenu.provider}, {MateoMenu.provider} or {SkolmatInfoMenu.provider}"
+                f"URL not recognized as {', '.join(provider for provider, _, _ in PROVIDERS)}"
             )
+        return menuClass(asyncExecutor, url, customMenuEntryProcessorCB, readableDaySummaryCB)
+
+    @staticmethod
+    async def asyncCreateMenu (asyncExecutor, 
+                               url:str, 
+                               customMenuEntryProcessorCB: Callable | None = None,
+                               readableDaySummaryCB: Callable | None = None
+                            ):
+        # same as createMenu, but imports the provider module in the executor
+        from .providers import getProviderClass
+
+        await asyncExecutor(getProviderClass, url.rstrip(" /"))
+        return Menu.createMenu(asyncExecutor, url, customMenuEntryProcessorCB, readableDaySummaryCB)
 
     def __init__(self, 
                  asyncExecutor, 
@@ -99,19 +156,35 @@ class Menu(ABC):
         
         self.asyncExecutor = asyncExecutor
         self._menu:MenuData = {}
-        self._customMenuEntryProcessorCB:Callable = customMenuEntryProcessorCB
+        self._customMenuEntryProcessorCB:Callable = None
+        self._customMenuBatchProcessorCB:Callable = None
+        if getattr(customMenuEntryProcessorCB, "skolmatBatch", False):
+            self._customMenuBatchProcessorCB = customMenuEntryProcessorCB
+        else:
+            self._customMenuEntryProcessorCB = customMenuEntryProcessorCB
         self.menuProcessorSuccessful = False
         self._readableDaySummaryCB:Callable = readableDaySummaryCB
         self.url:str = self._fixUrl(url)
         self._menuToday:list = [] 
         self.last_menu_fetch:datetime | None = None
+        self.last_menu_bytes:int = 0
+        self._bytesRead:int = 0
         self._weeks:int = 2
         self._menuValidHours:int  = menuValidHours
         self._lock = asyncio.Lock()
         self._dayFilter:DayFilter = None
+        self._filterVersion:int = 0
         self._nextAllowed = None
         self._faliureCount = 0
         self._lastFail = None
+        self._version:int = 0
+        self._dayDigests:dict[str, str] = {}
+        self._changeLog:list[MenuChanges] = []
+        # discovery keywords, staged by _addMenuEntry during a load and committed by _mergeMenu
+        self._keywordIndex = KeywordIndex()
+        self._searchIndex = SearchIndex()  # dish texts, follows the same menu as the keyword index
+        self._indexedMenu:MenuData | None = None
+        self._stagedKeywords:dict[str, tuple[list[str], list[str]]] = {}
 
     @abstractmethod
     def _fixUrl (self, url:str) -> str:
@@ -137,6 +210,31 @@ class Menu(ABC):
                 log.error( "Custom menu entry processor failed for %s: %s",self.url, e)
         return None
 
+    def _processDayEntries(self, entryDate, raw_entries:list[Any], orders:list[int] | None = None) -> list[MenuEntry | None]:
+        """
+        Processes all raw entries of one day. A batch processor (see batchProcessor) gets the whole day
+        in one call, entries it leaves as None go through the standard _processMenuEntry.
+        """
+        if orders is None:
+            orders = list(range(1, len(raw_entries) + 1))
+
+        results:list[MenuEntry | None] = [None] * len(raw_entries)
+        if self._customMenuBatchProcessorCB and raw_entries:
+            try:
+                processed = list(self._customMenuBatchProcessorCB(entryDate, raw_entries))
+                if len(processed) != len(raw_entries):
+                    raise ValueError(f"expected {len(raw_entries)} results, got {len(processed)}")
+                results = processed
+                self.menuProcessorSuccessful = True
+            except Exception as e:
+                self.menuProcessorSuccessful = False
+                log.error("Custom menu batch processor failed for %s: %s", self.url, e)
+
+        return [
+            entry if entry is not None else self._processMenuEntry(entryDate, order, raw_entry)
+            for order, raw_entry, entry in zip(orders, raw_entries, results)
+        ]
+
 
     def _addFail (self):
         self._faliureCount += 1
@@ -160,9 +258,13 @@ class Menu(ABC):
         return timedelta(seconds=retryDelay)
 
 
-    def _getWeekNumber (self, offset:int = 0):
-        weekDate = date.today() + timedelta(weeks=offset)
-        return weekDate.isocalendar()
+    @property
+    def horizon(self) -> MenuHorizon:
+        today = date.today()
+        start = today - timedelta(days=today.weekday())
+        if today.weekday() >= 5:
+            start += timedelta(days=7)
+        return MenuHorizon(start, start + timedelta(days=7 * self._weeks - 1))
 
     async def getMenu(self, aiohttp_session, force:bool=False) -> MenuData | None:
 
@@ -191,9 +293,13 @@ class Menu(ABC):
                 return self._menu
             try:
 
+                self._bytesRead = 0
+                self._stagedKeywords = {}
                 menu = await self._loadMenu(aiohttp_session)
                 self.last_menu_fetch = datetime.now()
-                self._menu = menu
+                self.last_menu_bytes = self._bytesRead
+                log.debug(f"Loaded {self.provider} menu from {self.url}: {self._bytesRead} bytes")
+                self._mergeMenu(menu)
                 self._resetFail()
 
             except Exception as err:
@@ -220,6 +326,151 @@ class Menu(ABC):
 
             return self._menu
 
+    @property
+    def version(self) -> int:
+        return self._version
+
+    def getDayDigest(self, isodate:str) -> str | None:
+        return self._dayDigests.get(isodate)
+
+    def getChangesSince(self, version:int | None) -> MenuChanges | None:
+
+        """
+        Returns the dates added/changed/removed after `version`, aggregated over all loads since then.
+        None means the changes cannot be told (unknown or too old version), consumers should then
+        reprocess the whole menu.
+        """
+
+        if version is None or version > self._version:
+            return None
+        if version == self._version:
+            return {"version": self._version, "added": set(), "changed": set(), "removed": set()}
+        if not self._changeLog or self._changeLog[0]["version"] > version + 1:
+            return None
+
+        added:set[str] = set()
+        touched:set[str] = set()
+        for changes in self._changeLog:
+            if changes["version"] <= version:
+                continue
+            added |= changes["added"]
+            touched |= changes["added"] | changes["changed"] | changes["removed"]
+
+        current = touched & self._dayDigests.keys()
+        return {
+            "version": self._version,
+            "added": added & current,
+            "changed": current - added,
+            "removed": touched - current,
+        }
+
+    @staticmethod
+    def _digestDay(entries:list[MenuEntry]) -> str:
+        data = json.dumps(entries, sort_keys=True, ensure_ascii=False, default=str)
+        return sha1(data.encode("utf-8")).hexdigest()
+
+    def _mergeMenu(self, menu:MenuData | None) -> MenuChanges:
+
+        """
+        Merges a freshly loaded menu into the current one. Unchanged days keep their existing
+        entry lists, and the version is bumped only when any day was added, changed or removed.
+        """
+
+        menu = menu or {}
+        current = self._menu or {}
+        merged:MenuData = {}
+        digests:dict[str, str] = {}
+        added:set[str] = set()
+        changed:set[str] = set()
+
+        for isodate, entries in menu.items():
+            digest = self._digestDay(entries)
+            digests[isodate] = digest
+            previous = self._dayDigests.get(isodate)
+            if previous is None or isodate not in current:
+                added.add(isodate)
+                merged[isodate] = entries
+            elif previous != digest:
+                changed.add(isodate)
+                merged[isodate] = entries
+            else:
+                merged[isodate] = current[isodate]
+
+        removed = set(self._dayDigests) - set(digests)
+        self._updateKeywordIndex(merged, added | changed, removed)
+        self._menu = merged
+        self._dayDigests = digests
+
+        if added or changed or removed:
+            self._version += 1
+            self._changeLog.append({"version": self._version, "added": added, "changed": changed, "removed": removed})
+            del self._changeLog[:-self._CHANGE_LOG_SIZE]
+
+        return {"version": self._version, "added": added, "changed": changed, "removed": removed}
+
+    @staticmethod
+    def _collectKeywords(meals:list[str], labels:list[str], entry:MenuEntry):
+        # adds the entry's normalized meal and label, keeping first-seen order
+        meal = normalizeString(entry.get("meal") or "")
+        if meal and meal not in meals:
+            meals.append(meal)
+        label = normalizeString(entry.get("label") or "")
+        if label and label not in labels:
+            labels.append(label)
+
+    @staticmethod
+    def _entryKeywords(entries:list[MenuEntry]) -> tuple[list[str], list[str]]:
+        meals:list[str] = []
+        labels:list[str] = []
+        for entry in entries:
+            Menu._collectKeywords(meals, labels, entry)
+        return meals, labels
+
+    @staticmethod
+    def _entryTexts(entries:list[MenuEntry]) -> list[str]:
+        # searchable text of each entry, as its line in the readable day menu
+        return [f"{entry['label']}: {entry['dish']}" if entry.get("label") else entry["dish"] for entry in entries if entry.get("dish")]
+
+    def _indexDay(self, isodate:str, entries:list[MenuEntry] | None, staged:bool = False):
+        if not entries:
+            self._keywordIndex.removeDay(isodate)
+            self._searchIndex.removeDay(isodate)
+            return
+        try:
+            date.fromisoformat(isodate)
+        except ValueError:
+            return
+        keywords = self._stagedKeywords.get(isodate) if staged else None
+        self._keywordIndex.setDay(isodate, *(keywords or self._entryKeywords(entries)))
+        self._searchIndex.setDay(isodate, self._entryTexts(entries))
+
+    def _updateKeywordIndex(self, merged:MenuData, touched:set[str], removed:set[str]):
+        if self._indexedMenu is not self._menu:
+            # index does not follow the current menu (first load, or _menu was replaced directly)
+            self._keywordIndex.clear()
+            self._searchIndex.clear()
+            touched = set(merged)
+        for isodate in removed:
+            self._indexDay(isodate, None)
+        for isodate in touched:
+            self._indexDay(isodate, merged[isodate], staged=True)
+        self._indexedMenu = merged
+        self._stagedKeywords = {}
+
+    def _getKeywordIndex(self) -> KeywordIndex:
+        if self._indexedMenu is not self._menu:
+            self._keywordIndex.clear()
+            self._searchIndex.clear()
+            for isodate, entries in self._menu.items():
+                self._indexDay(isodate, entries)
+            self._indexedMenu = self._menu
+        return self._keywordIndex
+
+    def searchDishes(self, query:str, start:date | None = None, end:date | None = None) -> dict[str, list[str]]:
+        # matching dish texts by iso date within start..end (inclusive, open ended if None)
+        self._getKeywordIndex()  # brings the search index up to date with the menu as well
+        return self._searchIndex.search(query, start.isoformat() if start else None, end.isoformat() if end else None)
+
     def getReadableDayMenu(self, d:date | str) -> str:
         
         isodate = str if isinstance(d, str) else d.isoformat()
@@ -236,87 +487,40 @@ class Menu(ABC):
         # get meal and label keywords that can be used for filtering
         no_results_info = "No filtering keyword results found in menu data. See logs for more info."
 
-        if not self._menu:
+        index = self._getKeywordIndex()
+        if not len(index):
             return {
                 "meals": [],
                 "labels": [],
                 "info": no_results_info,
             }
 
-        entries_by_date: dict[date, list[MenuEntry]] = {}
-        for iso, entries in self._menu.items():
-            if not entries:
-                continue
-            try:
-                entry_date = date.fromisoformat(iso)
-            except ValueError:
-                continue
-            entries_by_date[entry_date] = entries
-
-        if not entries_by_date:
-            return {
-                "meals": [],
-                "labels": [],
-                "info": no_results_info,
-            }
-
-        def collect_keywords(entries: list[MenuEntry]) -> tuple[list[str], list[str]]:
-            meals: list[str] = []
-            labels: list[str] = []
-            seen_meals: set[str] = set()
-            seen_labels: set[str] = set()
-
-            for entry in entries:
-                meal = normalizeString(entry.get("meal") or "")
-                if meal and meal not in seen_meals:
-                    meals.append(meal)
-                    seen_meals.add(meal)
-
-                label = normalizeString(entry.get("label") or "")
-                if label and label not in seen_labels:
-                    labels.append(label)
-                    seen_labels.add(label)
-
-            return meals, labels
-
-        def collect_all_keywords() -> tuple[set[str], set[str]]:
-            all_meals: set[str] = set()
-            all_labels: set[str] = set()
-            for entries in entries_by_date.values():
-                day_meals, day_labels = collect_keywords(entries)
-                all_meals.update(day_meals)
-                all_labels.update(day_labels)
-            return all_meals, all_labels
-
-        def first_with_signal(dates: list[date]) -> tuple[date | None, list[str], list[str]]:
+        def first_with_signal(dates: list[str]) -> tuple[str | None, list[str], list[str]]:
             for d in dates:
-                day_meals, day_labels = collect_keywords(entries_by_date[d])
+                day_meals, day_labels = index.dayKeywords(d)
                 if day_meals or day_labels:
-                    return d, day_meals, day_labels
+                    return d, list(day_meals), list(day_labels)
             return None, [], []
 
-        today = reference_date or date.today()
-        meals: list[str] = []
-        labels: list[str] = []
+        today = (reference_date or date.today()).isoformat()
+        dates = index.dates()
+        split = bisect_left(dates, today)
 
-        future_dates = sorted(d for d in entries_by_date if d >= today)
-        past_dates = sorted((d for d in entries_by_date if d < today), reverse=True)
-
-        chosen_date, meals, labels = first_with_signal(future_dates)
+        chosen_date, meals, labels = first_with_signal(dates[split:])
         if not chosen_date:
-            chosen_date, meals, labels = first_with_signal(past_dates)
+            chosen_date, meals, labels = first_with_signal(dates[:split][::-1])
 
-        all_meals, all_labels = collect_all_keywords()
-        extra_meals = sorted(m for m in all_meals if m not in meals)
-        extra_labels = sorted(l for l in all_labels if l not in labels)
+        extra_meals = sorted(m for m in index.meals() if m not in meals)
+        extra_labels = sorted(l for l in index.labels() if l not in labels)
         warning = ""
 
         if extra_meals or extra_labels:
             log.warning(
                 "Summary filter discovery: additional keywords found outside chosen day "
-                "(extra_meals=%s extra_labels=%s)",
+                "(extra_meals=%s extra_labels=%s first_seen=%s)",
                 extra_meals,
                 extra_labels,
+                {k: index.firstSeen(k) for k in (*extra_meals, *extra_labels)},
             )
             warning = " Warning: other days include additional meals/labels; discovery may be incomplete. See logs for details."
 
@@ -336,6 +540,19 @@ class Menu(ABC):
 
     def setSummaryFilters(self, raw_config: dict | None):
         self._dayFilter = DayFilter(raw_config)
+        self._filterVersion += 1
+
+    @property
+    def filterVersion(self) -> int:
+        # bumped by setSummaryFilters, summaries rendered under an older version are stale
+        return self._filterVersion
+
+    def setWeeks(self, weeks:int):
+        # number of ISO weeks in the horizon, a change invalidates the cached menu
+        weeks = max(1, int(weeks))
+        if weeks != self._weeks:
+            self._weeks = weeks
+            self.last_menu_fetch = None
 
     def getReadableDaySummary(self, d:date, filtered:bool = True) -> str:
 
@@ -359,10 +576,28 @@ class Menu(ABC):
 
         return self._defaultReadableDaySummary(entries) or ""
 
-    def getDayMenu (self, d:date | str) -> list[MenuEntry]:
+    def getReadableDaySummaries(self, days:list[date], filtered:bool = True) -> dict[str, str]:
+        # same as getReadableDaySummary per day, filtered in one DayFilter pass, days without menu are left out
+        menu:MenuData = {d.isoformat(): self._menu[d.isoformat()] for d in days if d.isoformat() in self._menu}
+
+        if self._readableDaySummaryCB:
+            return {isodate: self.getReadableDaySummary(date.fromisoformat(isodate), filtered) for isodate in menu}
+
+        if filtered and self._dayFilter:
+            menu = self._dayFilter.filter_many(menu)["days"]
+
+        return {isodate: self._defaultReadableDaySummary(entries) or "" for isodate, entries in menu.items()}
+
+    def getDayMenu(self, d:date | str) -> list[MenuEntry]:
         isodate = str if isinstance(d, str) else d.isoformat()
         return self._menu.get(isodate, None)
 
+    def getDays(self, start:date | None = None, end:date | None = None) -> MenuData:
+        # cached days within start..end (inclusive, open ended if None), never fetches
+        first = start.isoformat() if start else ""
+        last = end.isoformat() if end else "9999"
+        return {isodate: entries for isodate, entries in sorted(self._menu.items()) if first <= isodate <= last}
+
     def getReadableTodaySummary(self) -> str:
         return self.getReadableDaySummary(date.today())
 
@@ -433,19 +668,58 @@ class Menu(ABC):
 
             menu[isodate].append(entry)
 
-    async def _parse_feed(self, raw_feed):
+            # stage the day's discovery keywords while the entry is at hand
+            self._collectKeywords(*self._stagedKeywords.setdefault(isodate, ([], [])), entry)
 
-        def parse_helper(raw_feed):
-            return feedparser.parse(raw_feed)
+    async def _readBody(self, response, contentTypes:tuple[str, ...] | None = None) -> bytes:
+        """
+        Streams the response body, aborting before anything is buffered when the declared
+        length or content type is wrong, and as soon as MAX_BODY_BYTES is passed.
+        contentTypes are substrings of the accepted content types, None accepts any.
+        """
+        limit = self.MAX_BODY_BYTES
+        if response.content_length is not None and response.content_length > limit:
+            raise ValueError(f"Response too large: {response.content_length} bytes (max {limit})")
+
+        if contentTypes and "Content-Type" in response.headers:
+            contentType = response.content_type
+            if not any(t in contentType for t in contentTypes):
+                raise ValueError(f"Unexpected content type: {contentType}")
+
+        chunks = []
+        size = 0
+        async for chunk in response.content.iter_chunked(self._READ_CHUNK_BYTES):
+            size += len(chunk)
+            if size > limit:
+                raise ValueError(f"Response too large: more than {limit} bytes")
+            chunks.append(chunk)
+
+        self._bytesRead += size
+        return b"".join(chunks)
+
+    async def _fetchBody(self, aiohttp_session, url:str, contentTypes:tuple[str, ...] | None = None, **kwargs) -> bytes:
+        kwargs.setdefault("raise_for_status", True)
+        async with aiohttp_session.get(url, **kwargs) as response:
+            return await self._readBody(response, contentTypes)
+
+    async def _fetchText(self, aiohttp_session, url:str, contentTypes:tuple[str, ...] | None = None, **kwargs) -> str:
+        kwargs.setdefault("raise_for_status", True)
+        async with aiohttp_session.get(url, **kwargs) as response:
+            body = await self._readBody(response, contentTypes)
+            return self._decodeText(body, response.charset)
+
+    @staticmethod
+    def _decodeText(body:bytes, charset:str | None) -> str:
+        # the declared charset, else utf-8; pages with no or a wrong charset are often latin-1 here,
+        # cp1252 reads those (and never fails with errors="replace")
+        try:
+            return body.decode(charset or "utf-8")
+        except (LookupError, UnicodeDecodeError):
+            return body.decode("cp1252", errors="replace")
+
+    async def _fetchJson(self, aiohttp_session, url:str, **kwargs) -> Any:
+        return decodeJson(await self._fetchBody(aiohttp_session, url, self.JSON_CONTENT_TYPES, **kwargs))
 
-        data = await self.asyncExecutor(parse_helper, raw_feed)
-        if data.get("bozo"): # feedparser sets bozo=1 if not cleanly parsed, but records could still exist
-            bozo_exception = data.get("bozo_exception")
-            if not data.get("entries"):
-                raise ValueError(f"RSS parsing failed: {bozo_exception}")
-            log.warning("RSS not cleanly parsed, but entries exist: %s", bozo_exception)
-        return data
-    
     def _createMenuEntry (self, order: int, meal_raw: str | None, dish_raw: str, label: str | None) -> MenuEntry:
 
         return  {
@@ -469,579 +743,11 @@ class Menu(ABC):
             log.info(json.dumps(data, indent=4, ensure_ascii=False))
 
 
-class FoodItMenu(Menu):
-
-    provider = "foodit.se"
-
-    def __init__(self, 
-                 asyncExecutor, url:str, 
-                 customMenuEntryProcessorCB: Callable | None = None, 
-                 readableDaySummaryCB: Callable | None = None
-            ):
-
-        super().__init__(asyncExecutor, url, customMenuEntryProcessorCB, readableDaySummaryCB)
-
-    def _fixUrl(self, url:str) -> str:
-
-        if "foodit.se/rss" not in url:
-            url = url.replace("foodit.se", "foodit.se/rss")
-        return url
-
-    async def _getFeed(self, aiohttp_session):       
-        
-        # returns only one week at the time
-        weekMenus = []
-        for week in range(self._weeks):
-            rss = re.sub(r'\&w=[0-9]*\&', f"&w={week}&", self.url)
-            async with aiohttp_session.get(rss) as response:
-                
-                # Offload feedparser.parse to an executor
-                raw_feed = await response.text()
-                parsed_feed = await self._parse_feed(raw_feed)
-                weekMenus.append(parsed_feed)                
-    
-        feed = weekMenus.pop(0)
-        for f in weekMenus:
-            feed["entries"].extend(f["entries"])
-
-        return feed
-
-    def _processMenuEntry(self, entryDate, order:int, raw_entry:Any) -> MenuEntry:
-        if entry := super()._processMenuEntry(entryDate, order, raw_entry):
-            return entry
-        
-        return self._createMenuEntry (order, "Lunch", raw_entry, f"Alt {order}")
-
-    async def _loadMenu(self, aiohttp_session) -> MenuData:
-
-        menuFeed = await self._getFeed(aiohttp_session)
-        self._dumpData(menuFeed)
-
-        menu:MenuData = {}
-
-        for day in menuFeed["entries"]:
-
-            entryDate = datetime.strptime(day["title"].split()[1], "%Y%m%d").date()
-            coursesList = [s.strip() for s in day['summary'].split(':') if s]
-            courseNo = 1
-            for course in coursesList:
-                menuEntry = self._processMenuEntry (entryDate, courseNo, course)
-                self._addMenuEntry(menu, entryDate, menuEntry)
-                courseNo = courseNo + 1
-
-        return menu
-
-class MateoMenu(Menu):
-
-    provider = "mateo.se"
-
-    def __init__(self, 
-                 asyncExecutor, url:str, 
-                 customMenuEntryProcessorCB: Callable | None = None, 
-                 readableDaySummaryCB: Callable | None = None
-            ):
-
-        super().__init__(asyncExecutor, url, customMenuEntryProcessorCB, readableDaySummaryCB)
-        self.headers = {
-            "Content-Type": "application/json",
-            "Accept": "application/json", 
-            "Referer": f"https://{self.provider}/",
-            }
-        
-    def _fixUrl(self, url: str) -> str:
-
-        parsed = urlparse(url)
-        id = parsed.path.rstrip("/").split("/")[-1]
-
-        if not id.isdigit():
-            raise ValueError("school id could not be extracted from url")
-
-        newUrl = "https://meny-api.mateo.se/api/v1/days/" + id
-        return newUrl
-
-    async def _fetchMenu (self, aiohttp_session, startDate:date, endDate:date):
-
-        url = f"{self.url}?from={startDate.isoformat()}&to={endDate.isoformat()}"
-        async with aiohttp_session.get(url, headers=self.headers, raise_for_status=True) as response:
-            html = await response.text()
-            return json.loads(html)
-
-
-    def _processMenuEntry(self, entryDate, order:int, raw_entry:Any) -> MenuEntry:
-        if entry := super()._processMenuEntry(entryDate, order, raw_entry):
-            return entry
-
-        if raw_entry["labels"]:
-            label = ", ".join(label["name"].strip() for label in raw_entry["labels"])
-        else:
-            label = raw_entry["type"]
-
-        return self._createMenuEntry (order, "Lunch", raw_entry["name"], label)
-
-    async def _loadMenu(self, aiohttp_session) -> MenuData:
-
-        today = date.today()
-        firstDay = today - timedelta(days=today.weekday())
-        if today.weekday() >= 5:
-           firstDay += timedelta(days=7)
-
-        dayEntries = await self._fetchMenu(aiohttp_session, startDate=firstDay, endDate=(firstDay + timedelta(days=14)))
-
-        self._dumpData(dayEntries)
-        menu:MenuData = {}
-
-        for day in dayEntries:
-            entryDate = parser.isoparse(day["date"]).date()
-            courseNo = 1
-            for course in day["meals"]:
-                menuEntry = self._processMenuEntry (entryDate, courseNo, course)
-                self._addMenuEntry(menu, entryDate, menuEntry)
-                courseNo = courseNo + 1
-        return menu
-
-class SkolmatenMenu(Menu):
-
-    provider = "skolmaten.se"
-
-
-    def __init__(self, 
-                 asyncExecutor, url:str, 
-                 customMenuEntryProcessorCB: Callable | None = None, 
-                 readableDaySummaryCB: Callable | None = None
-            ):
-
-        super().__init__(asyncExecutor, url, customMenuEntryProcessorCB, readableDaySummaryCB)
-        self.headers = {
-            "Content-Type": "application/json",
-            "Accept": "application/json", 
-            "Referer": f"https://{self.provider}/",
-            "client-token": "web-eaa12e50-c84c-4b4a-9cfe-4e3fcbcd9165"
-            }
-
-
-    def _fixUrl(self, url: str) -> str:
-
-        parsed = urlparse(url)
-        schoolName = parsed.path.lstrip("/")
-
-        if schoolName is None:
-            raise ValueError("school name could not be extracted from url")
-
-
-        newUrl = "https://skolmaten.se/api/4/menu/school/" + schoolName
-        return newUrl
-
-    async def _getWeek(self, aiohttp_session, url):
-
-        def remove_images(obj):
-            if isinstance(obj, dict):
-                return {k: remove_images(v) for k, v in obj.items() if k != "image"}
-            elif isinstance(obj, list):
-                return [remove_images(i) for i in obj]
-            return obj
-
-        async with aiohttp_session.get(url, headers=self.headers, raise_for_status=True) as response:
-            html = await response.text()
-            return json.loads(html, object_hook=remove_images)
-
-    def _processMenuEntry(self, entryDate, order:int, raw_entry:Any) -> MenuEntry:
-        if entry := super()._processMenuEntry(entryDate, order, raw_entry):
-            return entry
-
-        labels = [a["sv"] for a in raw_entry["MealAttributes"]]
-        label = ", ".join(labels)
-
-        return self._createMenuEntry (order, "Lunch", raw_entry["name"], label)
-
-    async def _loadMenu(self, aiohttp_session) -> MenuData:
-
-            weekOffset = 0 if date.today().weekday() < 5 else 1
-            thisWeek  = self._getWeekNumber (0 + weekOffset)
-            nextWeek  = self._getWeekNumber (1 + weekOffset)
-
-            w1Url = f"{self.url}?year={thisWeek[0]}&week={thisWeek[1]}"
-            w2Url = f"{self.url}?year={nextWeek[0]}&week={nextWeek[1]}"
-
-            w1 = await self._getWeek(aiohttp_session, w1Url)
-            w2 = await self._getWeek(aiohttp_session, w2Url)
-  
-            dayEntries = [
-                *(w1["WeekState"]["Days"] if isinstance(w1.get("WeekState"), dict) else []),
-                *(w2["WeekState"]["Days"] if isinstance(w2.get("WeekState"), dict) else [])
-            ]
-
-            self._dumpData(dayEntries)
-            menu:MenuData = {}
-
-            for day in dayEntries:
-                entryDate = parser.isoparse(day["date"]).date()
-                courseNo = 1
-                for course in day["Meals"]:
-                    menuEntry = self._processMenuEntry (entryDate, courseNo, course)
-                    self._addMenuEntry(menu, entryDate, menuEntry)
-                    courseNo = courseNo + 1
-            return menu
-
-
-
-class MatildaMenu (Menu):
-    provider = "menu.matildaplatform.com"
-
-    def __init__(self, 
-                 asyncExecutor, url:str, 
-                 customMenuEntryProcessorCB: Callable | None = None, 
-                 readableDaySummaryCB: Callable | None = None
-            ):
-        
-        super().__init__(asyncExecutor, url, customMenuEntryProcessorCB, readableDaySummaryCB)
-        self.headers = {"user-agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/99.0.4844.82 Safari/537.36"}
-
-
-    def _fixUrl(self, url: str) -> str:
-        return url
-
-    async def _getWeek(self, aiohttp_session, url):
-        async with aiohttp_session.get(url, headers=self.headers, raise_for_status=True) as response:
-            html = await response.text()
-            soup = BeautifulSoup(html, 'html.parser')
-            jsonData = soup.select("#__NEXT_DATA__")[0].string
-            return json.loads(jsonData)["props"]["pageProps"]
-
-    def _processMenuEntry(self, entryDate, order:int, raw_entry:Any) -> MenuEntry:
-        if entry := super()._processMenuEntry(entryDate, order, raw_entry):
-            return entry
-
-        return self._createMenuEntry (order, raw_entry["mealName"], raw_entry["name"], raw_entry["optionName"])
-    
-    async def _loadMenu(self, aiohttp_session):
-
-        w1 = await self._getWeek(aiohttp_session, self.url)
-        w2 = await self._getWeek(aiohttp_session, "https://menu.matildaplatform.com" + w1["nextURL"])
-
-        mealEntries = [*w1["meals"], *w2["meals"]]
-
-        self._dumpData(mealEntries)
-
-        menu:MenuData = {}
-
-        mealNo = 1
-        lastDate = None
-
-        for meal in mealEntries:
-            
-            entryDate = datetime.strptime(meal["date"], "%Y-%m-%dT%H:%M:%S").date() # 2023-06-02T00:00:00
-
-            if lastDate and lastDate != entryDate:
-                mealNo = 1
-            lastDate = entryDate
-
-            name = meal["name"] if meal["name"] is not None else f"Måltid {mealNo}"
-            mealNo += 1
-            courseNo = 1
-
-            for course in meal["courses"]:
-                # add the meal name to each course
-                course["mealName"] = name
-                menuEntry = self._processMenuEntry (entryDate, courseNo, course)
-                self._addMenuEntry(menu, entryDate, menuEntry)
-                courseNo += 1
-
-        return menu
-
-
-# Beeing absorbed by matildaplatform it seems, but still same format, just domain change
-# mpi.mashie.com (migrating to mpi.mashie.matildaplatform.com)
-# sodex.mashie.com (migrating to sodex.mashie.matildaplatform.com)
-class MashieMenu(Menu):
-
-    provider = "mashie"
-
-    def __init__(self, 
-                 asyncExecutor, url:str, 
-                 customMenuEntryProcessorCB: Callable | None = None, 
-                 readableDaySummaryCB: Callable | None = None
-        ):
-        
-        super().__init__(asyncExecutor, url, customMenuEntryProcessorCB, readableDaySummaryCB)
-        self._NO_MENU_MESSAGE = "ingen matsedel"
-        # important to set user-agent, otherwise site does not return the json data
-        self.headers = {"user-agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/99.0.4844.82 Safari/537.36",
-                        "cookie": "cookieLanguage=sv-SE"} # set page lang to Swe
- 
-    def _fixUrl(self, url:str) -> str:
-        # observed variants:
-        #   mpi.mashie.com/public/app/Laholms%20kommun/a326a379
-        #   sodexo.mashie.com/public/app/Akademikrogen%20skolor/d47bc6bf
-        #
-        #  all subdomains seem to have a corresponding ../menu/.. url to the ../app/..
-        #  the ../menu/.. page contains json data for the menu, so use that instead of scraping the page
-
-        if "/app/" in url:
-            url = url.replace("/app/", "/menu/")
-
-        # mashie.com => mashie.matildaplatform.com
-        if "mashie.com" in url:
-            url = url.replace("mashie.com", "mashie.matildaplatform.com")
-
-        return url
-
-    def _processMenuEntry(self, entryDate, order:int, raw_entry:Any) -> MenuEntry:
-        if entry := super()._processMenuEntry(entryDate, order, raw_entry):
-            return entry
-
-        return self._createMenuEntry (order=order, 
-                                      meal_raw=raw_entry["MenuAlternativeName"],
-                                      dish_raw=raw_entry["DayMenuName"],
-                                      label=None)
-
-    async def _loadMenu(self, aiohttp_session):
-
-        def preserveTs(m):
-            return re.sub(r"\D", "", m.group(0))
-
-        se = await self.asyncExecutor(tz.gettz, "Europe/Stockholm")
-
-        async with aiohttp_session.get(self.url, headers=self.headers, raise_for_status=True) as response:
-            html = await response.text()
-
-        soup = BeautifulSoup(html, 'html.parser')
-        scriptTag = soup.select_one("script")
-        if scriptTag is None:
-
-            if soup.find("h2", string=lambda s: s and self._NO_MENU_MESSAGE in s.lower()):
-                log.info("No menu available (holiday/weekend) for %s", self.url)
-                return
-
-            raise ValueError("Malformatted/unexpected data")
-        
-        jsonData = scriptTag.string
-        # discard javascript variable assignment, weekMenues = {...
-        jsonData = jsonData[jsonData.find("{") - 1:]
-        # replace javascipt dates (new Date(1234567...) with only the ts
-        jsonData = re.sub(r"new Date\([0-9]+\)", preserveTs, jsonData)
-        # json should be fine now
-        data = json.loads(jsonData)
-
-        self._dumpData(data)
-
-        menu:MenuData = {}
-
-        for week in data["Weeks"][:2]: # [:2] slice two weeks
-            for day in week["Days"]:
-                entryDate = datetime.fromtimestamp(day["DayMenuDate"] / 1000, timezone.utc)
-                entryDate = entryDate.astimezone(tz=se).date()
-
-                courseNo = 1
-                for course in day["DayMenus"]:
+def __getattr__(name: str):
+    # provider classes moved to providers/, keep "from menu import MateoMenu" working
+    from .providers import getProviderClassByName
 
-                    menuEntry = self._processMenuEntry (entryDate, courseNo, course)
-                    self._addMenuEntry(menu, entryDate, menuEntry)
-                    courseNo += 1
-
-        return menu
-
-
-class SkolmatInfoMenu(Menu):
-
-    provider = "meny.skolmat.info"
-
-    def __init__(self,
-                 asyncExecutor, url:str,
-                 customMenuEntryProcessorCB: Callable | None = None,
-                 readableDaySummaryCB: Callable | None = None
-            ):
-
-        super().__init__(asyncExecutor, url, customMenuEntryProcessorCB, readableDaySummaryCB)
-        self.headers = {
-            "user-agent": (
-                "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                "AppleWebKit/537.36 (KHTML, like Gecko) "
-                "Chrome/99.0.4844.82 Safari/537.36"
-            ),
-        }
-
-    def _fixUrl(self, url: str) -> str:
-        url = url.strip().rstrip("/")
-        if not url.startswith(("http://", "https://")):
-            url = f"https://{url}"
-
-        parsed = urlparse(url)
-        if not parsed.netloc or self.provider not in parsed.netloc:
-            raise ValueError("Skolmat.info URL must target meny.skolmat.info")
-
-        if not parsed.path:
-            raise ValueError("school path could not be extracted from url")
-
-        return f"{parsed.scheme}://{parsed.netloc}{parsed.path}".rstrip("/")
-
-    def _processMenuEntry(self, entryDate, order:int, raw_entry:Any) -> MenuEntry:
-        if entry := super()._processMenuEntry(entryDate, order, raw_entry):
-            return entry
-
-        return self._createMenuEntry(
-            order=order,
-            meal_raw="Lunch",
-            dish_raw=raw_entry.get("dish", ""),
-            label=raw_entry.get("label"),
-        )
-
-    async def _getWeek(self, aiohttp_session, year:int, week:int) -> str:
-        url = f"{self.url}?year={year}&week={week}"
-        async with aiohttp_session.get(url, headers=self.headers, raise_for_status=True) as response:
-            return await response.text()
-
-    def _parseWeekHtml(self, html_data: str) -> MenuData:
-        soup = BeautifulSoup(html_data, "html.parser")
-        menu:MenuData = {}
-
-        for time_tag in soup.find_all("time", attrs={"datetime": True}):
-            try:
-                entryDate = parser.isoparse(time_tag["datetime"]).date()
-            except Exception:
-                continue
-
-            day_info = time_tag.find_parent("div")
-            day_block = day_info.parent if day_info and day_info.parent else None
-            if not day_block:
-                continue
-
-            course_group = day_info.find_next_sibling("div")
-            if not course_group:
-                continue
-
-            courseNo = 1
-            for course in course_group.find_all("div", class_="space-y-2", recursive=False):
-                prose = course.find("div", class_=lambda c: c and "prose" in c)
-                dish = prose.get_text(" ", strip=True) if prose else ""
-
-                labels = []
-                for label_node in course.find_all("span", class_=lambda c: c and "text-sm" in c):
-                    value = normalizeString(label_node.get_text(" ", strip=True))
-                    if value and value not in labels:
-                        labels.append(value)
-
-                raw_entry = {
-                    "dish": dish,
-                    "label": ", ".join(labels) if labels else None,
-                }
-
-                menuEntry = self._processMenuEntry(entryDate, courseNo, raw_entry)
-                self._addMenuEntry(menu, entryDate, menuEntry)
-                courseNo += 1
-
-        return menu
-
-    async def _loadMenu(self, aiohttp_session) -> MenuData:
-        weekOffset = 0 if date.today().weekday() < 5 else 1
-        menu:MenuData = {}
-
-        for offset in range(self._weeks):
-            week_data = self._getWeekNumber(weekOffset + offset)
-            html_data = await self._getWeek(aiohttp_session, year=week_data[0], week=week_data[1])
-            parsed_week = self._parseWeekHtml(html_data)
-            for isodate, entries in parsed_week.items():
-                menu.setdefault(isodate, []).extend(entries)
-
-        return menu
-
-
-
-class MenuGoMenu(Menu):
-
-    provider = "menugo.se"
-
-    def __init__(self, 
-                 asyncExecutor, url:str, 
-                 customMenuEntryProcessorCB: Callable | None = None, 
-                 readableDaySummaryCB: Callable | None = None
-            ):
-
-        super().__init__(asyncExecutor, url, customMenuEntryProcessorCB, readableDaySummaryCB)
-        self.headers = {
-            "Content-Type": "application/json",
-            "Accept": "application/json", 
-            "Referer": f"https://{self.provider}/",
-            }
-
-    def _fixUrl(self, url: str) -> str:
-
-        # https://menugo.se/m/0127/Bjorkstugan ->
-        # https://menugo.se/FetchTheMenu/{"Kommunkod":"0127","LänkNamn":"Bjorkstugan"} ->
-        # https://menugo.se/FetchTheMenu/%7B%22Kommunkod%22%3A%220127%22%2C%22L%C3%A4nkNamn%22%3A%22Kungstappan%22%7D
-
-        parsed = urlparse(url.strip())
-        parts = parsed.path.strip("/").split("/")
-
-        # Expected: ["m", "0127", "Bjorkstugan"]
-        if len(parts) < 3 or parts[0] != "m":
-            raise ValueError(f"Unexpected Menugo URL format: {parsed.path}")
-
-        uri = {
-            "Kommunkod": parts[1],
-            "LänkNamn": parts[2]
-        }
-        encoded = quote(json.dumps(uri, ensure_ascii=False), safe="")
-        url = f"https://menugo.se/FetchTheMenu/{encoded}"
-
-        return url
-    
-
-    async def _fetchMenu (self, aiohttp_session):
-
-        # no date/range arguments in the uri, seems to return a fixed range of weeks, so just fetch and parse
-        async with aiohttp_session.get(self.url, headers=self.headers, raise_for_status=True) as response:
-            html = await response.text()
-            data = json.loads(html)
-            return data["CacheObjekt"]
-
-    def _processMenuEntry(self, entryDate, order:int, raw_entry:Any) -> MenuEntry:
-        if entry := super()._processMenuEntry(entryDate, order, raw_entry):
-            return entry
-
-        label = None
-        if raw_entry["Matgrupp"]:
-            label = ", ".join(raw_entry["Matgrupp"])
-
-        dish = raw_entry["Namn"].strip()
-
-        if dish == "Meny saknad för denna dag.":
-            return None
-
-        meal = None
-        if dish.lower().startswith("lunch:"):
-            meal = "Lunch"
-            dish = dish[len(meal) + 1:].lstrip()
-        elif dish.lower().startswith("middag:"):
-            meal = "Middag"
-            dish = dish[len(meal) + 1:].lstrip()
-
-        return self._createMenuEntry (order, meal, dish, label)
-
-    async def _loadMenu(self, aiohttp_session) -> MenuData:
-
-        today = date.today()
-        firstDay = today - timedelta(days=today.weekday())
-        if today.weekday() >= 5:
-           firstDay += timedelta(days=7)
-
-        endDate = firstDay + timedelta(days=14) 
-
-        data = await self._fetchMenu(aiohttp_session)
-        dayEntries = data.get("DatumObjekt", [])
-
-        self._dumpData(dayEntries)
-        menu:MenuData = {}
-
-        for day in dayEntries:
-            entryDate = parser.isoparse(day["Datum"]).date()
-            if entryDate > endDate:
-                break
-
-            courseNo = 1
-            for course in day["Maträtt"]:
-                menuEntry = self._processMenuEntry (entryDate, courseNo, course)
-                if menuEntry:
-                    self._addMenuEntry(menu, entryDate, menuEntry)
-                    courseNo = courseNo + 1
-        
-        return menu
+    menuClass = getProviderClassByName(name)
+    if menuClass is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return menuClass
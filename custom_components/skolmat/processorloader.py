@@ -0,0 +1,92 @@
+"""Shared loader for custom menu processors under processors/."""
+
+from __future__ import annotations
+
+import importlib
+import importlib.util
+import logging
+import sys
+from collections.abc import Callable
+from pathlib import Path
+from types import ModuleType
+
+from homeassistant.core import HomeAssistant
+
+_LOGGER = logging.getLogger(__name__)
+
+PROCESSORS_DIR = Path(__file__).resolve().parent / "processors"
+
+# processor file path -> (mtime_ns, module), shared by all entries and flow steps
+_MODULE_CACHE: dict[str, tuple[int, ModuleType]] = {}
+
+
+def _import_processor_module(processor_path: Path) -> ModuleType:
+    """Import a processor module, reusing the cached module while the file is unchanged."""
+    mtime = processor_path.stat().st_mtime_ns
+    key = str(processor_path)
+    cached = _MODULE_CACHE.get(key)
+    if cached and cached[0] == mtime:
+        return cached[1]
+
+    try:
+        menu_module = importlib.import_module("custom_components.skolmat.menu")
+        sys.modules.setdefault("menu", menu_module)
+    except Exception:
+        pass
+
+    module_name = f"custom_components.skolmat.processors.{processor_path.stem}"
+    if cached:
+        _LOGGER.info("Processor file changed, re-importing: %s", module_name)
+    sys.modules.pop(module_name, None)
+    # loaded from the path checked above rather than looked up by name on the package path
+    spec = importlib.util.spec_from_file_location(module_name, processor_path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        sys.modules.pop(module_name, None)
+        raise
+
+    _MODULE_CACHE[key] = (mtime, module)
+    return module
+
+
+async def async_load_processor(
+    hass: HomeAssistant,
+    processor_file: str | None,
+    processor_fn: str | None,
+) -> tuple[Callable | None, str | None]:
+    """Return (processor, error), error being a config flow error key or None."""
+    if not processor_file and not processor_fn:
+        return None, None
+    if not processor_file or not processor_fn:
+        return None, "processor_missing_fields"
+
+    filename = processor_file.strip()
+    if not filename:
+        return None, "processor_missing_fields"
+    if not filename.endswith(".py"):
+        filename = f"{filename}.py"
+
+    processor_path = PROCESSORS_DIR / filename
+    if not await hass.async_add_executor_job(processor_path.exists):
+        _LOGGER.info("Processor file not found: %s", processor_path)
+        return None, "processor_file_missing"
+
+    try:
+        module = await hass.async_add_executor_job(_import_processor_module, processor_path)
+    except Exception as exc:
+        _LOGGER.info("Processor import failed: file=%s error=%s", processor_path.name, exc)
+        return None, "processor_import_failed"
+
+    processor = getattr(module, processor_fn.strip(), None)
+    if not callable(processor):
+        _LOGGER.info(
+            "Processor function missing/not callable: module=%s fn=%s",
+            module.__name__,
+            processor_fn,
+        )
+        return None, "processor_fn_missing"
+
+    return processor, None
@@ -64,7 +64,7 @@
 
 '''
 
-from menu import MenuEntry, normalizeString
+from menu import MenuEntry, normalizeString, batchProcessor
 from datetime import date
 from logging import getLogger
 import json
@@ -89,4 +89,20 @@ def entryProcessor( entryDate: date, order:int, raw_entry) -> MenuEntry:
         entry["meal"] = "Lunch"
         entry["label"] = normalizeString(raw_entry["mealName"])
 
-    return entry
\ No newline at end of file
+    return entry
+
+
+@batchProcessor
+def dayProcessor(entryDate: date, raw_entries: list) -> list[MenuEntry]:
+
+    # Batch variant of entryProcessor, set processor_fn to dayProcessor to use it.
+    # With the whole day at hand, the folded alternatives get a running order within Lunch
+    # instead of all being order 1 in their own (misused) meal.
+
+    entries = [entryProcessor(entryDate, 0, raw_entry) for raw_entry in raw_entries]
+    orders: dict[str, int] = {}
+    for entry in entries:
+        orders[entry["meal"]] = orders.get(entry["meal"], 0) + 1
+        entry["order"] = orders[entry["meal"]]
+
+    return entries
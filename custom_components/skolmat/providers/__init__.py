@@ -0,0 +1,42 @@
+"""Menu provider registry.
+
+Provider modules are imported on first use, so parser libraries (feedparser,
+BeautifulSoup, dateutil) are only loaded when a provider that needs them is configured.
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ..menu import Menu
+
+# (provider url key, module, class), in url matching order
+PROVIDERS: list[tuple[str, str, str]] = [
+    ("skolmaten.se", "skolmaten", "SkolmatenMenu"),
+    ("foodit.se", "foodit", "FoodItMenu"),
+    ("menu.matildaplatform.com", "matilda", "MatildaMenu"),
+    ("mashie", "mashie", "MashieMenu"),
+    ("mateo.se", "mateo", "MateoMenu"),
+    ("meny.skolmat.info", "skolmatinfo", "SkolmatInfoMenu"),
+    ("menugo.se", "menugo", "MenuGoMenu"),
+]
+
+
+def _load(module: str, class_name: str) -> type[Menu]:
+    return getattr(importlib.import_module(f"{__name__}.{module}"), class_name)
+
+
+def getProviderClass(url: str) -> type[Menu] | None:
+    for provider, module, class_name in PROVIDERS:
+        if provider in url:
+            return _load(module, class_name)
+    return None
+
+
+def getProviderClassByName(class_name: str) -> type[Menu] | None:
+    for _, module, name in PROVIDERS:
+        if name == class_name:
+            return _load(module, class_name)
+    return None
@@ -0,0 +1,87 @@
+import re, asyncio, feedparser  # noqa: E401
+from datetime import datetime, date
+from logging import getLogger
+from collections.abc import Callable
+from typing import Any
+from ..menu import Menu, MenuData, MenuEntry
+
+log = getLogger(__name__)
+
+
+class FoodItMenu(Menu):
+
+    provider = "foodit.se"
+    FEED_CONTENT_TYPES = ("xml", "rss")
+
+    def __init__(self, 
+                 asyncExecutor, url:str, 
+                 customMenuEntryProcessorCB: Callable | None = None, 
+                 readableDaySummaryCB: Callable | None = None
+            ):
+
+        super().__init__(asyncExecutor, url, customMenuEntryProcessorCB, readableDaySummaryCB)
+
+    async def _parse_feed(self, raw_feed):
+
+        def parse_helper(raw_feed):
+            return feedparser.parse(raw_feed)
+
+        data = await self.asyncExecutor(parse_helper, raw_feed)
+        if data.get("bozo"): # feedparser sets bozo=1 if not cleanly parsed, but records could still exist
+            bozo_exception = data.get("bozo_exception")
+            if not data.get("entries"):
+                raise ValueError(f"RSS parsing failed: {bozo_exception}")
+            log.warning("RSS not cleanly parsed, but entries exist: %s", bozo_exception)
+        return data
+
+    def _fixUrl(self, url:str) -> str:
+
+        if "foodit.se/rss" not in url:
+            url = url.replace("foodit.se", "foodit.se/rss")
+        return url
+
+    async def _getFeed(self, aiohttp_session):       
+        
+        # returns only one week at the time, w is the week offset from the current week
+        firstWeek = 0 if date.today().weekday() < 5 else 1
+
+        async def getWeek(week:int):
+            rss = re.sub(r'\&w=[0-9]*\&', f"&w={week}&", self.url)
+            # feedparser detects the encoding from the raw bytes
+            raw_feed = await self._fetchBody(aiohttp_session, rss, self.FEED_CONTENT_TYPES, raise_for_status=False)
+
+            # Offload feedparser.parse to an executor
+            return await self._parse_feed(raw_feed)
+
+        weekMenus = list(await asyncio.gather(*(getWeek(firstWeek + w) for w in range(self._weeks))))
+
+        feed = weekMenus.pop(0)
+        for f in weekMenus:
+            feed["entries"].extend(f["entries"])
+
+        return feed
+
+    def _processMenuEntry(self, entryDate, order:int, raw_entry:Any) -> MenuEntry:
+        if entry := super()._processMenuEntry(entryDate, order, raw_entry):
+            return entry
+        
+        return self._createMenuEntry (order, "Lunch", raw_entry, f"Alt {order}")
+
+    async def _loadMenu(self, aiohttp_session) -> MenuData:
+
+        menuFeed = await self._getFeed(aiohttp_session)
+        self._dumpData(menuFeed)
+
+        menu:MenuData = {}
+        horizon = self.horizon
+
+        for day in menuFeed["entries"]:
+
+            entryDate = datetime.strptime(day["title"].split()[1], "%Y%m%d").date()
+            if not horizon.covers(entryDate):
+                continue
+            coursesList = [s.strip() for s in day['summary'].split(':') if s]
+            for menuEntry in self._processDayEntries(entryDate, coursesList):
+                self._addMenuEntry(menu, entryDate, menuEntry)
+
+        return menu
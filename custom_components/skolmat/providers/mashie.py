@@ -0,0 +1,100 @@
+import re
+from datetime import datetime, timezone
+from dateutil import tz
+from logging import getLogger
+from bs4 import BeautifulSoup
+from collections.abc import Callable
+from typing import Any
+from ..menu import Menu, MenuData, MenuEntry, decodeJson
+
+log = getLogger(__name__)
+
+
+# Beeing absorbed by matildaplatform it seems, but still same format, just domain change
+# mpi.mashie.com (migrating to mpi.mashie.matildaplatform.com)
+# sodex.mashie.com (migrating to sodex.mashie.matildaplatform.com)
+class MashieMenu(Menu):
+
+    provider = "mashie"
+
+    def __init__(self, 
+                 asyncExecutor, url:str, 
+                 customMenuEntryProcessorCB: Callable | None = None, 
+                 readableDaySummaryCB: Callable | None = None
+        ):
+        
+        super().__init__(asyncExecutor, url, customMenuEntryProcessorCB, readableDaySummaryCB)
+        self._NO_MENU_MESSAGE = "ingen matsedel"
+        # important to set user-agent, otherwise site does not return the json data
+        self.headers = {"user-agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/99.0.4844.82 Safari/537.36",
+                        "cookie": "cookieLanguage=sv-SE"} # set page lang to Swe
+ 
+    def _fixUrl(self, url:str) -> str:
+        # observed variants:
+        #   mpi.mashie.com/public/app/Laholms%20kommun/a326a379
+        #   sodexo.mashie.com/public/app/Akademikrogen%20skolor/d47bc6bf
+        #
+        #  all subdomains seem to have a corresponding ../menu/.. url to the ../app/..
+        #  the ../menu/.. page contains json data for the menu, so use that instead of scraping the page
+
+        if "/app/" in url:
+            url = url.replace("/app/", "/menu/")
+
+        # mashie.com => mashie.matildaplatform.com
+        if "mashie.com" in url:
+            url = url.replace("mashie.com", "mashie.matildaplatform.com")
+
+        return url
+
+    def _processMenuEntry(self, entryDate, order:int, raw_entry:Any) -> MenuEntry:
+        if entry := super()._processMenuEntry(entryDate, order, raw_entry):
+            return entry
+
+        return self._createMenuEntry (order=order, 
+                                      meal_raw=raw_entry["MenuAlternativeName"],
+                                      dish_raw=raw_entry["DayMenuName"],
+                                      label=None)
+
+    async def _loadMenu(self, aiohttp_session):
+
+        def preserveTs(m):
+            return re.sub(r"\D", "", m.group(0))
+
+        se = await self.asyncExecutor(tz.gettz, "Europe/Stockholm")
+
+        html = await self._fetchText(aiohttp_session, self.url, self.HTML_CONTENT_TYPES, headers=self.headers)
+
+        soup = BeautifulSoup(html, 'html.parser')
+        scriptTag = soup.select_one("script")
+        if scriptTag is None:
+
+            if soup.find("h2", string=lambda s: s and self._NO_MENU_MESSAGE in s.lower()):
+                log.info("No menu available (holiday/weekend) for %s", self.url)
+                return
+
+            raise ValueError("Malformatted/unexpected data")
+        
+        jsonData = scriptTag.string
+        # discard javascript variable assignment, weekMenues = {...
+        jsonData = jsonData[jsonData.find("{") - 1:]
+        # replace javascipt dates (new Date(1234567...) with only the ts
+        jsonData = re.sub(r"new Date\([0-9]+\)", preserveTs, jsonData)
+        # json should be fine now
+        data = decodeJson(jsonData)
+
+        self._dumpData(data)
+
+        menu:MenuData = {}
+
+        horizon = self.horizon
+        for week in data["Weeks"]:
+            for day in week["Days"]:
+                entryDate = datetime.fromtimestamp(day["DayMenuDate"] / 1000, timezone.utc)
+                entryDate = entryDate.astimezone(tz=se).date()
+                if not horizon.covers(entryDate):
+                    continue
+
+                for menuEntry in self._processDayEntries(entryDate, day["DayMenus"]):
+                    self._addMenuEntry(menu, entryDate, menuEntry)
+
+        return menu
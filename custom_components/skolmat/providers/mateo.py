@@ -0,0 +1,84 @@
+from datetime import date, timedelta
+from urllib.parse import urlparse
+from collections.abc import Callable
+from typing import Any
+from ..menu import Menu, MenuData, MenuEntry, isoDate
+
+
+class MateoMenu(Menu):
+
+    provider = "mateo.se"
+
+    def __init__(self, 
+                 asyncExecutor, url:str, 
+                 customMenuEntryProcessorCB: Callable | None = None, 
+                 readableDaySummaryCB: Callable | None = None
+            ):
+
+        super().__init__(asyncExecutor, url, customMenuEntryProcessorCB, readableDaySummaryCB)
+        self.headers = {
+            "Content-Type": "application/json",
+            "Accept": "application/json", 
+            "Referer": f"https://{self.provider}/",
+            }
+        # date range covered by the last successful request, used for incremental refreshes
+        self._fetchedRange: tuple[date, date] | None = None
+        
+    def _fixUrl(self, url: str) -> str:
+
+        parsed = urlparse(url)
+        id = parsed.path.rstrip("/").split("/")[-1]
+
+        if not id.isdigit():
+            raise ValueError("school id could not be extracted from url")
+
+        newUrl = "https://meny-api.mateo.se/api/v1/days/" + id
+        return newUrl
+
+    async def _fetchMenu (self, aiohttp_session, startDate:date, endDate:date):
+
+        url = f"{self.url}?from={startDate.isoformat()}&to={endDate.isoformat()}"
+        return await self._fetchJson(aiohttp_session, url, headers=self.headers)
+
+
+    def _processMenuEntry(self, entryDate, order:int, raw_entry:Any) -> MenuEntry:
+        if entry := super()._processMenuEntry(entryDate, order, raw_entry):
+            return entry
+
+        if raw_entry["labels"]:
+            label = ", ".join(label["name"].strip() for label in raw_entry["labels"])
+        else:
+            label = raw_entry["type"]
+
+        return self._createMenuEntry (order, "Lunch", raw_entry["name"], label)
+
+    async def _loadMenu(self, aiohttp_session) -> MenuData:
+
+        today = date.today()
+        firstDay, endDate = horizon = self.horizon
+        menu:MenuData = {}
+
+        # Days before today that were covered by the previous request will not change anymore.
+        # Keep those and only request today onward, which also picks up new days at the horizon.
+        startDate = firstDay
+        if self._fetchedRange and self._menu and firstDay < today:
+            knownFrom, knownTo = self._fetchedRange
+            if knownFrom <= firstDay and knownTo >= today - timedelta(days=1):
+                startDate = today
+                for isodate, entries in self._menu.items():
+                    if firstDay <= date.fromisoformat(isodate) < today:
+                        menu[isodate] = entries
+
+        dayEntries = await self._fetchMenu(aiohttp_session, startDate=startDate, endDate=endDate)
+
+        self._dumpData(dayEntries)
+
+        for day in dayEntries:
+            entryDate = isoDate(day["date"])
+            if not horizon.covers(entryDate):
+                continue
+            for menuEntry in self._processDayEntries(entryDate, day["meals"]):
+                self._addMenuEntry(menu, entryDate, menuEntry)
+
+        self._fetchedRange = (firstDay, endDate)
+        return menu
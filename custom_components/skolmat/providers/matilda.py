@@ -0,0 +1,91 @@
+from datetime import date, datetime
+from bs4 import BeautifulSoup
+from collections.abc import Callable
+from typing import Any
+from ..menu import Menu, MenuData, MenuEntry, decodeJson
+
+
+class MatildaMenu (Menu):
+    provider = "menu.matildaplatform.com"
+
+    def __init__(self, 
+                 asyncExecutor, url:str, 
+                 customMenuEntryProcessorCB: Callable | None = None, 
+                 readableDaySummaryCB: Callable | None = None
+            ):
+        
+        super().__init__(asyncExecutor, url, customMenuEntryProcessorCB, readableDaySummaryCB)
+        self.headers = {"user-agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/99.0.4844.82 Safari/537.36"}
+
+
+    def _fixUrl(self, url: str) -> str:
+        return url
+
+    async def _getWeek(self, aiohttp_session, url):
+        html = await self._fetchText(aiohttp_session, url, self.HTML_CONTENT_TYPES, headers=self.headers)
+        soup = BeautifulSoup(html, 'html.parser')
+        jsonData = soup.select("#__NEXT_DATA__")[0].string
+        return decodeJson(jsonData)["props"]["pageProps"]
+
+    @staticmethod
+    def _mealDate(meal) -> date:
+        return datetime.strptime(meal["date"], "%Y-%m-%dT%H:%M:%S").date() # 2023-06-02T00:00:00
+
+    def _processMenuEntry(self, entryDate, order:int, raw_entry:Any) -> MenuEntry:
+        if entry := super()._processMenuEntry(entryDate, order, raw_entry):
+            return entry
+
+        return self._createMenuEntry (order, raw_entry["mealName"], raw_entry["name"], raw_entry["optionName"])
+    
+    async def _loadMenu(self, aiohttp_session):
+
+        horizon = self.horizon
+
+        # each week page links the next one, so weeks are fetched in sequence
+        week = await self._getWeek(aiohttp_session, self.url)
+        if week["meals"] and self._mealDate(week["meals"][-1]) < horizon.start:
+            # on weekends the horizon starts next Monday, after all of the current week's page
+            week = await self._getWeek(aiohttp_session, "https://menu.matildaplatform.com" + week["nextURL"])
+        mealEntries = [*week["meals"]]
+        for _ in range(self._weeks - 1):
+            week = await self._getWeek(aiohttp_session, "https://menu.matildaplatform.com" + week["nextURL"])
+            mealEntries.extend(week["meals"])
+
+        self._dumpData(mealEntries)
+
+        menu:MenuData = {}
+
+        mealNo = 1
+        lastDate = None
+        dayCourses:list[Any] = []
+        dayOrders:list[int] = []
+
+        def flushDay():
+            if lastDate:
+                for menuEntry in self._processDayEntries(lastDate, dayCourses, dayOrders):
+                    self._addMenuEntry(menu, lastDate, menuEntry)
+            dayCourses.clear()
+            dayOrders.clear()
+
+        for meal in mealEntries:
+            
+            entryDate = self._mealDate(meal)
+            if not horizon.covers(entryDate):
+                continue
+
+            if lastDate and lastDate != entryDate:
+                flushDay()
+                mealNo = 1
+            lastDate = entryDate
+
+            name = meal["name"] if meal["name"] is not None else f"Måltid {mealNo}"
+            mealNo += 1
+
+            for courseNo, course in enumerate(meal["courses"], start=1):
+                # add the meal name to each course
+                course["mealName"] = name
+                dayCourses.append(course)
+                dayOrders.append(courseNo)
+
+        flushDay()
+        return menu
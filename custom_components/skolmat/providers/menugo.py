@@ -0,0 +1,100 @@
+import json
+from urllib.parse import urlparse, quote
+from collections.abc import Callable
+from typing import Any
+from ..menu import Menu, MenuData, MenuEntry, isoDate
+
+
+class MenuGoMenu(Menu):
+
+    provider = "menugo.se"
+
+    def __init__(self, 
+                 asyncExecutor, url:str, 
+                 customMenuEntryProcessorCB: Callable | None = None, 
+                 readableDaySummaryCB: Callable | None = None
+            ):
+
+        super().__init__(asyncExecutor, url, customMenuEntryProcessorCB, readableDaySummaryCB)
+        self._NO_MENU_MESSAGE = "Meny saknad för denna dag."
+        self.headers = {
+            "Content-Type": "application/json",
+            "Accept": "application/json", 
+            "Referer": f"https://{self.provider}/",
+            }
+
+    def _fixUrl(self, url: str) -> str:
+
+        # https://menugo.se/m/0127/Bjorkstugan ->
+        # https://menugo.se/FetchTheMenu/{"Kommunkod":"0127","LänkNamn":"Bjorkstugan"} ->
+        # https://menugo.se/FetchTheMenu/%7B%22Kommunkod%22%3A%220127%22%2C%22L%C3%A4nkNamn%22%3A%22Kungstappan%22%7D
+
+        parsed = urlparse(url.strip())
+        parts = parsed.path.strip("/").split("/")
+
+        # Expected: ["m", "0127", "Bjorkstugan"]
+        if len(parts) < 3 or parts[0] != "m":
+            raise ValueError(f"Unexpected Menugo URL format: {parsed.path}")
+
+        uri = {
+            "Kommunkod": parts[1],
+            "LänkNamn": parts[2]
+        }
+        encoded = quote(json.dumps(uri, ensure_ascii=False), safe="")
+        url = f"https://menugo.se/FetchTheMenu/{encoded}"
+
+        return url
+    
+
+    async def _fetchMenu (self, aiohttp_session):
+
+        # no date/range arguments in the uri, seems to return a fixed range of weeks, so just fetch and parse
+        data = await self._fetchJson(aiohttp_session, self.url, headers=self.headers)
+        return data["CacheObjekt"]
+
+    def _processMenuEntry(self, entryDate, order:int, raw_entry:Any) -> MenuEntry:
+        if entry := super()._processMenuEntry(entryDate, order, raw_entry):
+            return entry
+
+        label = None
+        if raw_entry["Matgrupp"]:
+            label = ", ".join(raw_entry["Matgrupp"])
+
+        dish = raw_entry["Namn"].strip()
+
+        if dish == self._NO_MENU_MESSAGE:
+            return None
+
+        meal = None
+        if dish.lower().startswith("lunch:"):
+            meal = "Lunch"
+            dish = dish[len(meal) + 1:].lstrip()
+        elif dish.lower().startswith("middag:"):
+            meal = "Middag"
+            dish = dish[len(meal) + 1:].lstrip()
+
+        return self._createMenuEntry (order, meal, dish, label)
+
+    async def _loadMenu(self, aiohttp_session) -> MenuData:
+
+        horizon = self.horizon
+
+        data = await self._fetchMenu(aiohttp_session)
+        dayEntries = data.get("DatumObjekt", [])
+
+        self._dumpData(dayEntries)
+        menu:MenuData = {}
+
+        for day in dayEntries:
+            entryDate = isoDate(day["Datum"])
+            if entryDate > horizon.end:
+                break
+            if entryDate < horizon.start:
+                continue
+
+            # skip "no menu" placeholders up front so course order only counts real dishes
+            courses = [c for c in day["Maträtt"] if c["Namn"].strip() != self._NO_MENU_MESSAGE]
+            for menuEntry in self._processDayEntries(entryDate, courses):
+                self._addMenuEntry(menu, entryDate, menuEntry)
+        
+        return menu
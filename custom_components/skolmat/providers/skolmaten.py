@@ -0,0 +1,85 @@
+import asyncio
+from urllib.parse import urlparse
+from collections.abc import Callable
+from typing import Any
+from ..menu import Menu, MenuData, MenuEntry, isoDate
+
+
+class SkolmatenMenu(Menu):
+
+    provider = "skolmaten.se"
+
+
+    def __init__(self, 
+                 asyncExecutor, url:str, 
+                 customMenuEntryProcessorCB: Callable | None = None, 
+                 readableDaySummaryCB: Callable | None = None
+            ):
+
+        super().__init__(asyncExecutor, url, customMenuEntryProcessorCB, readableDaySummaryCB)
+        self.headers = {
+            "Content-Type": "application/json",
+            "Accept": "application/json", 
+            "Referer": f"https://{self.provider}/",
+            "client-token": "web-eaa12e50-c84c-4b4a-9cfe-4e3fcbcd9165"
+            }
+
+
+    def _fixUrl(self, url: str) -> str:
+
+        parsed = urlparse(url)
+        schoolName = parsed.path.lstrip("/")
+
+        if schoolName is None:
+            raise ValueError("school name could not be extracted from url")
+
+
+        newUrl = "https://skolmaten.se/api/4/menu/school/" + schoolName
+        return newUrl
+
+    async def _getWeek(self, aiohttp_session, url):
+
+        def remove_images(obj):
+            if isinstance(obj, dict):
+                return {k: remove_images(v) for k, v in obj.items() if k != "image"}
+            elif isinstance(obj, list):
+                return [remove_images(i) for i in obj]
+            return obj
+
+        return remove_images(await self._fetchJson(aiohttp_session, url, headers=self.headers))
+
+    def _processMenuEntry(self, entryDate, order:int, raw_entry:Any) -> MenuEntry:
+        if entry := super()._processMenuEntry(entryDate, order, raw_entry):
+            return entry
+
+        labels = [a["sv"] for a in raw_entry["MealAttributes"]]
+        label = ", ".join(labels)
+
+        return self._createMenuEntry (order, "Lunch", raw_entry["name"], label)
+
+    async def _loadMenu(self, aiohttp_session) -> MenuData:
+
+            horizon = self.horizon
+
+            # one request per week, all in flight at once
+            weeks = await asyncio.gather(*(
+                self._getWeek(aiohttp_session, f"{self.url}?year={year}&week={week}")
+                for year, week in horizon.isoWeeks()
+            ))
+
+            dayEntries = [
+                day
+                for w in weeks if isinstance(w.get("WeekState"), dict)
+                for day in w["WeekState"]["Days"]
+            ]
+
+            self._dumpData(dayEntries)
+            menu:MenuData = {}
+
+            for day in dayEntries:
+                entryDate = isoDate(day["date"])
+                if not horizon.covers(entryDate):
+                    continue
+                for menuEntry in self._processDayEntries(entryDate, day["Meals"]):
+                    self._addMenuEntry(menu, entryDate, menuEntry)
+            return menu
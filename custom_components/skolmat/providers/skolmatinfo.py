@@ -0,0 +1,115 @@
+import asyncio
+from dateutil import parser
+from bs4 import BeautifulSoup
+from urllib.parse import urlparse
+from collections.abc import Callable
+from typing import Any
+from ..menu import Menu, MenuData, MenuEntry, MenuHorizon, normalizeString
+
+
+class SkolmatInfoMenu(Menu):
+
+    provider = "meny.skolmat.info"
+
+    def __init__(self,
+                 asyncExecutor, url:str,
+                 customMenuEntryProcessorCB: Callable | None = None,
+                 readableDaySummaryCB: Callable | None = None
+            ):
+
+        super().__init__(asyncExecutor, url, customMenuEntryProcessorCB, readableDaySummaryCB)
+        self.headers = {
+            "user-agent": (
+                "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+                "AppleWebKit/537.36 (KHTML, like Gecko) "
+                "Chrome/99.0.4844.82 Safari/537.36"
+            ),
+        }
+
+    def _fixUrl(self, url: str) -> str:
+        url = url.strip().rstrip("/")
+        if not url.startswith(("http://", "https://")):
+            url = f"https://{url}"
+
+        parsed = urlparse(url)
+        if not parsed.netloc or self.provider not in parsed.netloc:
+            raise ValueError("Skolmat.info URL must target meny.skolmat.info")
+
+        if not parsed.path:
+            raise ValueError("school path could not be extracted from url")
+
+        return f"{parsed.scheme}://{parsed.netloc}{parsed.path}".rstrip("/")
+
+    def _processMenuEntry(self, entryDate, order:int, raw_entry:Any) -> MenuEntry:
+        if entry := super()._processMenuEntry(entryDate, order, raw_entry):
+            return entry
+
+        return self._createMenuEntry(
+            order=order,
+            meal_raw="Lunch",
+            dish_raw=raw_entry.get("dish", ""),
+            label=raw_entry.get("label"),
+        )
+
+    async def _getWeek(self, aiohttp_session, year:int, week:int) -> str:
+        url = f"{self.url}?year={year}&week={week}"
+        return await self._fetchText(aiohttp_session, url, self.HTML_CONTENT_TYPES, headers=self.headers)
+
+    def _parseWeekHtml(self, html_data: str, horizon:MenuHorizon | None = None) -> MenuData:
+        soup = BeautifulSoup(html_data, "html.parser")
+        menu:MenuData = {}
+
+        for time_tag in soup.find_all("time", attrs={"datetime": True}):
+            try:
+                entryDate = parser.isoparse(time_tag["datetime"]).date()
+            except Exception:
+                continue
+            if horizon and not horizon.covers(entryDate):
+                continue
+
+            day_info = time_tag.find_parent("div")
+            day_block = day_info.parent if day_info and day_info.parent else None
+            if not day_block:
+                continue
+
+            course_group = day_info.find_next_sibling("div")
+            if not course_group:
+                continue
+
+            raw_entries = []
+            for course in course_group.find_all("div", class_="space-y-2", recursive=False):
+                prose = course.find("div", class_=lambda c: c and "prose" in c)
+                dish = prose.get_text(" ", strip=True) if prose else ""
+
+                labels = []
+                for label_node in course.find_all("span", class_=lambda c: c and "text-sm" in c):
+                    value = normalizeString(label_node.get_text(" ", strip=True))
+                    if value and value not in labels:
+                        labels.append(value)
+
+                raw_entries.append({
+                    "dish": dish,
+                    "label": ", ".join(labels) if labels else None,
+                })
+
+            for menuEntry in self._processDayEntries(entryDate, raw_entries):
+                self._addMenuEntry(menu, entryDate, menuEntry)
+
+        return menu
+
+    async def _loadMenu(self, aiohttp_session) -> MenuData:
+        horizon = self.horizon
+        menu:MenuData = {}
+
+        # one request per week, all in flight at once
+        pages = await asyncio.gather(*(
+            self._getWeek(aiohttp_session, year=year, week=week)
+            for year, week in horizon.isoWeeks()
+        ))
+
+        for html_data in pages:
+            parsed_week = self._parseWeekHtml(html_data, horizon)
+            for isodate, entries in parsed_week.items():
+                menu.setdefault(isodate, []).extend(entries)
+
+        return menu
@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+import re
+from bisect import bisect_left
+
+RE_WORD = re.compile(r"\w+")
+
+
+def tokenize(text:str) -> list[str]:
+    # casefolded words, so "Pannkakor" and "pannkakor" are one token
+    return RE_WORD.findall(text.casefold())
+
+
+def textMatches(text:str, words:list[str]) -> bool:
+    # every word starts some token of the text
+    tokens = tokenize(text)
+    return all(any(token.startswith(word) for token in tokens) for word in words)
+
+
+class SearchIndex():
+
+    """
+    Inverted index over the dish texts of each day: token -> days it occurs on.
+    Days are set and removed one at a time as menus merge and history is pruned.
+    Every query word must be the start of some token, so "pannkak" finds
+    "Pannkakor med sylt". Only texts that match all query words are returned.
+
+    Each day gets a small integer id and a token's days are held as a bitmask of
+    those ids. Days within a few weeks give masks of only a few bytes, where a set
+    per token would cost a few hundred. Texts repeat on rotation, so each distinct
+    text is held only once.
+    """
+
+    def __init__(self):
+        self._days:dict[str, tuple[int, tuple[str, ...]]] = {}  # iso date -> (day id, texts)
+        self._dates:list[str | None] = []  # iso date by day id, None for free ids
+        self._freeIds:list[int] = []
+        self._tokenDays:dict[str, int] = {}  # token -> bitmask of day ids
+        self._texts:dict[str, str] = {}  # interned texts
+        self._textRefs = 0  # texts held by days, repeats counted
+        self._tokens:list[str] | None = None  # sorted tokens for prefix lookup, None after a token was added or dropped
+
+    def __len__(self) -> int:
+        return len(self._days)
+
+    def __contains__(self, isodate:str) -> bool:
+        return isodate in self._days
+
+    def setDay(self, isodate:str, texts:list[str] | tuple[str, ...]):
+        texts = tuple(self._texts.setdefault(text, text) for text in texts)
+        current = self._days.get(isodate)
+        if current is not None and current[1] == texts:
+            return
+        self.removeDay(isodate)
+        if not texts:
+            return
+
+        day_id = self._freeIds.pop() if self._freeIds else len(self._dates)
+        if day_id == len(self._dates):
+            self._dates.append(isodate)
+        else:
+            self._dates[day_id] = isodate
+        self._days[isodate] = (day_id, texts)
+        self._textRefs += len(texts)
+
+        bit = 1 << day_id
+        for token in {token for text in texts for token in tokenize(text)}:
+            mask = self._tokenDays.get(token)
+            if mask is None:
+                mask = 0
+                self._tokens = None
+            self._tokenDays[token] = mask | bit
+
+    def removeDay(self, isodate:str):
+        current = self._days.pop(isodate, None)
+        if current is None:
+            return
+        day_id, texts = current
+        bit = 1 << day_id
+        for token in {token for text in texts for token in tokenize(text)}:
+            mask = self._tokenDays.get(token, 0) & ~bit
+            if mask:
+                self._tokenDays[token] = mask
+            else:
+                self._tokenDays.pop(token, None)
+                self._tokens = None
+        self._dates[day_id] = None
+        self._freeIds.append(day_id)
+        self._textRefs -= len(texts)
+
+        # drop texts no day refers to anymore, once the table is twice what the days hold
+        if len(self._texts) > 2 * self._textRefs + 8:
+            kept = {text for _, t in self._days.values() for text in t}
+            self._texts = {text: text for text in kept}
+
+    def prune(self, cutoff:str):
+        # drop days before the cutoff iso date
+        for isodate in [d for d in self._days if d < cutoff]:
+            self.removeDay(isodate)
+
+    def clear(self):
+        self._days.clear()
+        self._dates.clear()
+        self._freeIds.clear()
+        self._tokenDays.clear()
+        self._texts.clear()
+        self._textRefs = 0
+        self._tokens = None
+
+    def _prefixMask(self, word:str) -> int:
+        if self._tokens is None:
+            self._tokens = sorted(self._tokenDays)
+        mask = 0
+        for i in range(bisect_left(self._tokens, word), len(self._tokens)):
+            token = self._tokens[i]
+            if not token.startswith(word):
+                break
+            mask |= self._tokenDays[token]
+        return mask
+
+    def search(self, query:str, start:str | None = None, end:str | None = None) -> dict[str, list[str]]:
+        """
+        Matching texts by iso date, for days within start..end (inclusive, open ended if None).
+        An empty query matches nothing.
+        """
+        words = tokenize(query)
+        if not words:
+            return {}
+
+        mask = -1
+        for word in set(words):
+            mask &= self._prefixMask(word)
+            if not mask:
+                return {}
+
+        first = start or ""
+        last = end or "9999"
+        days = []
+        while mask:
+            day_id = (mask & -mask).bit_length() - 1
+            mask &= mask - 1
+            days.append(self._dates[day_id])
+
+        results:dict[str, list[str]] = {}
+        for isodate in sorted(days):
+            if not first <= isodate <= last:
+                continue
+            texts = [text for text in self._days[isodate][1] if textMatches(text, words)]
+            if texts:
+                results[isodate] = texts
+        return results
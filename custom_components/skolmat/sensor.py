@@ -8,13 +8,14 @@ from typing import Any
 
 from homeassistant.components.sensor import SensorEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.restore_state import RestoreEntity
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.util import slugify
 
-from .const import DOMAIN, CONF_NAME, CONF_URL, CONF_PROVIDER
+from .const import DOMAIN, CONF_NAME, CONF_URL, CONF_PROVIDER, SIGNAL_MENU_UPDATED
 from .menu import Menu
 
 _LOGGER = logging.getLogger(__name__)
@@ -40,6 +41,7 @@ class SkolmatSensor(RestoreEntity, SensorEntity):
 
     _attr_icon = "mdi:food"
     _attr_translation_key = "menu"
+    _attr_should_poll = False
 
     def __init__(self, hass, entry, menu:Menu, url_hash):
         self.hass = hass
@@ -55,6 +57,9 @@ class SkolmatSensor(RestoreEntity, SensorEntity):
 
         self._state: str | None = None
         self._attrs: dict[str, Any] = {}
+        self._menu_version: int | None = None
+        self._filter_version: int | None = None
+        self._state_date: date | None = None
 
     @property
     def name(self):
@@ -82,10 +87,25 @@ class SkolmatSensor(RestoreEntity, SensorEntity):
         # Restore state
         await super().async_added_to_hass()
 
+        # only when the update before add had no menu; the restored state is of an earlier
+        # run, possibly an earlier day, so the next update recomputes it
         last = await self.async_get_last_state()
-        if last is not None:
+        if last is not None and self._state is None:
             self._state = last.state
             self._attrs = dict(last.attributes)
+            self._state_date = None
+            self._menu_version = None
+
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass, SIGNAL_MENU_UPDATED.format(self._entry.entry_id), self._async_menu_updated
+            )
+        )
+        self.async_schedule_update_ha_state(True)
+
+    @callback
+    def _async_menu_updated(self) -> None:
+        self.async_schedule_update_ha_state(True)
 
     async def async_update(self) -> None:
 
@@ -96,17 +116,40 @@ class SkolmatSensor(RestoreEntity, SensorEntity):
             return
         self._attr_available = True
 
-        today_key = date.today().isoformat()
-        if not menu_data.get(today_key):
-            state = "no_food_today"
-        else:
-            state = self._menu.getReadableTodaySummary()
+        # Only today's summary feeds the state, so reprocess only when today changed, the day
+        # rolled over or the summary filters were replaced.
+        today = date.today()
+        today_key = today.isoformat()
+        changes = self._menu.getChangesSince(self._menu_version)
+        filters_changed = self._filter_version != self._menu.filterVersion
+        if (
+            changes is not None
+            and changes["version"] == self._menu_version
+            and self._state_date == today
+            and not filters_changed
+        ):
+            return
+        today_changed = (
+            changes is None
+            or filters_changed
+            or self._state_date != today
+            or today_key in changes["added"] | changes["changed"] | changes["removed"]
+        )
+
+        if today_changed:
+            if not menu_data.get(today_key):
+                state = "no_food_today"
+            else:
+                state = self._menu.getReadableTodaySummary()
 
-        if len(state) > 255:
-            state = state[:252] + "..."
+            if len(state) > 255:
+                state = state[:252] + "..."
 
-        self._state = state
+            self._state = state
+            self._state_date = today
+            self._filter_version = self._menu.filterVersion
 
+        self._menu_version = self._menu.version
         self._attrs = {
             "provider": self._menu.provider,
             "url": self._url,
@@ -0,0 +1,99 @@
+"""Skolmat services: dish search over the current menus and calendar history."""
+
+from __future__ import annotations
+
+from datetime import date
+from typing import Any
+
+import voluptuous as vol
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import ATTR_ENTITY_ID
+from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse, SupportsResponse, callback
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers import entity_registry as er
+
+from .const import DOMAIN, CONF_PROCESSOR_FILE, CONF_PROCESSOR_FN
+from .history import DATA_SOURCE_HISTORY, SourceHistory, source_key
+from .menu import Menu
+
+SERVICE_SEARCH = "search"
+
+SEARCH_SCHEMA = vol.Schema(
+    {
+        vol.Required("query"): vol.All(cv.string, vol.Length(min=1)),
+        vol.Optional(ATTR_ENTITY_ID): cv.entity_ids,
+        vol.Optional("start"): cv.date,
+        vol.Optional("end"): cv.date,
+    }
+)
+
+
+@callback
+def async_setup(hass: HomeAssistant) -> None:
+
+    async def _async_search(call: ServiceCall) -> ServiceResponse:
+        return search(
+            hass,
+            call.data["query"],
+            _resolve_entry_ids(hass, call.data.get(ATTR_ENTITY_ID)),
+            call.data.get("start"),
+            call.data.get("end"),
+        )
+
+    hass.services.async_register(
+        DOMAIN, SERVICE_SEARCH, _async_search, schema=SEARCH_SCHEMA, supports_response=SupportsResponse.ONLY
+    )
+
+
+def _resolve_entry_ids(hass: HomeAssistant, entity_ids: list[str] | None) -> list[str]:
+    # every loaded entry unless entities are given, then the entries behind them
+    if not entity_ids:
+        return list(hass.data.get(DOMAIN, {}))
+
+    registry = er.async_get(hass)
+    entry_ids: list[str] = []
+    for entity_id in entity_ids:
+        entity = registry.async_get(entity_id)
+        if entity is None or entity.platform != DOMAIN:
+            raise ServiceValidationError(f"{entity_id} is not a Skolmat entity")
+        if entity.config_entry_id not in entry_ids:
+            entry_ids.append(entity.config_entry_id)
+    return entry_ids
+
+
+def _source_history(hass: HomeAssistant, entry: ConfigEntry, url_hash: str) -> SourceHistory | None:
+    # the calendar's shared history of the entry's source, if its calendar is loaded
+    key = source_key(url_hash, entry.data.get(CONF_PROCESSOR_FILE), entry.data.get(CONF_PROCESSOR_FN))
+    return hass.data.get(DATA_SOURCE_HISTORY, {}).get(key)
+
+
+def search(
+    hass: HomeAssistant, query: str, entry_ids: list[str], start: date | None = None, end: date | None = None
+) -> dict[str, Any]:
+    """
+    Days with dishes matching the query, per entry and in date order. Days in the current
+    menu come from there, older days from the calendar history.
+    """
+    results: list[dict[str, Any]] = []
+    for entry_id in entry_ids:
+        entry_data = hass.data.get(DOMAIN, {}).get(entry_id)
+        entry = hass.config_entries.async_get_entry(entry_id)
+        if not entry_data or entry is None:
+            continue
+        menu: Menu = entry_data["menu"]
+        days = {isodate: (dishes, "menu") for isodate, dishes in menu.searchDishes(query, start, end).items()}
+
+        source = _source_history(hass, entry, entry_data["url_hash"])
+        if source is not None:
+            found = source.search(query, start.isoformat() if start else None, end.isoformat() if end else None)
+            for isodate, dishes in found.items():
+                # days still in the menu are current there, matching or not
+                if menu.getDayDigest(isodate) is None:
+                    days[isodate] = (dishes, "history")
+
+        for isodate in sorted(days):
+            dishes, origin = days[isodate]
+            results.append({"entry_id": entry_id, "name": entry.title, "date": isodate, "source": origin, "dishes": dishes})
+    return {"query": query, "results": results}
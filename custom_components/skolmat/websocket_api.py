@@ -0,0 +1,129 @@
+"""Websocket commands for the Skolmat card: ranged menu reads and per-day delta subscriptions."""
+
+from __future__ import annotations
+
+from datetime import date
+from typing import Any
+
+import voluptuous as vol
+
+from homeassistant.components import websocket_api
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+
+from .const import DOMAIN, SIGNAL_MENU_UPDATED
+from .menu import Menu
+
+_RANGE_SCHEMA = {
+    vol.Required("entity_id"): str,
+    vol.Optional("start"): vol.Coerce(date.fromisoformat),
+    vol.Optional("end"): vol.Coerce(date.fromisoformat),
+}
+
+
+@callback
+def async_setup(hass: HomeAssistant) -> None:
+    websocket_api.async_register_command(hass, ws_get_menu)
+    websocket_api.async_register_command(hass, ws_subscribe_menu)
+
+
+def _resolve_entry_id(hass: HomeAssistant, entity_id: str) -> str | None:
+    entity = er.async_get(hass).async_get(entity_id)
+    if entity is None or entity.platform != DOMAIN:
+        return None
+    return entity.config_entry_id
+
+
+def _get_menu(hass: HomeAssistant, entry_id: str | None) -> Menu | None:
+    entry_data = hass.data.get(DOMAIN, {}).get(entry_id)
+    return entry_data.get("menu") if entry_data else None
+
+
+def _day_payload(menu: Menu, days: dict[str, Any]) -> dict[str, dict[str, Any]]:
+    return {
+        isodate: {"digest": menu.getDayDigest(isodate), "entries": entries}
+        for isodate, entries in days.items()
+    }
+
+
+def _group_by_week(days: dict[str, dict[str, Any]]) -> list[dict[str, Any]]:
+    weeks: dict[tuple[int, int], dict[str, Any]] = {}
+    for isodate, day in days.items():
+        year, week, _ = date.fromisoformat(isodate).isocalendar()
+        weeks.setdefault((year, week), {"year": year, "week": week, "days": {}})["days"][isodate] = day
+    return list(weeks.values())
+
+
+def menu_payload(menu: Menu, start: date | None, end: date | None, group_by_week: bool = False) -> dict[str, Any]:
+    days = _day_payload(menu, menu.getDays(start, end))
+    if group_by_week:
+        return {"version": menu.version, "weeks": _group_by_week(days)}
+    return {"version": menu.version, "days": days}
+
+
+def menu_delta(menu: Menu, start: date | None, end: date | None, known: dict[str, str]) -> dict[str, Any]:
+    """Days whose digest differs from `known` (date -> digest) and known dates that are gone."""
+    days = menu.getDays(start, end)
+    changed = {isodate: entries for isodate, entries in days.items() if known.get(isodate) != menu.getDayDigest(isodate)}
+    removed = sorted(isodate for isodate in known if isodate not in days)
+    return {"version": menu.version, "changed": _day_payload(menu, changed), "removed": removed}
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "skolmat/menu",
+        **_RANGE_SCHEMA,
+        vol.Optional("group_by_week", default=False): bool,
+    }
+)
+@callback
+def ws_get_menu(hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict[str, Any]) -> None:
+    """Return cached menu days in a date range, optionally grouped by ISO week."""
+    menu = _get_menu(hass, _resolve_entry_id(hass, msg["entity_id"]))
+    if menu is None:
+        connection.send_error(msg["id"], websocket_api.ERR_NOT_FOUND, "Skolmat entity not found")
+        return
+
+    connection.send_result(
+        msg["id"],
+        menu_payload(menu, msg.get("start"), msg.get("end"), msg["group_by_week"]),
+    )
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "skolmat/subscribe_menu",
+        **_RANGE_SCHEMA,
+        vol.Optional("digests", default={}): {str: str},
+    }
+)
+@callback
+def ws_subscribe_menu(hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict[str, Any]) -> None:
+    """Push the days in a range whose digest changed, starting from the digests the client already has."""
+    entry_id = _resolve_entry_id(hass, msg["entity_id"])
+    if _get_menu(hass, entry_id) is None:
+        connection.send_error(msg["id"], websocket_api.ERR_NOT_FOUND, "Skolmat entity not found")
+        return
+
+    known: dict[str, str] = dict(msg["digests"])
+
+    @callback
+    def forward_changes() -> None:
+        # the entry may have been reloaded with a new Menu, always look it up
+        menu = _get_menu(hass, entry_id)
+        if menu is None:
+            return
+        delta = menu_delta(menu, msg.get("start"), msg.get("end"), known)
+        if not delta["changed"] and not delta["removed"]:
+            return
+        for isodate in delta["removed"]:
+            known.pop(isodate, None)
+        known.update({isodate: day["digest"] for isodate, day in delta["changed"].items()})
+        connection.send_message(websocket_api.event_message(msg["id"], delta))
+
+    connection.subscriptions[msg["id"]] = async_dispatcher_connect(
+        hass, SIGNAL_MENU_UPDATED.format(entry_id), forward_changes
+    )
+    connection.send_result(msg["id"])
+    forward_changes()
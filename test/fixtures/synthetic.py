@@ -0,0 +1,112 @@
+"""
+Deterministic synthetic MenuData for scale and stress tests.
+
+Days are built in the shapes of the use cases in usecases.json:
+
+    UC-A   meal + "Alt N" labels
+    UC-B   variant encoded in the meal name, no labels
+    UC-C   normalized meal + variant label (processor output)
+    UC-D1  opaque meal buckets, one per alternative
+    UC-D2  one opaque meal bucket with several dishes
+
+Dishes follow a rotation (schools repeat their menu every few weeks), and every
+HOLIDAY_EVERY:th school day is a single line holiday entry (UC-G1). The same
+arguments always give the same data.
+"""
+
+import random
+from datetime import date, timedelta
+
+SHAPES = ("UC-A", "UC-B", "UC-C", "UC-D1", "UC-D2")
+
+MEALS = ("Lunch", "Middag", "Kvällsmat", "Frukost", "Dessert")
+VARIANTS = ("Husman", "Vegetariskt", "Dagens", "Fisk", "Glutenfri", "Laktosfri", "Special")
+OPAQUE_MEALS = ("Kökets rätt", "Kökets gröna 1", "Kökets gröna 2", "Kökets gröna 3", "Kökets extra")
+
+DISHES = (
+    "Köttbullar", "Fiskgratäng", "Pannkakor", "Kycklinggryta", "Pasta bolognese", "Ärtsoppa",
+    "Lasagne", "Korv stroganoff", "Laxfilé", "Tacos", "Fläskpannkaka", "Kåldolmar", "Pytt i panna",
+    "Kycklingwok", "Torskrygg", "Köttfärssås", "Skinkstuvning", "Kalops", "Fiskpinnar", "Biff stroganoff",
+)
+VEG_DISHES = (
+    "Linsgryta", "Falafel", "Potatisbullar", "Chili sin carne", "Grönsaksbiff", "Halloumiburgare",
+    "Vegetarisk lasagne", "Sojafärssås", "Bönbiffar", "Pasta med tomatsås", "Quornfilé", "Rödbetsbiffar",
+)
+SIDES = (
+    "med potatismos", "med ris", "med kokt potatis", "med bulgur", "och lingon", "med tzatziki",
+    "med rostade rotfrukter", "med pasta", "med couscous", "och grönsaker",
+)
+HOLIDAYS = ("Lovdag", "Studiedag", "Julafton", "Midsommarafton", "Skolan stängd")
+
+ROTATION_WEEKS = 4
+HOLIDAY_EVERY = 23
+
+
+def _dish(rng: random.Random, vegetarian: bool) -> str:
+    base = rng.choice(VEG_DISHES if vegetarian else DISHES)
+    return f"{base} {rng.choice(SIDES)}"
+
+
+def _names(shape: str, meal: str, alternative: int) -> tuple[str, str, str | None]:
+    # (meal_raw, meal, label) for one alternative of a meal
+    variant = VARIANTS[alternative % len(VARIANTS)]
+    if shape == "UC-A":
+        return meal, meal, f"Alt {alternative + 1}"
+    if shape == "UC-B":
+        name = f"{meal} {variant.lower()}"
+        return name, name, None
+    if shape == "UC-C":
+        return f"{meal} {variant.lower()}", meal, variant
+    if shape == "UC-D1":
+        name = OPAQUE_MEALS[alternative % len(OPAQUE_MEALS)]
+        return name, name, None
+    if shape == "UC-D2":
+        return "Måltid 1", "Måltid 1", None
+    raise ValueError(f"Unknown shape: {shape}")
+
+
+def generateDay(shape: str, meals: int, alternatives: int, rng: random.Random) -> list[dict]:
+    entries: list[dict] = []
+    for meal in MEALS[:meals]:
+        for alternative in range(alternatives):
+            meal_raw, meal_name, label = _names(shape, meal, alternative)
+            dish = _dish(rng, vegetarian=VARIANTS[alternative % len(VARIANTS)] == "Vegetariskt")
+            entries.append({
+                "meal_raw": meal_raw,
+                "meal": meal_name,
+                "dish_raw": dish,
+                "dish": dish,
+                "label": label,
+                "order": len(entries) + 1,
+            })
+    return entries
+
+
+def generateMenu(start: date, days: int, *, shape: str = "UC-C", meals: int = 1, alternatives: int = 3,
+                 seed: int = 0, weekends: bool = False) -> dict[str, list[dict]]:
+    """MenuData with `days` menu days from start (weekdays only unless weekends)."""
+    menu: dict[str, list[dict]] = {}
+    d = start
+    served = 0
+    while served < days:
+        if weekends or d.weekday() < 5:
+            served += 1
+            if served % HOLIDAY_EVERY == 0:
+                holiday = HOLIDAYS[(served // HOLIDAY_EVERY) % len(HOLIDAYS)]
+                menu[d.isoformat()] = [{
+                    "meal_raw": None, "meal": None, "dish_raw": holiday, "dish": holiday, "label": None, "order": 1,
+                }]
+            else:
+                # same weekday in the same rotation week gives the same day
+                cycle_day = (d.toordinal() // 7 % ROTATION_WEEKS, d.weekday())
+                menu[d.isoformat()] = generateDay(shape, meals, alternatives, random.Random(f"{seed}:{cycle_day}"))
+        d += timedelta(days=1)
+    return menu
+
+
+def generateSchools(schools: int, start: date, days: int, **kwargs) -> dict[str, dict[str, list[dict]]]:
+    """MenuData per school, cycling through SHAPES; each school has its own rotation."""
+    return {
+        f"School {i + 1}": generateMenu(start, days, shape=SHAPES[i % len(SHAPES)], seed=i, **kwargs)
+        for i in range(schools)
+    }
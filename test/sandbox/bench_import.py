@@ -0,0 +1,63 @@
+"""
+Import-time benchmark for the Skolmat menu module and its providers.
+
+Each scenario runs in a fresh interpreter (HA core pre-imported, it is always loaded anyway)
+and times importing menu.py plus creating menus for the given urls.
+
+    python test/sandbox/bench_import.py [runs]
+"""
+
+import json, os, statistics, subprocess, sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+HEAVY = ("feedparser", "bs4", "dateutil")
+
+SCENARIOS = {
+    "mateo only": ["https://meny.mateo.se/molndal/29"],
+    "json providers": [
+        "https://meny.mateo.se/molndal/29",
+        "https://skolmaten.se/skutehagens-skolan",
+        "https://menugo.se/m/0381/Gansta_forskola",
+    ],
+    "all providers": [
+        "https://meny.mateo.se/molndal/29",
+        "https://skolmaten.se/skutehagens-skolan",
+        "https://menugo.se/m/0381/Gansta_forskola",
+        "https://webmenu.foodit.se/?r=1&m=180&p=1035&c=10228&w=0&v=Week&l=undefined",
+        "https://menu.matildaplatform.com/meals/week/63fc6e2dccb95f5ce56d8ada_skolor",
+        "https://mpi.mashie.com/public/app/Bjuvs%20kommun/c19fee26",
+        "https://meny.skolmat.info/blekinge/karlskrona/lyckeby-kunskapscenter",
+    ],
+}
+
+CHILD = """
+import json, sys, time
+sys.path.insert(0, {root!r})
+import homeassistant.core, homeassistant.config_entries  # noqa: E401
+start = time.perf_counter()
+from custom_components.skolmat.menu import Menu
+for url in {urls!r}:
+    Menu.createMenu(None, url)
+elapsed = time.perf_counter() - start
+print(json.dumps({{"ms": elapsed * 1000, "heavy": [m for m in {heavy!r} if m in sys.modules]}}))
+"""
+
+
+def run(urls: list[str]) -> dict:
+    code = CHILD.format(root=ROOT, urls=urls, heavy=HEAVY)
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    for name, urls in SCENARIOS.items():
+        results = [run(urls) for _ in range(runs)]
+        median = statistics.median(r["ms"] for r in results)
+        heavy = ", ".join(results[-1]["heavy"]) or "none"
+        print(f"{name:<36} {median:8.1f} ms   parser libs loaded: {heavy}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""
+Scale benchmark on synthetic menus (test/fixtures/synthetic.py).
+
+Production volume is one school with a two week horizon (10 school days, UC-C shape,
+one meal with three alternatives). Each scale multiplies it by more schools and days
+and times filtering, summary rendering, keyword discovery and calendar event building.
+
+    python test/sandbox/bench_synthetic.py [scale ...]    (default: 1 10 100 1000)
+"""
+
+import os, statistics, sys, time
+from datetime import date, datetime
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.join(ROOT, "test"))
+
+import homeassistant.core  # noqa: E402,F401  calendar.py would shadow the stdlib module otherwise
+from tests.helpers import bootstrap  # noqa: E402,F401
+
+from custom_components.skolmat.dayfilter import DayFilter  # noqa: E402
+from fixtures.synthetic import generateSchools  # noqa: E402
+from tests.helpers.hass import make_calendar, make_hass  # noqa: E402
+from tests.helpers.test_helpers import UCTestMenu  # noqa: E402
+
+FILTERS = {"meals_selected": ["Lunch"], "exclude_regex": ["fisk", "korv"], "prefer_regex": ["veg", "kyckling"], "max_entries": 2}
+PRODUCTION_DAYS = 10
+
+
+def layout(scale: int) -> tuple[int, int]:
+    # (schools, days): grow days up to a school year first, then schools
+    days = min(PRODUCTION_DAYS * scale, 200)
+    return max(1, PRODUCTION_DAYS * scale // days), days
+
+
+def timed(fn, runs: int = 3) -> float:
+    samples = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - started)
+    return statistics.median(samples) * 1000
+
+
+def createMenu(menu_data: dict) -> UCTestMenu:
+    menu = UCTestMenu(asyncExecutor=None, url="uc://synthetic")
+    menu._menu = menu_data
+    menu.last_menu_fetch = datetime.now()
+    menu.setSummaryFilters(FILTERS)
+    return menu
+
+
+def bench(scale: int) -> dict[str, float]:
+    schools, days = layout(scale)
+    menus = [createMenu(m) for m in generateSchools(schools, date.today(), days, alternatives=3).values()]
+    day_filter = DayFilter(FILTERS)
+
+    def per_day():
+        for menu in menus:
+            for entries in menu._menu.values():
+                day_filter.filter(entries)
+
+    def batch():
+        for menu in menus:
+            day_filter.filter_many(menu._menu)
+
+    def summaries():
+        for menu in menus:
+            menu.getReadableDaySummaries([date.fromisoformat(d) for d in menu._menu])
+
+    def discovery():
+        for menu in menus:
+            menu._indexedMenu = None  # force a rebuild, as after a restart
+            menu.getSummaryFilterKeywords()
+
+    def events():
+        for menu in menus:
+            calendar = make_calendar(make_hass(), {"lunch_begin": "11:00", "lunch_end": "12:00"}, menu, entry_id="bench")
+            for d in menu._menu:
+                day = date.fromisoformat(d)
+                calendar._build_event(day, menu.getReadableDaySummary(day), menu.getReadableDayMenu(d))
+
+    return {
+        "entries": sum(len(e) for m in menus for e in m._menu.values()),
+        "filter": timed(per_day),
+        "filter_many": timed(batch),
+        "summaries": timed(summaries),
+        "discovery": timed(discovery),
+        "events": timed(events),
+    }
+
+
+def main():
+    scales = [int(s) for s in sys.argv[1:]] or [1, 10, 100, 1000]
+    print(f"{'scale':>6} {'schools':>8} {'days':>5} {'entries':>8} {'filter':>9} {'filter_many':>12} {'summaries':>10} {'discovery':>10} {'events':>9}   (ms)")
+    for scale in scales:
+        schools, days = layout(scale)
+        r = bench(scale)
+        print(f"{scale:>6} {schools:>8} {days:>5} {r['entries']:>8} {r['filter']:>9.1f} {r['filter_many']:>12.1f} {r['summaries']:>10.1f} {r['discovery']:>10.1f} {r['events']:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
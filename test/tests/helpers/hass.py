@@ -0,0 +1,56 @@
+"""Minimal Home Assistant stand-ins for calendar and history tests: Store, hass and a calendar factory."""
+
+import json
+from types import SimpleNamespace
+
+from custom_components.skolmat.calendar import SkolmatCalendarEntity
+from custom_components.skolmat.history import DATA_SOURCE_HISTORY, SourceHistory
+
+
+class FakeStore:
+    """
+    Keeps the last saved data, JSON round-tripped like a real Store, and counts saves.
+    With keep=False the data is handed out once and saves are dropped, so the store
+    holds nothing that a memory measurement would count.
+    """
+
+    def __init__(self, data=None, keep: bool = True):
+        self.data = data
+        self.keep = keep
+        self.saves = 0
+
+    async def async_load(self):
+        data = self.data
+        if not self.keep:
+            self.data = None
+        return data
+
+    async def async_save(self, data):
+        self.saves += 1
+        if self.keep:
+            self.data = json.loads(json.dumps(data))
+
+    async def async_remove(self):
+        self.data = None
+
+
+def make_hass() -> SimpleNamespace:
+    return SimpleNamespace(data={}, config=SimpleNamespace(path=lambda *parts: "/tmp"))
+
+
+def make_calendar(
+    hass, entry_data: dict, menu, entry_id: str = "entry", stored=None, keep: bool = True, url_hash: str = "hash"
+) -> SkolmatCalendarEntity:
+    """
+    Calendar entity on menu with FakeStores. The source history is registered with one
+    for the calendar to acquire on its history load, unless another entry on the source
+    already did.
+    """
+    entry = SimpleNamespace(entry_id=entry_id, data={"name": "Skolan", "url": menu.url, **entry_data})
+    calendar = SkolmatCalendarEntity(hass, entry, menu, url_hash)
+    calendar._store = FakeStore(stored, keep)
+    registry = hass.data.setdefault(DATA_SOURCE_HISTORY, {})
+    if calendar._source_key not in registry:
+        source = registry[calendar._source_key] = SourceHistory(hass, calendar._source_key)
+        source._store = FakeStore(keep=keep)
+    return calendar
@@ -0,0 +1,44 @@
+"""Minimal aiohttp response/session stand-ins for provider fetch tests."""
+
+
+class FakeContent:
+    def __init__(self, body: bytes):
+        self._body = body
+
+    async def iter_chunked(self, n: int):
+        for i in range(0, len(self._body), n):
+            yield self._body[i:i + n]
+
+
+class FakeResponse:
+    def __init__(
+        self,
+        body: bytes | str,
+        content_type: str = "application/json",
+        content_length: int | None = -1,
+        charset: str | None = "utf-8",
+    ):
+        self.body = body.encode() if isinstance(body, str) else body
+        self.content_type = content_type
+        self.charset = charset  # None when the Content-Type has no charset, as in aiohttp
+        self.content_length = len(self.body) if content_length == -1 else content_length
+        self.headers = {"Content-Type": content_type} if content_type else {}
+        self.content = FakeContent(self.body)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+class FakeSession:
+    """Returns the responses produced by handler(url) and records each request."""
+
+    def __init__(self, handler):
+        self.handler = handler
+        self.calls: list[tuple[str, dict]] = []
+
+    def get(self, url, **kwargs):
+        self.calls.append((url, kwargs))
+        return self.handler(url)
@@ -0,0 +1,119 @@
+from tests.helpers import bootstrap  # noqa: F401
+import asyncio
+import json
+from datetime import timedelta
+
+from custom_components.skolmat import calendar as calendar_module
+from menu import Menu
+from tests.helpers.hass import make_calendar, make_hass
+from tests.helpers.http import FakeResponse, FakeSession
+
+URL = "https://menugo.se/m/0381/Gansta_forskola"
+
+
+def menuGoBody(menu: Menu, dish: str = "Fisk") -> str:
+    horizon = menu.horizon
+    days = [
+        {"Datum": f"{(horizon.start + timedelta(days=i)).isoformat()}T00:00:00",
+         "Maträtt": [{"Namn": f"{dish} {i}", "Matgrupp": []}, {"Namn": f"Vego {i}", "Matgrupp": []}]}
+        for i in range(0, 12)
+    ]
+    return json.dumps({"CacheObjekt": {"DatumObjekt": days}}, ensure_ascii=False)
+
+
+def createCalendar(monkeypatch, lunch=("11:00", "12:00")):
+    menu = Menu.createMenu(asyncExecutor=None, url=URL)
+    bodies = [menuGoBody(menu)]
+    session = FakeSession(lambda url: FakeResponse(bodies[-1]))
+    monkeypatch.setattr(calendar_module, "async_get_clientsession", lambda hass: session)
+
+    calendar = make_calendar(make_hass(), {"lunch_begin": lunch[0], "lunch_end": lunch[1]}, menu)
+    return calendar, menu, bodies
+
+
+def test_unchanged_days_reuse_cached_events(monkeypatch):
+    calendar, menu, bodies = createCalendar(monkeypatch)
+    asyncio.run(calendar.async_update())
+    first = {e.key[0]: e for e in calendar._events}
+    assert first
+
+    # a full rebuild (e.g. a new day) reuses the events of unchanged days
+    calendar._events_date = None
+    asyncio.run(calendar.async_update())
+    assert all(first[e.key[0]] is e for e in calendar._events)
+
+    # changed content builds new events for those days only
+    bodies.append(menuGoBody(menu, dish="Soppa"))
+    asyncio.run(menu.getMenu(FakeSession(lambda url: FakeResponse(bodies[-1])), force=True))
+    asyncio.run(calendar.async_update())
+    rebuilt = [e for e in calendar._events if first.get(e.key[0]) is not e]
+    assert rebuilt and all(e.event.summary.startswith("Soppa") for e in rebuilt)
+    assert len(calendar._event_cache) == len(calendar._events)
+
+
+def test_all_day_events_keep_date_bounds(monkeypatch):
+    calendar, _, _ = createCalendar(monkeypatch, lunch=(None, None))
+    asyncio.run(calendar.async_update())
+    day_event = calendar._events[0]
+    assert day_event.event.end - day_event.event.start == timedelta(days=1)
+    assert day_event.start.tzinfo is not None
+
+
+def linearCurrentOrNext(events, now):
+    for e in events:
+        if e.start <= now < e.end or e.start > now:
+            return e.event
+    return None
+
+
+def test_current_event_and_range_lookup_by_bisection(monkeypatch):
+    calendar, _, _ = createCalendar(monkeypatch)
+    asyncio.run(calendar.async_update())
+    events = calendar._events
+    first_start = events[0].start
+
+    real_now = calendar_module.dt_util.now
+    probes = [first_start - timedelta(hours=1)]
+    for e in events:
+        probes += [e.start, e.start + timedelta(minutes=30), e.end, e.end + timedelta(hours=3)]
+    for now in probes:
+        monkeypatch.setattr(calendar_module.dt_util, "now", lambda now=now: now)
+        assert calendar._find_current_or_next() is linearCurrentOrNext(events, now)
+
+    monkeypatch.setattr(calendar_module.dt_util, "now", real_now)
+    window = asyncio.run(calendar.async_get_events(None, events[1].start, events[3].start))
+    assert window == [events[1].event, events[2].event]
+
+
+def test_next_boundary_is_scheduled(monkeypatch):
+    calendar, _, _ = createCalendar(monkeypatch)
+    asyncio.run(calendar.async_update())
+    scheduled = []
+    monkeypatch.setattr(
+        calendar_module, "async_track_point_in_time",
+        lambda hass, action, when: scheduled.append(when) or (lambda: None),
+    )
+    event = calendar._events[-1]
+    calendar._track_boundaries = True
+
+    monkeypatch.setattr(calendar_module.dt_util, "now", lambda: event.start - timedelta(hours=1))
+    calendar._schedule_next_boundary()
+    monkeypatch.setattr(calendar_module.dt_util, "now", lambda: event.start + timedelta(minutes=1))
+    calendar._schedule_next_boundary()
+    monkeypatch.setattr(calendar_module.dt_util, "now", lambda: event.end + timedelta(minutes=1))
+    calendar._schedule_next_boundary()
+
+    midnight = calendar_module.dt_util.start_of_local_day(event.start.date() + timedelta(days=1))
+    assert scheduled == [event.start, event.end, midnight]
+
+
+def test_new_summary_filters_rerender_events(monkeypatch):
+    calendar, menu, _ = createCalendar(monkeypatch)
+    asyncio.run(calendar.async_update())
+    before = {e.key[0]: e.event.summary for e in calendar._events}
+
+    menu.setSummaryFilters({"exclude_regex": ["fisk"]})
+    asyncio.run(calendar.async_update())
+    after = {e.key[0]: e.event.summary for e in calendar._events}
+    today = calendar_module.dt_util.now().date()
+    assert all(after[d] != before[d] for d in after if d > today)
@@ -0,0 +1,233 @@
+from tests.helpers import bootstrap  # noqa: F401
+import asyncio
+import json
+import time
+from datetime import date as Date
+from types import SimpleNamespace
+
+from custom_components.skolmat import config_flow
+from custom_components.skolmat.dayfilter import DayFilter
+from custom_components.skolmat.const import CONF_EXCLUDE_REGEX, CONF_MEALS_SELECTED
+from menu import Menu
+from tests.helpers.http import FakeResponse, FakeSession
+
+
+def entry(dish: str, meal: str = "Lunch", label: str | None = None, order: int = 1) -> dict:
+    return {"meal": meal, "dish": dish, "label": label, "order": order}
+
+
+def createFlow() -> config_flow._SkolmatFlowMixin:
+    flow = config_flow._SkolmatFlowMixin()
+    flow._init_flow_state({"name": "Skolan"})
+    flow._menu = Menu.createMenu(asyncExecutor=None, url="https://meny.mateo.se/molndal/29")
+    flow._menu._menu = {
+        "2026-02-02": [entry("Fiskgratäng", order=1), entry("Linsgryta", label="Vegetarisk", order=2)],
+        "2026-02-03": [entry("Köttbullar", order=1), entry("Pasta", label="Vegetarisk", order=2)],
+        "2026-02-04": [entry("Gröt", meal="Frukost"), entry("Soppa", order=1)],
+    }
+    flow._available_dates = flow._menu_dates_with_entries(flow._menu._menu)
+    return flow
+
+
+def test_preview_table_covers_all_dates():
+    flow = createFlow()
+    flow._data[CONF_EXCLUDE_REGEX] = ["gryta"]
+    flow._build_preview()
+
+    lines = flow._preview_table.splitlines()
+    assert [line.split(":")[0] for line in lines] == ["2026-02-02 Mon", "2026-02-03 Tue", "2026-02-04 Wed"]
+    assert "Linsgryta" not in lines[0]
+    assert "Fiskgratäng" in lines[0]
+    assert flow._summary in lines[0]
+
+
+def test_compiled_filters_are_cached_by_configuration(monkeypatch):
+    flow = createFlow()
+    compiled = []
+    original = config_flow.DayFilter
+    monkeypatch.setattr(config_flow, "DayFilter", lambda cfg: compiled.append(cfg) or original(cfg))
+
+    flow._data[CONF_MEALS_SELECTED] = ["Lunch"]
+    flow._build_preview()
+    assert len(compiled) == 1
+
+    # stepping dates and rebuilding reuses the compiled filter
+    flow._date_index = 2
+    flow._build_preview()
+    assert len(compiled) == 1
+
+    flow._data[CONF_EXCLUDE_REGEX] = ["soppa"]
+    flow._build_preview()
+    assert len(compiled) == 2
+    assert flow._available_dates[flow._date_index] == Date(2026, 2, 4)
+
+
+def test_options_filter_only_change_detection():
+    flow = config_flow.SkolmatOptionsFlowHandler.__new__(config_flow.SkolmatOptionsFlowHandler)
+    flow._init_flow_state({"name": "Skolan", "url": "https://meny.mateo.se/molndal/29", CONF_EXCLUDE_REGEX: []})
+    previous = dict(flow._data)
+
+    flow._data[CONF_EXCLUDE_REGEX] = ["gryta"]
+    flow._data[CONF_MEALS_SELECTED] = ["Lunch"]
+    assert flow._filters_only_changed(previous)
+
+    flow._data["processor_file"] = "karlskoga_aldreomsorg"
+    assert not flow._filters_only_changed(previous)
+
+
+def validate(flow, exclude: list[str]) -> str | None:
+    flow._data[CONF_EXCLUDE_REGEX] = exclude
+    return asyncio.run(flow._validate_patterns())
+
+
+def test_pattern_validation_accepts_plain_keywords():
+    flow = createFlow()
+    assert validate(flow, ["gryta", "veg(etarisk)?", "fisk|kött"]) is None
+
+
+def test_pattern_validation_rejects_invalid_and_nested_repeats():
+    flow = createFlow()
+    assert validate(flow, ["gryta", "(unclosed"]) == "invalid_regex"
+    assert validate(flow, ["(\\w+\\s?)*$"]) == "unsafe_regex"
+    assert validate(flow, ["(a+)+b"]) == "unsafe_regex"
+
+
+def test_pattern_validation_rejects_slow_patterns(monkeypatch):
+    flow = createFlow()
+    async def slow(pattern, entries, timeout):
+        return config_flow.REGEX_TIME_BUDGET * 2
+
+    monkeypatch.setattr(config_flow, "async_benchmark_pattern", slow)
+    assert validate(flow, ["gryta"]) == "slow_regex"
+
+
+def test_runaway_pattern_is_killed_without_stalling_the_loop(monkeypatch):
+    # alternation blowup the nested repeat heuristic does not catch
+    flow = createFlow()
+    flow._menu._menu["2026-02-20"] = [entry("a" * 40)]
+    flow._data[CONF_EXCLUDE_REGEX] = ["(a|aa)*c"]
+    monkeypatch.setattr(config_flow, "REGEX_PROBE_TIMEOUT", 0.5)
+    ticks = []
+
+    async def ticker():
+        while True:
+            ticks.append(time.perf_counter())
+            await asyncio.sleep(0.05)
+
+    async def main():
+        task = asyncio.ensure_future(ticker())
+        started = time.perf_counter()
+        try:
+            return await flow._validate_patterns(), time.perf_counter() - started
+        finally:
+            task.cancel()
+
+    error, elapsed = asyncio.run(main())
+    assert error == "slow_regex"
+    assert elapsed < 2
+    assert max(b - a for a, b in zip(ticks, ticks[1:])) < 0.3
+
+
+def test_compiled_patterns_are_shared():
+    first = DayFilter({CONF_EXCLUDE_REGEX: ["gryta"]})
+    second = DayFilter({CONF_EXCLUDE_REGEX: ["gryta"]})
+    assert first._config["exclude"]["regex"][0] is second._config["exclude"]["regex"][0]
+
+
+def mateoBody() -> str:
+    today = Date.today().isoformat()
+    return json.dumps([{"date": f"{today}T00:00:00", "meals": [{"name": "Soppa", "labels": [], "type": "Lunch"}]}])
+
+
+def createOptionsFlow(monkeypatch):
+    # options flow on a running entry whose menu was fetched once at setup
+    session = FakeSession(lambda url: FakeResponse(mateoBody()))
+    monkeypatch.setattr(config_flow, "async_get_clientsession", lambda hass: session)
+    monkeypatch.setattr(config_flow, "async_dispatcher_send", lambda hass, signal: None)
+
+    async def load_processor(hass, processor_file, processor_fn):
+        return None, None
+
+    monkeypatch.setattr(config_flow, "async_load_processor", load_processor)
+
+    live = Menu.createMenu(asyncExecutor=None, url="https://meny.mateo.se/molndal/29")
+    asyncio.run(live.getMenu(session))
+    reloads = []
+
+    async def async_executor(target, *args):
+        return target(*args)
+
+    async def async_reload(entry_id):
+        reloads.append(entry_id)
+
+    entry = SimpleNamespace(entry_id="entry", data={"name": "Skolan", "url": live.url, "provider": live.provider}, options={})
+    flow = config_flow.SkolmatOptionsFlowHandler(entry)
+    flow.hass = SimpleNamespace(
+        data={config_flow.DOMAIN: {"entry": {"menu": live}}},
+        async_add_executor_job=async_executor,
+        config_entries=SimpleNamespace(async_update_entry=lambda entry, data: None, async_reload=async_reload),
+    )
+    asyncio.run(flow.async_step_init())
+    return flow, live, session, reloads
+
+
+def submit(flow, **user_input):
+    data = {CONF_MEALS_SELECTED: [], CONF_EXCLUDE_REGEX: [], "prefer_regex": [], "done_configuring": True, **user_input}
+    return asyncio.run(flow.async_step_configure(data))
+
+
+def test_options_flow_reuses_the_live_menu(monkeypatch):
+    flow, live, session, reloads = createOptionsFlow(monkeypatch)
+    assert flow._menu is live and len(session.calls) == 1
+
+    # filter-only save: no fetch, no reload
+    assert submit(flow)["type"] == "create_entry"
+    assert len(session.calls) == 1 and reloads == []
+
+    # a changed processor rebuilds the menu with it, once, and reloads the entry
+    flow, live, session, reloads = createOptionsFlow(monkeypatch)
+    submit(flow, processor_file="karlskoga_aldreomsorg", processor_fn="entryProcessor")
+    assert flow._menu is not live
+    assert len(session.calls) == 2 and reloads == ["entry"]
+
+    # so does an explicit reload with the same processor
+    flow, live, session, reloads = createOptionsFlow(monkeypatch)
+    submit(flow, reload_processor=True)
+    assert flow._menu is not live
+    assert len(session.calls) == 2 and reloads == ["entry"]
+
+
+def test_options_flow_reloads_on_entry_settings(monkeypatch):
+    flow, live, session, reloads = createOptionsFlow(monkeypatch)
+    schema = flow._schema_configure().schema
+    assert {"weeks", "archive_years"} <= {str(key) for key in schema}
+
+    # the form posts the defaults back, an entry without them is not reloaded for that
+    submit(flow, weeks=2, archive_years=0)
+    assert reloads == [] and "weeks" not in flow._data
+
+    flow, live, session, reloads = createOptionsFlow(monkeypatch)
+    submit(flow, weeks=4, archive_years=0)
+    assert flow._data["weeks"] == 4 and reloads == ["entry"]
+
+
+def test_patterns_are_probed_once_per_flow(monkeypatch):
+    flow, live, session, reloads = createOptionsFlow(monkeypatch)
+    flow.entry.data[CONF_EXCLUDE_REGEX] = ["gryta"]
+    flow._init_flow_state(dict(flow.entry.data))
+    asyncio.run(flow._run_discovery(live))
+    probed = []
+
+    async def probe(pattern, entries, timeout):
+        probed.append(pattern)
+        return 0.0 if pattern != "(a|aa)*c" else config_flow.REGEX_TIME_BUDGET * 2
+
+    monkeypatch.setattr(config_flow, "async_benchmark_pattern", probe)
+
+    # the saved pattern is not probed again, new ones once however often the form is submitted
+    for _ in range(3):
+        submit(flow, exclude_regex=["gryta", "/fisk|kött/"], done_configuring=False)
+    assert probed == ["fisk|kött"]
+    for _ in range(2):
+        assert submit(flow, exclude_regex=["/(a|aa)*c/"], done_configuring=False)["errors"] == {"base": "slow_regex"}
+    assert probed == ["fisk|kött", "(a|aa)*c"]
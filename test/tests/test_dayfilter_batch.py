@@ -0,0 +1,67 @@
+from tests.helpers import bootstrap  # noqa: F401
+from datetime import date as Date
+
+import pytest
+
+from custom_components.skolmat.dayfilter import DayFilter
+from menu import Menu
+from tests.helpers.test_helpers import FIXTURES, USECASES
+
+
+FILTERS = [
+    {},
+    {"meals_selected": ["Lunch"]},
+    {"meals_selected": ["Frukost"]},
+    {"exclude_regex": ["fisk", "veg"], "prefer_regex": ["kyckling", "alt 1"]},
+    {"exclude_regex": [".*"], "max_entries": 1},
+    {"meals_selected": ["Lunch"], "prefer_regex": ["soppa", "pasta", "ALT"], "max_entries": 2},
+]
+
+
+def fixtureMenus() -> list[dict]:
+    today = Date.today().isoformat()
+    return [*(t["data"] for t in FIXTURES["tests"]), {today: uc["entries"] for uc in USECASES.values()}]
+
+
+@pytest.mark.parametrize("filters", FILTERS)
+def test_filter_many_matches_per_day_filter(filters):
+    day_filter = DayFilter(filters)
+    for menu in fixtureMenus():
+        batch = day_filter.filter_many(menu)
+        assert batch["days"] == {isodate: day_filter.filter(entries) for isodate, entries in menu.items()}
+
+
+def test_filter_many_reports_fallbacks():
+    day_filter = DayFilter({"meals_selected": ["Frukost"], "exclude_regex": [".*", "Dish A"]})
+    menu = {
+        "2026-02-02": [
+            {"meal": "Lunch", "label": None, "dish": "Dish A", "order": 1},
+            {"meal": "Lunch", "label": None, "dish": "Dish B", "order": 2},
+        ],
+        "2026-02-03": [
+            {"meal": "Frukost", "label": None, "dish": "Gröt", "order": 1},
+        ],
+        "2026-02-04": [],
+    }
+
+    batch = day_filter.filter_many(menu)
+
+    assert [e["dish"] for e in batch["days"]["2026-02-02"]] == ["Dish B"]
+    assert batch["days"]["2026-02-04"] == []
+    assert len(batch["fallbacks"]["2026-02-02"]) == 2  # meal focus and the ".*" exclusion
+    assert "meal_focus" in batch["fallbacks"]["2026-02-02"][0]
+    assert "'.*'" in batch["fallbacks"]["2026-02-02"][1]
+    assert len(batch["fallbacks"]["2026-02-03"]) == 1  # only ".*" would empty the day
+    assert "2026-02-04" not in batch["fallbacks"]
+
+
+def test_readable_day_summaries_match_single_day():
+    test = next(t for t in FIXTURES["tests"] if t["name"] == "mashie1")
+    menu = Menu.createMenu(asyncExecutor=None, url="https://sodexo.mashie.com/public/app/Akademikrogen%20skolor/d47bc6bf")
+    menu._menu = test["data"]
+    menu.setSummaryFilters({"exclude_regex": ["veg"], "max_entries": 1})
+
+    days = [Date.fromisoformat(isodate) for isodate in sorted(menu._menu)] + [Date(1999, 1, 1)]
+    summaries = menu.getReadableDaySummaries(days)
+
+    assert summaries == {d.isoformat(): menu.getReadableDaySummary(d) for d in days if d.isoformat() in menu._menu}
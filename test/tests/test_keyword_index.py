@@ -0,0 +1,76 @@
+from tests.helpers import bootstrap  # noqa: F401
+from datetime import date as Date
+
+from custom_components.skolmat.keywordindex import KeywordIndex
+from menu import Menu
+
+
+def entry(dish: str, meal: str | None = "Lunch", label: str | None = None) -> dict:
+    return {"meal": meal, "dish": dish, "label": label, "order": 1}
+
+
+def createMenu() -> Menu:
+    return Menu.createMenu(asyncExecutor=None, url="https://meny.mateo.se/molndal/29")
+
+
+def load(menu: Menu, days: dict[str, list[dict]]):
+    # what a provider load does: entries go through _addMenuEntry, then get merged
+    loaded = {}
+    menu._stagedKeywords = {}
+    for isodate, entries in days.items():
+        for e in entries:
+            menu._addMenuEntry(loaded, Date.fromisoformat(isodate), e)
+    return menu._mergeMenu(loaded)
+
+
+def test_index_tracks_presence_and_first_seen():
+    index = KeywordIndex()
+    index.setDay("2026-02-03", ["Lunch"], ["Vegetarisk"])
+    index.setDay("2026-02-02", ["Lunch", "Middag"], [])
+    assert index.dates() == ["2026-02-02", "2026-02-03"]
+    assert index.mealDays("Lunch") == {"2026-02-02", "2026-02-03"}
+    assert index.firstSeen("Vegetarisk") == "2026-02-03"
+
+    index.setDay("2026-02-02", ["Lunch"], [])
+    assert index.meals() == {"Lunch"}
+    index.removeDay("2026-02-03")
+    assert index.labels() == set()
+
+
+def test_merge_updates_index_incrementally(monkeypatch):
+    menu = createMenu()
+    load(menu, {
+        "2026-02-02": [entry("Fisk", label="Fisk"), entry("Soppa", meal="Middag")],
+        "2026-02-03": [entry("Pasta", label="Vegetarisk")],
+    })
+    assert menu._getKeywordIndex().dayKeywords("2026-02-02") == (["Lunch", "Middag"], ["Fisk"])
+
+    # only the changed day is re-indexed, from the keywords staged by _addMenuEntry
+    reindexed = []
+    original = menu._keywordIndex.setDay
+    monkeypatch.setattr(menu._keywordIndex, "setDay", lambda d, *kw: reindexed.append(d) or original(d, *kw))
+    load(menu, {
+        "2026-02-02": [entry("Fisk", label="Fisk"), entry("Soppa", meal="Middag")],
+        "2026-02-04": [entry("Gryta", label="Kött")],
+    })
+    assert reindexed == ["2026-02-04"]
+
+    index = menu._getKeywordIndex()
+    assert index.dates() == ["2026-02-02", "2026-02-04"]
+    assert index.labels() == {"Fisk", "Kött"}
+
+    keywords = menu.getSummaryFilterKeywords(reference_date=Date(2026, 2, 4))
+    assert keywords["meals"] == ["Lunch"]
+    assert keywords["labels"] == ["Kött"]
+    assert "Warning" in keywords["info"]
+
+
+def test_directly_assigned_menu_rebuilds_index():
+    menu = createMenu()
+    load(menu, {"2026-02-02": [entry("Fisk", label="Fisk")]})
+    menu._menu = {"2026-02-05": [entry("Soppa", meal="Middag")], "2026-02-06": []}
+
+    keywords = menu.getSummaryFilterKeywords(reference_date=Date(2026, 2, 6))
+    assert keywords["meals"] == ["Middag"]
+    assert keywords["labels"] == []
+    assert menu._getKeywordIndex().dates() == ["2026-02-05"]
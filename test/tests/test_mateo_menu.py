@@ -0,0 +1,68 @@
+import asyncio
+import json
+from datetime import date as Date
+from urllib.parse import parse_qs, urlparse
+
+import menu as menu_module
+from custom_components.skolmat.providers import mateo as mateo_module
+from menu import MateoMenu
+from tests.helpers.http import FakeResponse
+
+
+class FakeDate(Date):
+    current = Date(2026, 2, 4)  # Wednesday
+
+    @classmethod
+    def today(cls):
+        return cls.current
+
+
+class FakeSession:
+    def __init__(self):
+        self.requests: list[tuple[str, str]] = []
+
+    def get(self, url, **kwargs):
+        query = parse_qs(urlparse(url).query)
+        start, end = query["from"][0], query["to"][0]
+        self.requests.append((start, end))
+        days = []
+        for ordinal in range(Date.fromisoformat(start).toordinal(), Date.fromisoformat(end).toordinal() + 1):
+            d = Date.fromordinal(ordinal)
+            if d.weekday() < 5:
+                days.append({
+                    "date": f"{d.isoformat()}T00:00:00",
+                    "meals": [{"name": f"Dish {d.isoformat()}", "labels": [], "type": "Lunch"}],
+                })
+        return FakeResponse(json.dumps(days))
+
+
+def test_mateo_refresh_requests_only_today_onward(monkeypatch):
+    monkeypatch.setattr(menu_module, "date", FakeDate)
+    monkeypatch.setattr(mateo_module, "date", FakeDate)
+    menu = MateoMenu(asyncExecutor=None, url="https://meny.mateo.se/molndal/375")
+    session = FakeSession()
+
+    first = asyncio.run(menu.getMenu(session))
+    assert session.requests == [("2026-02-02", "2026-02-15")]
+    assert "2026-02-02" in first
+
+    monkeypatch.setattr(FakeDate, "current", Date(2026, 2, 5))
+    second = asyncio.run(menu.getMenu(session, force=True))
+    assert session.requests[-1] == ("2026-02-05", "2026-02-15")
+
+    # past days of the week are kept from the previous fetch
+    assert second["2026-02-02"] == first["2026-02-02"]
+    assert sorted(second.keys()) == sorted(first.keys())
+
+
+def test_mateo_new_week_requests_full_window(monkeypatch):
+    monkeypatch.setattr(menu_module, "date", FakeDate)
+    monkeypatch.setattr(mateo_module, "date", FakeDate)
+    menu = MateoMenu(asyncExecutor=None, url="https://meny.mateo.se/molndal/375")
+    session = FakeSession()
+
+    asyncio.run(menu.getMenu(session))
+    monkeypatch.setattr(FakeDate, "current", Date(2026, 2, 9))  # next monday
+    refreshed = asyncio.run(menu.getMenu(session, force=True))
+    assert session.requests[-1] == ("2026-02-09", "2026-02-22")
+    assert "2026-02-02" not in refreshed
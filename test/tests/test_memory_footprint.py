@@ -0,0 +1,114 @@
+"""
+Memory footprint of menus, sensor attributes and calendar history, measured with tracemalloc.
+
+Run with -s to see the report. Limits are about 1.5x what was measured when they were set
+(CPython 3.11, 64-bit), so they catch a regression in how entries are held, not interpreter noise.
+"""
+
+from tests.helpers import bootstrap  # noqa: F401
+import asyncio
+import gc
+import json
+import tracemalloc
+from datetime import date as Date, datetime, timedelta
+
+import pytest
+
+from custom_components.skolmat import calendar as calendar_module
+from custom_components.skolmat.const import CALENDAR_HISTORY_DAYS
+from fixtures.providers import PROVIDERS
+from fixtures.synthetic import generateMenu
+from menu import Menu
+from tests.helpers.hass import make_calendar, make_hass
+from tests.helpers.test_helpers import FIXTURES, UCTestMenu
+
+MENU_BYTES_PER_ENTRY = 2750          # Menu with merged days, digests and keyword index
+ATTRIBUTE_BYTES_PER_ENTRY = 400      # sensor attributes as serialized for the state machine
+HISTORY_BYTES_PER_DAY = 1450         # calendar history plus its built events
+
+
+def measure(build) -> tuple[int, object]:
+    # bytes still allocated after build() returns, its result is kept alive until measured
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        result = build()
+        gc.collect()
+        return tracemalloc.get_traced_memory()[0] - before, result
+    finally:
+        tracemalloc.stop()
+
+
+def report(what: str, total: int, count: int, unit: str):
+    print(f"{what:<24} {total:>10} B  {count:>5} {unit:<8} {total / max(count, 1):>8.0f} B/{unit}")
+
+
+def loadMenu(name: str, raw: str) -> Menu:
+    menu = Menu.createMenu(asyncExecutor=None, url=PROVIDERS[name]["url"])
+    menu._mergeMenu(json.loads(raw))
+    menu.getSummaryFilterKeywords()
+    return menu
+
+
+@pytest.mark.parametrize("test", [t for t in FIXTURES["tests"] if t["name"] in PROVIDERS], ids=lambda t: t["name"])
+def test_menu_and_attributes_memory_per_entry(test):
+    raw = json.dumps(test["data"], ensure_ascii=False)
+    entries = sum(len(day) for day in test["data"].values())
+    loadMenu(test["name"], raw)  # warm up import and regex caches
+
+    menu_bytes, menu = measure(lambda: loadMenu(test["name"], raw))
+    attrs = {"provider": menu.provider, "url": menu.url, "updated": datetime.now().isoformat(), "calendar": menu._menu}
+    attr_bytes, _ = measure(lambda: json.dumps(attrs, ensure_ascii=False).encode())
+
+    report(f"{test['name']} menu", menu_bytes, entries, "entry")
+    report(f"{test['name']} attributes", attr_bytes, entries, "entry")
+    assert menu_bytes / entries < MENU_BYTES_PER_ENTRY
+    assert attr_bytes / entries < ATTRIBUTE_BYTES_PER_ENTRY
+
+
+def storedHistory(today: Date) -> dict:
+    # what a calendar persists after CALENDAR_HISTORY_DAYS of daily updates
+    start = today - timedelta(days=CALENDAR_HISTORY_DAYS)
+    menu = UCTestMenu(asyncExecutor=None, url="uc://synthetic")
+    menu._menu = generateMenu(start, CALENDAR_HISTORY_DAYS, shape="UC-C", meals=2, alternatives=3, weekends=True)
+    menu.setSummaryFilters({"meals_selected": ["Lunch"]})
+    events = []
+    for isodate in sorted(menu._menu):
+        d = Date.fromisoformat(isodate)
+        events.append({"date": isodate, "course": menu.getReadableDaySummary(d), "menu": menu.getReadableDayMenu(d)})
+    return {"events": events}
+
+
+def test_calendar_history_memory_per_day(monkeypatch):
+    monkeypatch.setattr(calendar_module, "async_get_clientsession", lambda hass: None)
+    today = Date.today()
+    stored = json.dumps(storedHistory(today), ensure_ascii=False)
+
+    def build(hass=None, entry_id="entry"):
+        menu = UCTestMenu(asyncExecutor=None, url="uc://synthetic")
+        menu._mergeMenu({})
+        menu.last_menu_fetch = datetime.now()
+        # stores keep nothing, like a Store with no pending write
+        calendar = make_calendar(
+            hass or make_hass(), {"lunch_begin": "11:00", "lunch_end": "12:00"}, menu,
+            entry_id=entry_id, stored=json.loads(stored), keep=False,
+        )
+        asyncio.run(calendar._async_load_history())
+        asyncio.run(calendar.async_update())
+        return calendar
+
+    build()  # warm up
+    history_bytes, calendar = measure(build)
+    days = len(calendar._history)
+
+    report("calendar history", history_bytes, days, "day")
+    assert days >= CALENDAR_HISTORY_DAYS
+    assert len(calendar._events) >= CALENDAR_HISTORY_DAYS
+    assert history_bytes / days < HISTORY_BYTES_PER_DAY
+
+    # another entry on the same source shares the full menus, its events still hold references
+    shared_bytes, second = measure(lambda: build(calendar.hass, "second"))
+    report("  + entry, same source", shared_bytes, days, "day")
+    assert second._source is calendar._source
+    assert shared_bytes < history_bytes
@@ -0,0 +1,64 @@
+from tests.helpers import bootstrap  # noqa: F401
+from copy import deepcopy
+
+from tests.helpers.test_helpers import UCTestMenu, USECASES
+
+
+def _menu() -> UCTestMenu:
+    return UCTestMenu(asyncExecutor=None, url="uc://synthetic")
+
+
+def test_merge_reports_added_changed_removed():
+    menu = _menu()
+    first = {
+        "2026-02-02": USECASES["UC-A"]["entries"],
+        "2026-02-03": USECASES["UC-C"]["entries"],
+    }
+
+    changes = menu._mergeMenu(deepcopy(first))
+    assert changes["added"] == {"2026-02-02", "2026-02-03"}
+    assert menu.version == 1
+
+    second = deepcopy(first)
+    second.pop("2026-02-02")
+    second["2026-02-03"][0]["dish"] = "Dish X"
+    second["2026-02-04"] = USECASES["UC-A"]["entries"]
+
+    changes = menu._mergeMenu(second)
+    assert changes["added"] == {"2026-02-04"}
+    assert changes["changed"] == {"2026-02-03"}
+    assert changes["removed"] == {"2026-02-02"}
+    assert menu.version == 2
+
+
+def test_merge_unchanged_keeps_version_and_entries():
+    menu = _menu()
+    data = {"2026-02-02": USECASES["UC-A"]["entries"]}
+    menu._mergeMenu(deepcopy(data))
+    entries = menu._menu["2026-02-02"]
+
+    changes = menu._mergeMenu(deepcopy(data))
+    assert menu.version == 1
+    assert not changes["added"] | changes["changed"] | changes["removed"]
+    assert menu._menu["2026-02-02"] is entries
+
+
+def test_changes_since_aggregates_and_expires():
+    menu = _menu()
+    menu._mergeMenu({"2026-02-02": deepcopy(USECASES["UC-A"]["entries"])})
+    menu._mergeMenu({
+        "2026-02-02": deepcopy(USECASES["UC-C"]["entries"]),
+        "2026-02-03": deepcopy(USECASES["UC-A"]["entries"]),
+    })
+
+    changes = menu.getChangesSince(1)
+    assert changes["added"] == {"2026-02-03"}
+    assert changes["changed"] == {"2026-02-02"}
+
+    changes = menu.getChangesSince(0)
+    assert changes["added"] == {"2026-02-02", "2026-02-03"}
+    assert menu.getChangesSince(None) is None
+
+    for n in range(menu._CHANGE_LOG_SIZE + 1):
+        menu._mergeMenu({"2026-02-02": [dict(USECASES["UC-A"]["entries"][0], dish=f"Dish {n}")]})
+    assert menu.getChangesSince(1) is None
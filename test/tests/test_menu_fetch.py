@@ -0,0 +1,95 @@
+from tests.helpers import bootstrap  # noqa: F401
+import asyncio
+import json
+
+import pytest
+
+import menu as menu_module
+from menu import Menu, decodeJson
+from tests.helpers.http import FakeResponse, FakeSession
+
+PAYLOAD = {"name": "Köttbullar med potatismos", "days": [1, 2.5, None, True]}
+
+
+class TagString(str):
+    """Stands in for bs4's NavigableString (a str subclass)."""
+
+
+def mateoMenu() -> Menu:
+    return Menu.createMenu(asyncExecutor=None, url="https://meny.mateo.se/molndal/29")
+
+
+def test_decode_json_bytes_and_str():
+    raw = json.dumps(PAYLOAD, ensure_ascii=False)
+    assert decodeJson(raw.encode()) == PAYLOAD
+    assert decodeJson(raw) == PAYLOAD
+    assert decodeJson(TagString(raw)) == PAYLOAD
+
+
+def test_decode_json_stdlib_fallback(monkeypatch):
+    monkeypatch.setattr(menu_module, "orjson", None)
+    raw = json.dumps(PAYLOAD, ensure_ascii=False)
+    assert decodeJson(raw.encode()) == PAYLOAD
+    assert decodeJson(raw) == PAYLOAD
+
+
+def test_fetch_json_streams_body_and_counts_bytes(monkeypatch):
+    menu = mateoMenu()
+    monkeypatch.setattr(menu, "_READ_CHUNK_BYTES", 7)
+    body = json.dumps(PAYLOAD).encode()
+    session = FakeSession(lambda url: FakeResponse(body, "application/json"))
+
+    data = asyncio.run(menu._fetchJson(session, "https://example.test/api", headers={"Accept": "application/json"}))
+    assert data == PAYLOAD
+    assert menu._bytesRead == len(body)
+    assert session.calls[0][1]["headers"] == {"Accept": "application/json"}
+    assert session.calls[0][1]["raise_for_status"] is True
+
+
+def test_fetch_aborts_on_declared_oversize():
+    menu = mateoMenu()
+    body = b"x" * (menu.MAX_BODY_BYTES + 1)
+    session = FakeSession(lambda url: FakeResponse(body, "application/json"))
+    with pytest.raises(ValueError, match="too large"):
+        asyncio.run(menu._fetchJson(session, "https://example.test/api"))
+    assert menu._bytesRead == 0
+
+
+def test_fetch_aborts_while_streaming_without_content_length(monkeypatch):
+    menu = mateoMenu()
+    monkeypatch.setattr(menu, "MAX_BODY_BYTES", 100)
+    session = FakeSession(lambda url: FakeResponse(b"[" + b"1," * 200 + b"1]", content_length=None))
+    with pytest.raises(ValueError, match="too large"):
+        asyncio.run(menu._fetchJson(session, "https://example.test/api"))
+
+
+def test_fetch_rejects_wrong_content_type():
+    menu = mateoMenu()
+    session = FakeSession(lambda url: FakeResponse(b"<html>error</html>", "text/html"))
+    with pytest.raises(ValueError, match="content type"):
+        asyncio.run(menu._fetchJson(session, "https://example.test/api"))
+
+    # servers that send no content type are not rejected
+    session = FakeSession(lambda url: FakeResponse(json.dumps(PAYLOAD), content_type=""))
+    assert asyncio.run(menu._fetchJson(session, "https://example.test/api")) == PAYLOAD
+
+
+def test_fetch_text_decodes_undeclared_latin1():
+    menu = mateoMenu()
+    html = "<html><body>Fiskgratäng med potatismos, Ärtsoppa</body></html>"
+    session = FakeSession(lambda url: FakeResponse(html.encode("latin-1"), "text/html", charset=None))
+    assert asyncio.run(menu._fetchText(session, "https://example.test/menu")) == html
+
+    # utf-8 without a charset, and a declared charset, still decode as such
+    session = FakeSession(lambda url: FakeResponse(html.encode(), "text/html", charset=None))
+    assert asyncio.run(menu._fetchText(session, "https://example.test/menu")) == html
+    session = FakeSession(lambda url: FakeResponse(html.encode("latin-1"), "text/html", charset="iso-8859-1"))
+    assert asyncio.run(menu._fetchText(session, "https://example.test/menu")) == html
+
+
+def test_get_menu_records_loaded_bytes():
+    menu = mateoMenu()
+    body = json.dumps([{"date": "2026-02-02T00:00:00", "meals": [{"name": "Soppa", "labels": [], "type": "Lunch"}]}]).encode()
+    session = FakeSession(lambda url: FakeResponse(body))
+    asyncio.run(menu.getMenu(session))
+    assert menu.last_menu_bytes == len(body)
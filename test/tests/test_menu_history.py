@@ -0,0 +1,274 @@
+from tests.helpers import bootstrap  # noqa: F401
+import asyncio
+import json
+from datetime import date as Date, datetime, timedelta
+
+from custom_components.skolmat import calendar as calendar_module
+from custom_components.skolmat import history as history_module
+from custom_components.skolmat.const import CALENDAR_HISTORY_DAYS
+from custom_components.skolmat.history import (
+    DATA_SOURCE_HISTORY,
+    DayTexts,
+    MenuArchive,
+    SourceHistory,
+    load_entry_history,
+    source_key,
+)
+from fixtures.synthetic import generateMenu
+from tests.helpers.hass import FakeStore, make_calendar, make_hass
+from tests.helpers.test_helpers import UCTestMenu
+
+
+def eventsStore(days: int = 60) -> dict:
+    # per-event format, one full text copy per day
+    menu = UCTestMenu(asyncExecutor=None, url="uc://synthetic")
+    menu._menu = generateMenu(Date(2026, 1, 5), days, shape="UC-A", meals=2, alternatives=3)
+    events = []
+    for isodate in sorted(menu._menu):
+        d = Date.fromisoformat(isodate)
+        events.append({"date": isodate, "course": menu.getReadableDaySummary(d), "menu": menu.getReadableDayMenu(d)})
+    return {"events": events}
+
+
+def test_day_texts_round_trip_and_share_repeated_texts():
+    legacy = eventsStore()
+    texts = DayTexts()
+    for event in legacy["events"]:
+        texts.set(event["date"], event["menu"])
+
+    stored = json.loads(json.dumps(texts.as_store()))
+    loaded = DayTexts.from_store(stored)
+    assert list(loaded.items()) == [(e["date"], e["menu"]) for e in legacy["events"]]
+
+    # rotation repeats days, each distinct text is held and stored once
+    seen = {}
+    assert all(seen.setdefault(text, text) is text for _, text in loaded.items())
+    assert len(stored["strings"]) < len(legacy["events"]) / 2
+
+
+def test_set_reports_changes_and_prune_compacts():
+    texts = DayTexts()
+    assert texts.set("2026-02-02", "Fisk")
+    assert not texts.set("2026-02-02", "Fisk")
+    assert texts.set("2026-02-02", "Soppa")
+    assert texts.set("2026-02-03", "Fisk")
+    assert texts.get("2026-02-02") == "Soppa"
+    assert texts.get("2026-02-04") is None
+
+    # replaced texts are dropped from the table on prune, even when no day is dropped
+    assert not texts.prune("2026-02-01")
+    assert sorted(texts.as_store()["strings"]) == ["Fisk", "Soppa"]
+
+    assert texts.prune("2026-02-03")
+    assert "2026-02-02" not in texts
+    assert texts.as_store() == {"strings": ["Fisk"], "days": [["2026-02-03", 0]]}
+
+
+def test_older_entry_formats_load():
+    legacy = eventsStore(10)
+    summaries, menus, was_legacy = load_entry_history(legacy)
+    assert was_legacy
+    assert list(summaries.items()) == [(e["date"], e["course"]) for e in legacy["events"]]
+    assert list(menus.items()) == [(e["date"], e["menu"]) for e in legacy["events"]]
+
+    # dictionary encoded summaries, rows that do not resolve are skipped
+    stored = {"strings": ["Fisk"], "days": [["2026-02-02", 0], ["2026-02-03", 5], ["bad"]]}
+    summaries, menus, was_legacy = load_entry_history(stored)
+    assert not was_legacy and not len(menus)
+    assert list(summaries.items()) == [("2026-02-02", "Fisk")]
+    assert load_entry_history(None)[2] is False
+
+
+def test_entries_on_one_source_share_menu_history(monkeypatch):
+    monkeypatch.setattr(calendar_module, "async_get_clientsession", lambda hass: None)
+    hass = make_hass()
+    today = Date.today()
+    menu = UCTestMenu(asyncExecutor=None, url="uc://synthetic")
+    menu._mergeMenu(generateMenu(today, 5, weekends=True))
+    menu.last_menu_fetch = datetime.now()
+
+    legacy = {"events": [{"date": "2020-01-01", "course": "Gammal", "menu": "• Gammal"}]}
+    first = make_calendar(hass, {}, menu, entry_id="a", stored=legacy)
+    second = make_calendar(hass, {}, menu, entry_id="b")
+    processor = {"processor_file": "karlskoga_aldreomsorg", "processor_fn": "entryProcessor"}
+    other = make_calendar(hass, processor, menu, entry_id="c")
+
+    for calendar in (first, second):
+        asyncio.run(calendar._async_load_history())
+        asyncio.run(calendar.async_update())
+    asyncio.run(other._async_load_history())
+    source = first._source
+    assert second._source is source and other._source is not source
+    assert source.key == "hash" and other._source.key == source_key("hash", "karlskoga_aldreomsorg", "entryProcessor")
+
+    # the source wrote today's menu once, entries store summaries only
+    assert source._store.saves == 1
+    assert source.menus.get(today.isoformat())
+    assert "2020-01-01" not in source.menus  # migrated from the legacy entry history, then pruned
+    assert first._store.data["days"] == [[today.isoformat(), 0]]
+    assert first._store.data == second._store.data
+
+    for calendar in (first, second, other):
+        calendar._source.release(hass)
+    assert hass.data[DATA_SOURCE_HISTORY] == {}
+
+
+def test_calendars_loading_at_once_wait_for_the_source(monkeypatch):
+    monkeypatch.setattr(calendar_module, "async_get_clientsession", lambda hass: None)
+    hass = make_hass()
+    today = Date.today()
+    yesterday = (today - timedelta(days=1)).isoformat()
+    menu = UCTestMenu(asyncExecutor=None, url="uc://synthetic")
+    menu._mergeMenu(generateMenu(today, 5, weekends=True))
+    menu.last_menu_fetch = datetime.now()
+
+    class SlowStore(FakeStore):
+        async def async_load(self):
+            await asyncio.sleep(0.01)
+            return await super().async_load()
+
+    calendars = [make_calendar(hass, {}, menu, entry_id=entry_id) for entry_id in ("a", "b")]
+    source = hass.data[DATA_SOURCE_HISTORY]["hash"]
+    source._store = SlowStore({"strings": ["[Lunch]\n• Gammal"], "days": [[yesterday, 0]]})
+
+    async def setup(calendar):
+        await calendar._async_load_history()
+        await calendar.async_update()
+
+    async def main():
+        await asyncio.gather(*(setup(calendar) for calendar in calendars))
+
+    asyncio.run(main())
+    assert source._store.saves == 1
+    assert [row[0] for row in source._store.data["days"]] == [yesterday, today.isoformat()]
+
+
+def test_calendar_rebuilds_events_once_history_is_loaded(monkeypatch):
+    monkeypatch.setattr(calendar_module, "async_get_clientsession", lambda hass: None)
+    monkeypatch.setattr(calendar_module, "async_dispatcher_connect", lambda hass, signal, target: lambda: None)
+    monkeypatch.setattr(calendar_module, "async_track_point_in_time", lambda hass, action, point: lambda: None)
+
+    async def added(self):
+        pass
+
+    monkeypatch.setattr(calendar_module.CalendarEntity, "async_added_to_hass", added)
+    today = Date.today()
+    yesterday = (today - timedelta(days=1)).isoformat()
+    menu = UCTestMenu(asyncExecutor=None, url="uc://synthetic")
+    menu._mergeMenu(generateMenu(today, 5, weekends=True))
+    menu.last_menu_fetch = datetime.now()
+
+    stored = {"strings": ["Gammal"], "days": [[yesterday, 0]]}
+    hass = make_hass()
+    calendar = make_calendar(hass, {}, menu, stored=stored)
+    source = hass.data[DATA_SOURCE_HISTORY]["hash"]
+    scheduled = []
+    calendar.async_on_remove = lambda func: None
+    calendar.async_schedule_update_ha_state = lambda force_refresh=False: scheduled.append(force_refresh)
+
+    async def add():
+        # update_before_add, then added to hass and the scheduled update
+        await calendar.async_update()
+        # nothing acquired or saved before the history is loaded
+        assert calendar._source is None and source._users == 0
+        assert calendar._store.saves == 0 and source._store.saves == 0
+        await calendar.async_added_to_hass()
+        assert scheduled == [True]
+        await calendar.async_update()
+
+    asyncio.run(add())
+    assert calendar._events[0].event.summary == "Gammal"
+    assert calendar._events[0].event.start == Date.fromisoformat(yesterday)
+    assert [row[0] for row in calendar._store.data["days"]] == [yesterday, today.isoformat()]
+
+
+def test_source_load_keeps_newer_days():
+    hass = make_hass()
+    source = SourceHistory.acquire(hass, "hash")
+    source._store = FakeStore({"strings": ["Gammal", "Ny"], "days": [["2026-02-02", 0], ["2026-02-03", 1]]})
+    source.set("2026-02-02", "Nyare")
+    asyncio.run(source.async_load())
+    assert list(source.menus.items()) == [("2026-02-02", "Nyare"), ("2026-02-03", "Ny")]
+
+
+class KeyedStores:
+    # stands in for Store, one FakeStore per key that counts loads
+    def __init__(self):
+        self.stores: dict[str, FakeStore] = {}
+        self.loads: list[str] = []
+
+    def __call__(self, hass, version, key):
+        store = self.stores.setdefault(key, FakeStore())
+        stores = self
+
+        class Keyed:
+            async def async_load(self):
+                stores.loads.append(key)
+                return store.data
+
+            async def async_save(self, data):
+                await store.async_save(data)
+
+            async def async_remove(self):
+                stores.stores.pop(key, None)
+
+        return Keyed()
+
+
+def test_archive_loads_only_requested_months(monkeypatch):
+    stores = KeyedStores()
+    monkeypatch.setattr(history_module, "Store", stores)
+    archive = MenuArchive(make_hass(), "entry", cache_size=2)
+    days = [((Date(2025, 1, 1) + timedelta(days=i)).isoformat(), f"Dag {i % 7}", f"• Dag {i % 7}") for i in range(120)]
+    asyncio.run(archive.async_add(days))
+    assert stores.stores["skolmat_entry_archive"].data == {"months": ["2025-01", "2025-02", "2025-03", "2025-04"]}
+
+    # a fresh archive reads the index and just the covering segments
+    stores.loads.clear()
+    archive = MenuArchive(make_hass(), "entry", cache_size=2)
+    got = asyncio.run(archive.async_get_range("2025-02-27", "2025-03-02"))
+    assert [d for d, _, _ in got] == ["2025-02-27", "2025-02-28", "2025-03-01"]
+    assert got[0] == days[57]
+    assert stores.loads == ["skolmat_entry_archive", "skolmat_entry_archive_2025-02", "skolmat_entry_archive_2025-03"]
+
+    # cached months are not reloaded, the least recently used one is evicted
+    asyncio.run(archive.async_get_range("2025-03-10", "2025-03-11"))
+    asyncio.run(archive.async_get_range("2025-04-10", "2025-04-11"))
+    assert list(archive._cache) == ["2025-03", "2025-04"]
+    assert stores.loads.count("skolmat_entry_archive_2025-03") == 1
+
+    asyncio.run(archive.async_prune("2025-03-15"))
+    assert "skolmat_entry_archive_2025-02" not in stores.stores
+    assert "skolmat_entry_archive_2025-03" in stores.stores
+    assert asyncio.run(archive.async_get_range("2025-01-01", "2025-03-02")) == [days[59]]
+
+
+def test_calendar_archives_days_leaving_history(monkeypatch):
+    monkeypatch.setattr(calendar_module, "async_get_clientsession", lambda hass: None)
+    stores = KeyedStores()
+    monkeypatch.setattr(history_module, "Store", stores)
+    hass = make_hass()
+    today = Date.today()
+    menu = UCTestMenu(asyncExecutor=None, url="uc://synthetic")
+    menu._mergeMenu(generateMenu(today, 5, weekends=True))
+    menu.last_menu_fetch = datetime.now()
+
+    old = today - timedelta(days=CALENDAR_HISTORY_DAYS + 3)
+    stored = {"events": [{"date": old.isoformat(), "course": "Gammal", "menu": "• Gammal"}]}
+    calendar = make_calendar(hass, {"archive_years": 2}, menu, entry_id="a", stored=stored)
+    asyncio.run(calendar._async_load_history())
+    asyncio.run(calendar.async_update())
+    assert old.isoformat() not in calendar._history
+
+    def events(start: Date, end: Date):
+        start_dt = calendar_module.dt_util.start_of_local_day(start)
+        end_dt = calendar_module.dt_util.start_of_local_day(end)
+        return asyncio.run(calendar.async_get_events(hass, start_dt, end_dt))
+
+    # recent ranges never touch the archive
+    stores.loads.clear()
+    assert events(today - timedelta(days=7), today + timedelta(days=1))
+    assert stores.loads == []
+
+    archived = events(old - timedelta(days=1), old + timedelta(days=2))
+    assert [(e.summary, e.description, e.start) for e in archived] == [("Gammal", "• Gammal", old)]
@@ -0,0 +1,110 @@
+from tests.helpers import bootstrap  # noqa: F401
+import asyncio
+import json
+from datetime import date as Date, timedelta
+
+import menu as menu_module
+from menu import Menu, MenuHorizon
+from tests.helpers.http import FakeResponse, FakeSession
+
+
+class FakeDate(Date):
+    current = Date(2026, 2, 4)  # Wednesday
+
+    @classmethod
+    def today(cls):
+        return cls.current
+
+
+def test_horizon_weekday_and_weekend(monkeypatch):
+    monkeypatch.setattr(menu_module, "date", FakeDate)
+    menu = Menu.createMenu(asyncExecutor=None, url="https://menugo.se/m/0381/Gansta_forskola")
+
+    assert menu.horizon == MenuHorizon(Date(2026, 2, 2), Date(2026, 2, 15))
+    assert menu.horizon.isoWeeks() == [(2026, 6), (2026, 7)]
+
+    monkeypatch.setattr(FakeDate, "current", Date(2026, 2, 7))  # Saturday
+    assert menu.horizon == MenuHorizon(Date(2026, 2, 9), Date(2026, 2, 22))
+    assert menu.horizon.covers(Date(2026, 2, 22))
+    assert not menu.horizon.covers(Date(2026, 2, 8))
+
+
+def test_entries_outside_horizon_are_never_processed(monkeypatch):
+    monkeypatch.setattr(menu_module, "date", FakeDate)
+    processed = []
+
+    def processor(entryDate, order, raw_entry):
+        processed.append(entryDate.isoformat())
+
+    menu = Menu.createMenu(asyncExecutor=None, url="https://menugo.se/m/0381/Gansta_forskola",
+                           customMenuEntryProcessorCB=processor)
+    days = [
+        {"Datum": f"2026-{d}T00:00:00", "Maträtt": [{"Namn": f"Rätt {d}", "Matgrupp": []}]}
+        for d in ("01-30", "02-02", "02-13", "02-16")
+    ]
+    body = json.dumps({"CacheObjekt": {"DatumObjekt": days}}, ensure_ascii=False)
+    data = asyncio.run(menu.getMenu(FakeSession(lambda url: FakeResponse(body))))
+
+    assert sorted(data) == ["2026-02-02", "2026-02-13"]
+    assert processed == ["2026-02-02", "2026-02-13"]
+
+
+class SlowResponse(FakeResponse):
+    inFlight = 0
+    maxInFlight = 0
+
+    async def __aenter__(self):
+        SlowResponse.inFlight += 1
+        SlowResponse.maxInFlight = max(SlowResponse.maxInFlight, SlowResponse.inFlight)
+        await asyncio.sleep(0.01)
+        SlowResponse.inFlight -= 1
+        return self
+
+
+def test_week_requests_run_concurrently(monkeypatch):
+    monkeypatch.setattr(menu_module, "date", FakeDate)
+    monkeypatch.setattr(SlowResponse, "maxInFlight", 0)
+    menu = Menu.createMenu(asyncExecutor=None, url="https://skolmaten.se/skutehagens-skolan")
+    menu.setWeeks(4)
+
+    def handler(url):
+        return SlowResponse(json.dumps({"WeekState": {"Days": []}}))
+
+    session = FakeSession(handler)
+    assert asyncio.run(menu.getMenu(session)) == {}
+    assert [url.split("?")[1] for url, _ in session.calls] == [
+        "year=2026&week=6", "year=2026&week=7", "year=2026&week=8", "year=2026&week=9"
+    ]
+    assert SlowResponse.maxInFlight == 4
+    assert menu.horizon.end == Date(2026, 3, 1)
+
+
+def matildaPage(monday: Date) -> str:
+    meals = [
+        {"date": f"{monday + timedelta(days=d)}T00:00:00", "name": "Lunch",
+         "courses": [{"name": f"Rätt {monday + timedelta(days=d)}", "optionName": None}]}
+        for d in range(5)
+    ]
+    nextURL = f"/meals/week/skolan?startDate={monday + timedelta(days=7)}"
+    data = {"props": {"pageProps": {"meals": meals, "nextURL": nextURL}}}
+    return f'<script id="__NEXT_DATA__" type="application/json">{json.dumps(data, ensure_ascii=False)}</script>'
+
+
+def test_matilda_skips_the_current_week_on_weekends(monkeypatch):
+    monkeypatch.setattr(menu_module, "date", FakeDate)
+    monkeypatch.setattr(FakeDate, "current", Date(2026, 2, 7))  # Saturday
+    menu = Menu.createMenu(asyncExecutor=None, url="https://menu.matildaplatform.com/meals/week/skolan")
+
+    def handler(url):
+        # the page without a start date is the current week
+        monday = Date.fromisoformat(url.split("startDate=")[1]) if "startDate=" in url else Date(2026, 2, 2)
+        return FakeResponse(matildaPage(monday), content_type="text/html")
+
+    session = FakeSession(handler)
+    data = asyncio.run(menu.getMenu(session))
+
+    # both weeks of the horizon are fetched, the current week's page is passed over
+    assert [url.split("?")[-1] for url, _ in session.calls] == [
+        "https://menu.matildaplatform.com/meals/week/skolan", "startDate=2026-02-09", "startDate=2026-02-16"
+    ]
+    assert min(data) == "2026-02-09" and max(data) == "2026-02-20"
@@ -0,0 +1,63 @@
+from tests.helpers import bootstrap  # noqa: F401
+import asyncio
+import json
+from types import SimpleNamespace
+
+import custom_components.skolmat as integration
+from custom_components.skolmat.const import MENU_REFRESH_INTERVAL, SIGNAL_MENU_UPDATED
+from menu import Menu
+from tests.helpers.http import FakeResponse, FakeSession
+
+
+class FakeEntry:
+    entry_id = "entry"
+
+    def __init__(self):
+        self.unloads = []
+
+    def async_on_unload(self, unsub):
+        self.unloads.append(unsub)
+
+
+def test_refresh_signals_only_on_change(monkeypatch):
+    menu = Menu.createMenu(asyncExecutor=None, url="https://menugo.se/m/0381/Gansta_forskola")
+    start = menu.horizon.start.isoformat()
+    bodies = [json.dumps({"CacheObjekt": {"DatumObjekt": [
+        {"Datum": f"{start}T00:00:00", "Maträtt": [{"Namn": "Fisk", "Matgrupp": []}]}
+    ]}})]
+    session = FakeSession(lambda url: FakeResponse(bodies[-1]))
+
+    tracked = {}
+    sent = []
+    monkeypatch.setattr(integration, "async_get_clientsession", lambda hass: session)
+    monkeypatch.setattr(integration, "async_dispatcher_send", lambda hass, signal: sent.append(signal))
+    monkeypatch.setattr(integration, "async_track_time_interval",
+                        lambda hass, action, interval: tracked.setdefault("interval", (action, interval)) and "unsub1")
+    monkeypatch.setattr(integration, "async_track_time_change",
+                        lambda hass, action, **at: tracked.setdefault("midnight", (action, at)) and "unsub2")
+
+    entry = FakeEntry()
+    integration._async_setup_refresh(SimpleNamespace(), entry, menu)
+    assert entry.unloads == ["unsub1", "unsub2"]
+
+    refresh, interval = tracked["interval"]
+    assert interval == MENU_REFRESH_INTERVAL
+    signal = SIGNAL_MENU_UPDATED.format("entry")
+
+    asyncio.run(refresh())
+    assert sent == [signal]
+
+    # cached and unchanged menu: no signal
+    asyncio.run(refresh())
+    assert sent == [signal]
+
+    # changed content after a refetch signals again
+    bodies.append(bodies[0].replace("Fisk", "Soppa"))
+    menu.last_menu_fetch = None
+    asyncio.run(refresh())
+    assert sent == [signal, signal]
+
+    midnight, at = tracked["midnight"]
+    assert at == {"hour": 0, "minute": 0, "second": 0}
+    midnight(None)
+    assert len(sent) == 3
@@ -0,0 +1,51 @@
+from tests.helpers import bootstrap  # noqa: F401
+import asyncio
+import os
+import sys
+
+from custom_components.skolmat import processorloader
+from custom_components.skolmat.processorloader import async_load_processor
+
+
+class FakeHass:
+    def __init__(self):
+        self.jobs = 0
+
+    async def async_add_executor_job(self, target, *args):
+        self.jobs += 1
+        return target(*args)
+
+
+def test_processor_module_cached_until_file_changes(tmp_path, monkeypatch):
+    monkeypatch.setattr(processorloader, "PROCESSORS_DIR", tmp_path)
+    path = tmp_path / "throwaway.py"
+    path.write_text("VERSION = 1\n")
+
+    first = processorloader._import_processor_module(path)
+    assert first.VERSION == 1
+    assert processorloader._import_processor_module(path) is first
+
+    stat = path.stat()
+    path.write_text("VERSION = 2\n")
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    reloaded = processorloader._import_processor_module(path)
+    assert reloaded is not first and reloaded.VERSION == 2
+    assert processorloader._import_processor_module(path) is reloaded
+
+    # async_load_processor resolves names in PROCESSORS_DIR too
+    assert asyncio.run(async_load_processor(FakeHass(), "throwaway", "missing")) == (None, "processor_fn_missing")
+    processorloader._MODULE_CACHE.pop(str(path), None)
+    sys.modules.pop("custom_components.skolmat.processors.throwaway", None)
+
+
+def test_async_load_processor_errors_and_success():
+    hass = FakeHass()
+
+    assert asyncio.run(async_load_processor(hass, None, None)) == (None, None)
+    assert asyncio.run(async_load_processor(hass, "karlskoga_aldreomsorg", None)) == (None, "processor_missing_fields")
+    assert asyncio.run(async_load_processor(hass, "does_not_exist", "fn")) == (None, "processor_file_missing")
+    assert asyncio.run(async_load_processor(hass, "karlskoga_aldreomsorg", "nope")) == (None, "processor_fn_missing")
+
+    processor, error = asyncio.run(async_load_processor(hass, "karlskoga_aldreomsorg.py", "entryProcessor"))
+    assert error is None
+    assert callable(processor)
@@ -0,0 +1,60 @@
+from tests.helpers import bootstrap  # noqa: F401
+from datetime import date as Date
+
+from menu import MatildaMenu, batchProcessor
+from processors.karlskoga_aldreomsorg import dayProcessor, entryProcessor
+
+URL = "https://menu.matildaplatform.com/meals/week/67b816e201a159adbb065685_aldreomsorg-matsedel"
+DAY = Date(2026, 2, 2)
+
+RAW_DAY = [
+    {"mealName": "Lunch", "name": "Kålpudding, sås, (potatis)", "optionName": ""},
+    {"mealName": "Fiskalternativ", "name": "Fiskgryta, (potatis), grönsaker", "optionName": ""},
+    {"mealName": "Dessert", "name": "Tårta", "optionName": ""},
+    {"mealName": "Kvällsmat", "name": "Smörgås", "optionName": ""},
+]
+ORDERS = [1, 1, 1, 1]
+
+
+def test_entry_processor_still_supported():
+    menu = MatildaMenu(asyncExecutor=None, url=URL, customMenuEntryProcessorCB=entryProcessor)
+
+    entries = menu._processDayEntries(DAY, RAW_DAY, ORDERS)
+
+    assert [e["meal"] for e in entries] == ["Lunch", "Lunch", "Lunch", "Kvällsmat"]
+    assert [e["order"] for e in entries] == [1, 1, 1, 1]
+    assert menu.menuProcessorSuccessful
+
+
+def test_batch_processor_sees_whole_day():
+    menu = MatildaMenu(asyncExecutor=None, url=URL, customMenuEntryProcessorCB=dayProcessor)
+
+    entries = menu._processDayEntries(DAY, RAW_DAY, ORDERS)
+
+    assert [e["meal"] for e in entries] == ["Lunch", "Lunch", "Lunch", "Kvällsmat"]
+    assert [e["label"] for e in entries[1:3]] == ["Fiskalternativ", "Dessert"]
+    assert [e["order"] for e in entries] == [1, 2, 3, 1]
+    assert menu.menuProcessorSuccessful
+
+
+def test_batch_processor_none_and_failure_fall_back():
+    calls = []
+
+    @batchProcessor
+    def partial(entryDate, raw_entries):
+        calls.append(len(raw_entries))
+        return [None] * len(raw_entries)
+
+    menu = MatildaMenu(asyncExecutor=None, url=URL, customMenuEntryProcessorCB=partial)
+    entries = menu._processDayEntries(DAY, RAW_DAY, ORDERS)
+    assert calls == [4]
+    assert [e["meal"] for e in entries] == ["Lunch", "Fiskalternativ", "Dessert", "Kvällsmat"]
+
+    @batchProcessor
+    def broken(entryDate, raw_entries):
+        return []
+
+    menu = MatildaMenu(asyncExecutor=None, url=URL, customMenuEntryProcessorCB=broken)
+    entries = menu._processDayEntries(DAY, RAW_DAY, ORDERS)
+    assert [e["dish"] for e in entries][0] == "Kålpudding, sås, (potatis)"
+    assert not menu.menuProcessorSuccessful
@@ -0,0 +1,34 @@
+from tests.helpers import bootstrap  # noqa: F401
+import json
+import subprocess
+import sys
+
+from fixtures.providers import PROVIDERS as PROVIDER_FIXTURES
+from menu import Menu
+from tests.helpers.bootstrap import ROOT
+from custom_components.skolmat.providers import PROVIDERS, getProviderClassByName
+
+
+def test_registry_keys_match_provider_classes():
+    for provider, _, class_name in PROVIDERS:
+        assert getProviderClassByName(class_name).provider == provider
+
+
+def test_create_menu_resolves_all_fixture_urls():
+    for name, conf in PROVIDER_FIXTURES.items():
+        menu = Menu.createMenu(asyncExecutor=None, url=conf["url"])
+        assert menu.provider in conf["url"], name
+
+
+def test_json_provider_does_not_import_parser_libraries():
+    code = (
+        "import json, sys\n"
+        f"sys.path.insert(0, {ROOT!r})\n"
+        "from custom_components.skolmat.menu import Menu\n"
+        "Menu.createMenu(None, 'https://meny.mateo.se/molndal/29')\n"
+        "Menu.createMenu(None, 'https://skolmaten.se/skutehagens-skolan')\n"
+        "Menu.createMenu(None, 'https://menugo.se/m/0381/Gansta_forskola')\n"
+        "print(json.dumps([m for m in ('feedparser', 'bs4', 'dateutil') if m in sys.modules]))\n"
+    )
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert json.loads(out.stdout.strip().splitlines()[-1]) == []
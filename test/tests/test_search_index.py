@@ -0,0 +1,77 @@
+from tests.helpers import bootstrap  # noqa: F401
+from datetime import date as Date
+from types import SimpleNamespace
+
+from custom_components.skolmat import services
+from custom_components.skolmat.const import DOMAIN
+from custom_components.skolmat.history import SourceHistory
+from custom_components.skolmat.searchindex import SearchIndex
+from menu import Menu
+from tests.helpers.hass import make_hass
+
+
+def entry(dish: str, label: str | None = None) -> dict:
+    return {"meal": "Lunch", "dish": dish, "label": label, "order": 1}
+
+
+def createMenu(days: dict[str, list[dict]]) -> Menu:
+    menu = Menu.createMenu(asyncExecutor=None, url="https://meny.mateo.se/molndal/29")
+    menu._mergeMenu(days)
+    return menu
+
+
+def test_index_matches_word_prefixes_across_texts():
+    index = SearchIndex()
+    index.setDay("2026-02-02", ["Pannkakor med sylt", "Vegetarisk: Ärtsoppa"])
+    index.setDay("2026-02-03", ["Fiskgratäng med potatis"])
+
+    assert index.search("pannkak") == {"2026-02-02": ["Pannkakor med sylt"]}
+    assert index.search("ÄRTSOPPA") == {"2026-02-02": ["Vegetarisk: Ärtsoppa"]}
+    assert index.search("med") == {"2026-02-02": ["Pannkakor med sylt"], "2026-02-03": ["Fiskgratäng med potatis"]}
+    # all words must be in one text
+    assert index.search("sylt ärtsoppa") == {}
+    assert index.search("med", start="2026-02-03") == {"2026-02-03": ["Fiskgratäng med potatis"]}
+    assert index.search(" ,") == {}
+
+    index.setDay("2026-02-02", ["Korv"])
+    assert index.search("pannkakor") == {}
+    index.prune("2026-02-03")
+    assert "2026-02-02" not in index and index.search("korv") == {}
+    assert index._tokenDays.keys() == {"fiskgratäng", "med", "potatis"}
+
+
+def test_menu_index_follows_merges():
+    menu = createMenu({"2026-02-02": [entry("Pannkakor")], "2026-02-03": [entry("Soppa", "Vegetarisk")]})
+    assert menu.searchDishes("vegetarisk") == {"2026-02-03": ["Vegetarisk: Soppa"]}
+
+    menu._mergeMenu({"2026-02-03": [entry("Pannkakor med sylt")], "2026-02-04": [entry("Fisk")]})
+    assert menu.searchDishes("pannkakor") == {"2026-02-03": ["Pannkakor med sylt"]}
+    assert menu.searchDishes("pannkakor", end=Date(2026, 2, 2)) == {}
+
+    # a menu replaced outside a merge is reindexed on the next search
+    menu._menu = {"2026-02-05": [entry("Pannkakor")]}
+    assert list(menu.searchDishes("pannkakor")) == ["2026-02-05"]
+
+
+def test_search_service_combines_menu_and_history():
+    hass = make_hass()
+    source = SourceHistory.acquire(hass, "hash")
+    source.set("2026-01-20", "[Lunch]\n• Pannkakor med sylt")
+    source.set("2026-01-21", "[Lunch]\n• Fisk")
+    source.set("2026-02-02", "[Lunch]\n• Pannkakor")  # still in the menu, which changed it
+    source.prune("2026-01-21")
+    source.set("2026-01-22", "[Lunch]\n• Vegetarisk: Pannkakor")
+    assert source.search("lunch") == {}  # meal headers are not dishes
+
+    menu = createMenu({"2026-02-02": [entry("Korv")], "2026-02-03": [entry("Pannkakor")]})
+    hass.data[DOMAIN] = {"entry": {"menu": menu, "url_hash": "hash"}}
+    config_entry = SimpleNamespace(title="Skolan", data={})
+    hass.config_entries = SimpleNamespace(async_get_entry=lambda entry_id: config_entry)
+
+    response = services.search(hass, "pannkakor", services._resolve_entry_ids(hass, None))
+    assert [(r["date"], r["source"], r["dishes"]) for r in response["results"]] == [
+        ("2026-01-22", "history", ["Vegetarisk: Pannkakor"]),
+        ("2026-02-03", "menu", ["Pannkakor"]),
+    ]
+    assert response["results"][0]["name"] == "Skolan"
+    assert services.search(hass, "pannkakor", ["entry"], start=Date(2026, 2, 1))["results"][0]["date"] == "2026-02-03"
@@ -0,0 +1,69 @@
+from tests.helpers import bootstrap  # noqa: F401
+import asyncio
+from datetime import date as Date, datetime
+from types import SimpleNamespace
+
+from custom_components.skolmat import sensor as sensor_module
+from custom_components.skolmat.sensor import SkolmatSensor
+from fixtures.synthetic import generateMenu
+from tests.helpers.hass import make_hass
+from tests.helpers.test_helpers import UCTestMenu
+
+
+def createSensor(monkeypatch, last_state: str):
+    # a sensor past update_before_add, whose restart finds last_state from the previous run
+    monkeypatch.setattr(sensor_module, "async_get_clientsession", lambda hass: None)
+    listeners = []
+    monkeypatch.setattr(sensor_module, "async_dispatcher_connect",
+                        lambda hass, signal, target: listeners.append(target) or (lambda: None))
+
+    async def added(self):
+        pass
+
+    monkeypatch.setattr(sensor_module.RestoreEntity, "async_added_to_hass", added)
+
+    menu = UCTestMenu(asyncExecutor=None, url="uc://synthetic")
+    menu._mergeMenu(generateMenu(Date.today(), 5, weekends=True))
+    menu.last_menu_fetch = datetime.now()
+    entry = SimpleNamespace(entry_id="entry", data={"name": "Skolan", "url": "uc://synthetic"})
+    sensor = SkolmatSensor(make_hass(), entry, menu, "hash")
+
+    async def last():
+        return SimpleNamespace(state=last_state, attributes={"calendar": {"2020-01-01": []}})
+
+    scheduled = []
+    sensor.async_get_last_state = last
+    sensor.async_schedule_update_ha_state = lambda force_refresh=False: scheduled.append(force_refresh)
+    return sensor, menu, listeners, scheduled
+
+
+def test_restore_does_not_replace_a_fresh_state(monkeypatch):
+    sensor, menu, listeners, scheduled = createSensor(monkeypatch, "Gårdagens lunch")
+    asyncio.run(sensor.async_update())
+    fresh = sensor.native_value
+    asyncio.run(sensor.async_added_to_hass())
+
+    assert sensor.native_value == fresh == menu.getReadableTodaySummary()
+    assert "2020-01-01" not in sensor.extra_state_attributes["calendar"]
+    assert scheduled == [True]
+
+
+def test_restored_state_is_recomputed_on_the_next_update(monkeypatch):
+    sensor, menu, listeners, scheduled = createSensor(monkeypatch, "Gårdagens lunch")
+    cached = menu.getMenu
+
+    async def unavailable(session):
+        return None
+
+    # the menu could not be read before add, the previous run's state is shown until the update
+    menu.getMenu = unavailable
+    asyncio.run(sensor.async_update())
+    asyncio.run(sensor.async_added_to_hass())
+    assert sensor.native_value == "Gårdagens lunch"
+    assert scheduled == [True]
+
+    menu.getMenu = cached
+    listeners[0]()  # menu signal
+    asyncio.run(sensor.async_update())
+    assert sensor.native_value == menu.getReadableTodaySummary()
+    assert "2020-01-01" not in sensor.extra_state_attributes["calendar"]
@@ -0,0 +1,84 @@
+from tests.helpers import bootstrap  # noqa: F401
+import asyncio
+from datetime import date as Date, datetime, timedelta
+
+import pytest
+
+from custom_components.skolmat import calendar as calendar_module
+from custom_components.skolmat.dayfilter import DayFilter
+from fixtures.synthetic import HOLIDAY_EVERY, SHAPES, generateMenu, generateSchools
+from tests.helpers.hass import make_calendar, make_hass
+from tests.helpers.test_helpers import UCTestMenu
+
+# one school year of weekdays, roughly 20x what a two week horizon holds
+DAYS = 200
+START = Date(2026, 8, 17)  # Monday
+
+
+def createMenu(menu_data: dict) -> UCTestMenu:
+    menu = UCTestMenu(asyncExecutor=None, url="uc://synthetic")
+    menu._menu = menu_data
+    menu.last_menu_fetch = datetime.now()
+    return menu
+
+
+def test_generator_is_deterministic_and_sized():
+    first = generateSchools(5, START, DAYS, meals=2, alternatives=3)
+    second = generateSchools(5, START, DAYS, meals=2, alternatives=3)
+    assert first == second
+
+    for menu in first.values():
+        assert len(menu) == DAYS
+        assert all(Date.fromisoformat(d).weekday() < 5 for d in menu)
+        holidays = [entries for entries in menu.values() if len(entries) == 1]
+        assert len(holidays) == DAYS // HOLIDAY_EVERY
+        assert all(e["meal"] is None for (e,) in holidays)
+
+    # schools rotate their menus, so distinct day contents stay bounded
+    distinct = {tuple(e["dish"] for e in entries) for entries in first["School 1"].values()}
+    assert len(distinct) <= 20 + len(holidays)
+
+
+@pytest.mark.parametrize("shape", SHAPES)
+def test_filter_many_matches_per_day_at_scale(shape):
+    menu = generateMenu(START, DAYS, shape=shape, meals=3, alternatives=4)
+    for filters in (
+        {"meals_selected": ["Lunch"], "exclude_regex": ["fisk", "korv"], "prefer_regex": ["veg", "kyckling"]},
+        {"exclude_regex": [".*"], "max_entries": 2},
+    ):
+        day_filter = DayFilter(filters)
+        batch = day_filter.filter_many(menu)
+        assert batch["days"] == {d: day_filter.filter(entries) for d, entries in menu.items()}
+        assert batch["fallbacks"]  # holidays never match the meal focus or survive ".*"
+
+
+def test_summaries_and_discovery_at_scale():
+    menu = createMenu(generateMenu(START, DAYS, shape="UC-C", meals=2, alternatives=5))
+    menu.setSummaryFilters({"meals_selected": ["Lunch"], "prefer_regex": ["veg"], "max_entries": 1})
+
+    days = [Date.fromisoformat(d) for d in menu._menu]
+    summaries = menu.getReadableDaySummaries(days)
+    assert len(summaries) == DAYS
+    assert all(summaries.values())
+
+    found = menu.getSummaryFilterKeywords(START)
+    assert found["meals"] == ["Lunch", "Middag"]
+    assert found["labels"] == ["Husman", "Vegetariskt", "Dagens", "Fisk", "Glutenfri"]
+
+
+def test_calendar_builds_every_day_at_scale(monkeypatch):
+    # the menu is cached, getMenu never touches the session
+    monkeypatch.setattr(calendar_module, "async_get_clientsession", lambda hass: None)
+    today = Date.today()
+    menu = createMenu(generateMenu(today, DAYS, shape="UC-A", meals=2, alternatives=4))
+    calendar = make_calendar(make_hass(), {"lunch_begin": "11:00", "lunch_end": "12:00"}, menu)
+
+    asyncio.run(calendar.async_update())
+    assert len(calendar._events) == DAYS
+    assert calendar._starts == sorted(calendar._starts)
+
+    # a new day rebuilds, unchanged days reuse their cached events
+    first = list(calendar._events)
+    calendar._events_date = today - timedelta(days=1)
+    asyncio.run(calendar.async_update())
+    assert all(a is b for a, b in zip(first, calendar._events))
@@ -0,0 +1,78 @@
+from tests.helpers import bootstrap  # noqa: F401
+from datetime import date as Date
+from types import SimpleNamespace
+
+from custom_components.skolmat import websocket_api as ws
+from custom_components.skolmat.const import DOMAIN
+from menu import Menu
+
+
+def entry(dish: str, order: int = 1) -> dict:
+    return {"meal": "Lunch", "dish": dish, "label": None, "order": order}
+
+
+def createMenu() -> Menu:
+    menu = Menu.createMenu(asyncExecutor=None, url="https://meny.mateo.se/molndal/29")
+    menu._mergeMenu({
+        "2026-02-06": [entry("Fisk")],
+        "2026-02-09": [entry("Soppa")],
+        "2026-02-10": [entry("Pasta")],
+    })
+    return menu
+
+
+class FakeConnection:
+    def __init__(self):
+        self.subscriptions = {}
+        self.results = []
+        self.events = []
+
+    def send_result(self, msg_id, result=None):
+        self.results.append((msg_id, result))
+
+    def send_message(self, message):
+        self.events.append(message["event"])
+
+    def send_error(self, msg_id, code, message):
+        self.results.append((msg_id, code))
+
+
+def test_menu_payload_range_and_week_grouping():
+    menu = createMenu()
+    payload = ws.menu_payload(menu, Date(2026, 2, 9), None)
+    assert list(payload["days"]) == ["2026-02-09", "2026-02-10"]
+    assert payload["days"]["2026-02-09"]["digest"] == menu.getDayDigest("2026-02-09")
+
+    grouped = ws.menu_payload(menu, None, None, group_by_week=True)
+    assert [(w["year"], w["week"], list(w["days"])) for w in grouped["weeks"]] == [
+        (2026, 6, ["2026-02-06"]),
+        (2026, 7, ["2026-02-09", "2026-02-10"]),
+    ]
+
+
+def test_subscription_pushes_only_changed_days(monkeypatch):
+    menu = createMenu()
+    listeners = []
+    hass = SimpleNamespace(data={DOMAIN: {"entry": {"menu": menu}}})
+    monkeypatch.setattr(ws, "_resolve_entry_id", lambda hass, entity_id: "entry")
+    monkeypatch.setattr(ws, "async_dispatcher_connect",
+                        lambda hass, signal, target: listeners.append(target) or (lambda: None))
+
+    connection = FakeConnection()
+    known = {"2026-02-09": menu.getDayDigest("2026-02-09")}
+    msg = {"id": 5, "entity_id": "sensor.skolan", "start": Date(2026, 2, 9), "digests": known}
+    ws.ws_subscribe_menu(hass, connection, msg)
+
+    assert connection.results == [(5, None)]
+    assert 5 in connection.subscriptions
+    # the client already had 2026-02-09, 2026-02-06 is outside the range
+    assert list(connection.events[0]["changed"]) == ["2026-02-10"]
+
+    menu._mergeMenu({"2026-02-06": [entry("Fisk")], "2026-02-09": [entry("Gryta")]})
+    listeners[0]()
+    assert list(connection.events[1]["changed"]) == ["2026-02-09"]
+    assert connection.events[1]["removed"] == ["2026-02-10"]
+
+    # a signal without content changes pushes nothing
+    listeners[0]()
+    assert len(connection.events) == 2